@@ -0,0 +1,107 @@
+"""Measure the import cost of pydobe using ``python -X importtime``
+
+Usage:
+    python benchmarks/import_time.py [--runs 5] [--statement "import pydobe"] [--output results.json]
+
+Each run happens in a fresh interpreter. The median cumulative time of every pydobe module
+(and of the heaviest third party modules pulled in) is written as JSON, along with the total
+import time on top of a bare interpreter start-up.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import pydobe",
+    "import pydobe.core",
+    "from pydobe.after_effects.objects import ae_objects",
+]
+
+
+def parse_import_time(stderr: str) -> tuple:
+    """Return the cumulative import time in microseconds of every module listed by -X importtime,
+    along with the names of the modules imported directly by the statement"""
+    timings = {}
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        name = module.strip()
+        timings[name] = int(cumulative)
+        if len(module) - len(module.lstrip()) == 1:
+            top_level.append(name)
+    return timings, top_level
+
+
+def measure(statement: str, runs: int, baseline: dict = None) -> dict:
+    samples = []
+    top_level = set()
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode:
+            raise RuntimeError(process.stderr)
+        timings, imported = parse_import_time(process.stderr)
+        samples.append(timings)
+        top_level.update(imported)
+    modules = set().union(*samples)
+    medians = {
+        module: statistics.median(sample.get(module, 0) for sample in samples)
+        for module in modules
+    }
+    baseline = baseline or {}
+    top_level = [module for module in top_level if module not in baseline]
+    third_party = [
+        module
+        for module in medians
+        if module not in baseline and module.split(".")[0] != "pydobe"
+    ]
+    heaviest = sorted(third_party, key=medians.get, reverse=True)[:10]
+    return {
+        "statement": statement,
+        "runs": runs,
+        "total_us": sum(medians[module] for module in top_level),
+        "pydobe_us": {
+            module: medians[module]
+            for module in sorted(medians)
+            if module.split(".")[0] == "pydobe"
+        },
+        "heaviest_us": {module: medians[module] for module in heaviest},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--statement", action="append")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    baseline, _ = parse_import_time(
+        subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "pass"],
+            capture_output=True,
+            text=True,
+        ).stderr
+    )
+    results = [
+        measure(statement, args.runs, baseline)
+        for statement in args.statement or STATEMENTS
+    ]
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Run a pydobe tool against a recording instead of After Effects and report its cost
+
+Record the tool once on a machine running After Effects:
+    PYDOBE_RECORD=tool.jsonl.gz python my_tool.py
+
+Then benchmark the Python side anywhere, deterministically:
+    python benchmarks/replay_tool.py [--repeat 5] [--realtime] tool.jsonl.gz my_tool.py [tool arguments]
+
+The number of requests, the bytes exchanged and the time spent in Python are written as JSON,
+so that a change in request count between two versions of pydobe shows up as a regression.
+"""
+
+import argparse
+import json
+import runpy
+import statistics
+import sys
+
+from pydobe import core
+
+
+def replay(recording: str, tool: str, tool_args: list, realtime: bool) -> dict:
+    transport = core.ReplayTransport(recording, realtime=realtime)
+    sys.argv = [tool] + tool_args
+    with core.use_transport(transport), core.Profiler() as profiler:
+        runpy.run_path(tool, run_name="__main__")
+    summary = profiler.summary()
+    summary["unreplayed_requests"] = transport.remaining
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording")
+    parser.add_argument("tool")
+    parser.add_argument("tool_args", nargs=argparse.REMAINDER)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    runs = [
+        replay(args.recording, args.tool, args.tool_args, args.realtime)
+        for _ in range(args.repeat)
+    ]
+    result = dict(runs[0])
+    for key in ("wall_time", "python_time"):
+        result[key] = statistics.median(run[key] for run in runs)
+    result["runs"] = args.repeat
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
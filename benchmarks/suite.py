@@ -0,0 +1,506 @@
+"""Benchmark the hot paths of pydobe against the fake After Effects panel
+
+Usage:
+    python benchmarks/suite.py [--repeat 5] [--latency 0.002] [--transport http|direct] [--output results.json] [name ...]
+
+Every benchmark runs on a fresh fake After Effects (see pydobe.after_effects.fake), through HTTP by default.
+Timings are per operation, along with the number of requests and bytes each operation costs, written
+as JSON so that results can be compared between releases. Pass benchmark names to run only those.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import pydobe
+from pydobe import core
+from pydobe.after_effects.fake.model import build_project
+from pydobe.after_effects.fake.panel import FakeAfterEffects, FakePanel, FakeTransport
+from pydobe.after_effects.objects.ae_objects import Property
+from pydobe.after_effects.query import attr, each
+from pydobe.after_effects.records import snapshot
+
+BENCHMARKS = {}  # name: (setup function, operations per sample)
+
+
+def benchmark(name: str, operations: int = 1):
+    """Register a benchmark. Its setup function fills the fake project and returns the callable to time"""
+
+    def decorator(function):
+        BENCHMARKS[name] = (function, operations)
+        return function
+
+    return decorator
+
+
+def _comp(project, name="Comp 1"):
+    return project.item_by_name(name)
+
+
+@benchmark("property_get", operations=200)
+def property_get(after_effects):
+    build_project(after_effects.app.project, compositions=1)
+    comp = _comp(pydobe.objects.app.project)
+    return lambda: [comp.width for _ in range(200)]
+
+
+@benchmark("property_set", operations=200)
+def property_set(after_effects):
+    build_project(after_effects.app.project, compositions=1)
+    comp = _comp(pydobe.objects.app.project)
+
+    def run():
+        for index in range(200):
+            comp.width = 1000 + index
+
+    return run
+
+
+@benchmark("transaction_set", operations=200)
+def transaction_set(after_effects):
+    project = pydobe.objects.app.project
+    build_project(after_effects.app.project, compositions=1)
+    comp = _comp(project)
+
+    def run():
+        with project.transaction("Resize"):
+            for index in range(200):
+                comp.width = 1000 + index
+
+    return run
+
+
+@benchmark("transaction_rollback")
+def transaction_rollback(after_effects):
+    """A transaction whose first change fails, which must not undo the step made before it"""
+    build_project(after_effects.app.project, compositions=1)
+    project = pydobe.objects.app.project
+    comp = _comp(project)
+    with project.transaction("Edit made by the user"):
+        comp.width = 1234
+    app = after_effects.app
+
+    def run():
+        try:
+            with project.transaction("Fail"):
+                comp._set_on_object("numLayers", 0)  # read only
+                comp.width = 100
+        except core.TransactionError:
+            pass
+        else:
+            raise RuntimeError("the failed change did not raise TransactionError")
+
+    run()
+    try:
+        with project.transaction("Read"):
+            comp.name
+            raise ValueError
+    except ValueError:
+        pass
+    if comp.width != 1234 or len(app.undo_stack) != 1:
+        raise RuntimeError(
+            "a transaction which applied nothing undid the step before it"
+        )
+    return run
+
+
+@benchmark("loop_set", operations=200)
+def loop_set(after_effects):
+    build_project(
+        after_effects.app.project,
+        footage=10,
+        compositions=1,
+        layers_per_composition=200,
+    )
+    layers = _comp(pydobe.objects.app.project).layers
+    loop = (
+        each(layers)
+        .where(attr("index") % 2 == 0)
+        .set("label", 3)
+        .set("name", attr("name") + "_even")
+    )
+    return lambda: loop.run()
+
+
+@benchmark("item_collection_iteration", operations=500)
+def item_collection_iteration(after_effects):
+    build_project(after_effects.app.project, footage=480, folders=20)
+    items = pydobe.objects.app.project.items
+    return lambda: list(items)
+
+
+@benchmark("item_resolve", operations=500)
+def item_resolve(after_effects):
+    """Registration of 500 lazy items, as iteration gives them, in one request"""
+    build_project(after_effects.app.project, footage=480, folders=20)
+    items = pydobe.objects.app.project.items
+    return lambda: core.resolve(items)
+
+
+@benchmark("item_locate", operations=500)
+def item_locate(after_effects):
+    """Stable addresses of 500 lazy items, as iteration gives them, in one request"""
+    build_project(after_effects.app.project, footage=480, folders=20)
+    items = pydobe.objects.app.project.items
+    return lambda: core.locate(items)
+
+
+@benchmark("layer_collection_iteration", operations=200)
+def layer_collection_iteration(after_effects):
+    build_project(
+        after_effects.app.project,
+        footage=10,
+        compositions=1,
+        layers_per_composition=200,
+    )
+    layers = _comp(pydobe.objects.app.project).layers
+    return lambda: list(layers)
+
+
+@benchmark("item_by_name")
+def item_by_name(after_effects):
+    build_project(after_effects.app.project, footage=499, compositions=1)
+    project = pydobe.objects.app.project
+    return lambda: project.item_by_name("Comp 1")  # the last item
+
+
+@benchmark("import_file", operations=20)
+def import_file(after_effects):
+    project = pydobe.objects.app.project
+
+    def run():
+        for index in range(20):
+            project.import_file(f"/fake/import/plate_{index:04d}.exr")
+
+    return run
+
+
+@benchmark("import_files", operations=20)
+def import_files(after_effects):
+    project = pydobe.objects.app.project
+    paths = [f"/fake/import/plate_{index:04d}.exr" for index in range(20)]
+    return lambda: project.import_files(paths)
+
+
+@benchmark("layers_add", operations=20)
+def layers_add(after_effects):
+    build_project(after_effects.app.project, footage=1, compositions=1)
+    project = pydobe.objects.app.project
+    comp = _comp(project)
+    footage = project.item_by_name("shot_00001_0001.png")
+
+    def run():
+        for _ in range(20):
+            comp.layers.add(footage)
+
+    return run
+
+
+@benchmark("selected_layers")
+def selected_layers(after_effects):
+    build_project(
+        after_effects.app.project,
+        footage=10,
+        compositions=1,
+        layers_per_composition=200,
+        selected_layers=20,
+    )
+    comp = _comp(pydobe.objects.app.project)
+    return lambda: comp.selected_layers
+
+
+@benchmark("selected_layers_located")
+def selected_layers_located(after_effects):
+    """Selected layers of a comp given by item_by_id(), which reaches it through its stable address"""
+    build_project(
+        after_effects.app.project,
+        footage=10,
+        compositions=1,
+        layers_per_composition=200,
+        selected_layers=20,
+    )
+    project = pydobe.objects.app.project
+    comp = project.item_by_id(_comp(project).id)
+    comp.selected = True
+    if len(comp.selected_layers) != 20 or [item.id for item in project.selection] != [
+        comp.id
+    ]:
+        raise RuntimeError(
+            "arrays of objects read from located objects were not returned as lists of them"
+        )
+    return lambda: comp.selected_layers
+
+
+@benchmark("format_array", operations=100000)
+def format_array(after_effects):
+    """Formatting of 100k keyframe values to ExtendScript, no request is sent"""
+    values = [[index / 25, index * 0.5] for index in range(100000)]
+    return lambda: core.format_to_extend(values)
+
+
+def _keyframes_benchmark(count: int):
+    """Read the times and values of a position property with count keyframes, in one request"""
+
+    def setup(after_effects):
+        build_project(
+            after_effects.app.project,
+            footage=1,
+            compositions=1,
+            layers_per_composition=1,
+        )
+        path = "app.project.item(2).layer(1).property('ADBE Transform Group').property('ADBE Position')"
+        after_effects.interpreter.run(path)._keys = [
+            [index / 25, [index * 0.5, index * 0.25]] for index in range(count)
+        ]
+        position = Property(**core.eval_script_returning_object(path))
+        return position.keyframes
+
+    setup.__doc__ = _keyframes_benchmark.__doc__.replace("count", f"{count:,}")
+    return setup
+
+
+for _count, _size in ((10000, "10k"), (100000, "100k"), (1000000, "1m")):
+    benchmark(f"keyframes_{_size}", operations=_count)(_keyframes_benchmark(_count))
+
+
+@benchmark("layer_columns", operations=200)
+def layer_columns(after_effects):
+    """Four attributes of 200 layers in one request, compare with layer_collection_iteration"""
+    build_project(
+        after_effects.app.project,
+        footage=10,
+        compositions=1,
+        layers_per_composition=200,
+    )
+    layers = _comp(pydobe.objects.app.project).layers
+    return lambda: core.get_columns(layers, ["name", "index", "inPoint", "enabled"])
+
+
+@benchmark("item_records", operations=10000)
+def item_records(after_effects):
+    """Three attributes of 10k items streamed as a record per item, decoded as the response arrives"""
+    build_project(after_effects.app.project, footage=10000)
+    items = pydobe.objects.app.project.items
+    return lambda: sum(
+        1 for _ in core.iter_records(items, ["id", "name", "parentFolder.id"])
+    )
+
+
+def _footprint(objects: list) -> float:
+    """Mean bytes held by each of the objects: the object, its attributes and the containers holding its
+    values, counting every object once. tracemalloc would count the fake panel, which runs in this process
+    """
+    seen = set()
+    pending = list(objects)
+    size = 0
+    while pending:
+        value = pending.pop()
+        if id(value) in seen or isinstance(value, type):
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, (list, tuple, set)):
+            pending.extend(value)
+        elif isinstance(value, dict):
+            pending.extend(value)
+            pending.extend(value.values())
+        else:
+            pending.extend(getattr(value, "__dict__", {}).values())
+            for cls in type(value).__mro__:
+                for slot in vars(cls).get("__slots__", ()):
+                    if slot != "__weakref__" and hasattr(value, slot):
+                        pending.append(getattr(value, slot))
+    return size / len(objects)
+
+
+@benchmark("item_snapshot", operations=2000)
+def item_snapshot(after_effects):
+    """Records of three properties of 2k items, look at bytes_per_record and bytes_per_live_object_and_values"""
+    build_project(after_effects.app.project, footage=2000)
+    items = pydobe.objects.app.project.items
+    fields = ["name", "label", "comment"]
+    columns = core.get_columns(items, ["name", "label", "comment"])
+    # what reading the values from live objects would hold
+    rows = list(zip(list(items), *columns.values()))
+    handles = after_effects.handle_count
+    records = snapshot(items, fields)
+    if after_effects.handle_count != handles:
+        raise RuntimeError("the snapshot registered its records in the panel")
+    item_snapshot.extra = {
+        "bytes_per_record": _footprint(records),
+        "bytes_per_live_object": _footprint([row[0] for row in rows]),
+        "bytes_per_live_object_and_values": _footprint(rows),
+    }
+    return lambda: snapshot(items, fields)
+
+
+class _DictWrapper(object):
+    """A mirror object as they were before having __slots__, holding its id and type in a __dict__"""
+
+    def __init__(self, pydobe_id, object_type):
+        self.pydobe_id = pydobe_id
+        self.object_type = object_type
+
+
+@benchmark("wrapper_memory", operations=10000)
+def wrapper_memory(after_effects):
+    """Creation of 10k mirror objects from decoded results, look at bytes_per_wrapper and bytes_per_dict_wrapper"""
+    build_project(after_effects.app.project, footage=10000)
+    members = core.call("members", pydobe.objects.app.project.items.pydobe_id)
+    create = core.create_python_object("FootageItem")
+    wrapper_memory.extra = {
+        "bytes_per_wrapper": _footprint([create(**kwargs) for kwargs in members]),
+        "bytes_per_dict_wrapper": _footprint(
+            [_DictWrapper(**kwargs) for kwargs in members]
+        ),
+    }
+    return lambda: [create(**kwargs) for kwargs in members]
+
+
+@benchmark("handle_growth", operations=500)
+def handle_growth(after_effects):
+    """Latency of a property read as the handle table grows, look at samples_us and handles"""
+    build_project(after_effects.app.project, compositions=1)
+    comp = _comp(pydobe.objects.app.project)
+    return lambda: [comp.layers for _ in range(500)]
+
+
+@benchmark("json_decode")
+def json_decode(after_effects):
+    """Transfer and decoding of a large result, decode_us is the json.loads share of it"""
+    records = [
+        {
+            "id": index,
+            "name": f"shot_{index:05d}",
+            "position": [index, index * 2, 0],
+            "selected": False,
+        }
+        for index in range(20000)
+    ]
+    text = json.dumps(records)
+    after_effects.interpreter.define("largeResult", text)
+    start = time.perf_counter()
+    json.loads(text)
+    json_decode.extra = {
+        "response_bytes": len(text),
+        "decode_us": (time.perf_counter() - start) * 1e6,
+    }
+    return lambda: core.eval_script("largeResult")
+
+
+def _large_result_benchmark(threshold):
+    """Transfer and decoding of a 12 MB result through the response body or a temporary file, http transport only"""
+
+    def setup(after_effects):
+        records = [
+            [index, f"shot_{index:05d}", [index / 25, index * 0.5, 0.0]]
+            for index in range(250000)
+        ]
+        after_effects.interpreter.define("largeResult", json.dumps(records))
+        transport = core.get_transport()
+        if hasattr(transport, "result_file_threshold"):
+            transport.result_file_threshold = threshold
+        return lambda: core.eval_script("largeResult")
+
+    setup.__doc__ = _large_result_benchmark.__doc__
+    return setup
+
+
+benchmark("large_result_body")(_large_result_benchmark(None))
+benchmark("large_result_file")(_large_result_benchmark(1))
+
+
+def run_benchmark(name: str, repeat: int, latency: float, transport: str) -> dict:
+    setup, operations = BENCHMARKS[name]
+    after_effects = FakeAfterEffects(latency=latency, seed=0)
+    panel = FakePanel(after_effects) if transport == "http" else None
+    if panel:
+        panel.start()
+    try:
+        with core.use_transport(
+            panel.transport() if panel else FakeTransport(after_effects)
+        ):
+            run = setup(after_effects)
+            run()  # warm up
+            samples = []
+            with core.Profiler() as profiler:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    run()
+                    samples.append(time.perf_counter() - start)
+    finally:
+        if panel:
+            panel.stop()
+    summary = profiler.summary()
+    count = operations * repeat
+    median = statistics.median(samples) / operations
+    result = {
+        "operations": operations,
+        "repeat": repeat,
+        "per_operation_us": median * 1e6,
+        "min_per_operation_us": min(samples) / operations * 1e6,
+        "operations_per_second": 1 / median if median else None,
+        "requests_per_operation": summary["requests"] / count,
+        "script_bytes_per_operation": summary["script_bytes"] / count,
+        "response_bytes_per_operation": summary["response_bytes"] / count,
+        "python_share": (
+            summary["python_time"] / summary["wall_time"]
+            if summary["wall_time"]
+            else None
+        ),
+        "handles": after_effects.handle_count,
+        "samples_us": [sample / operations * 1e6 for sample in samples],
+    }
+    result.update(getattr(setup, "extra", {}))
+    return result
+
+
+def _pydobe_version():
+    try:
+        from importlib.metadata import version
+
+        return version("pydobe")
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "names", nargs="*", help=f"benchmarks to run, among {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every request"
+    )
+    parser.add_argument("--transport", choices=("http", "direct"), default="http")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    results = {
+        "pydobe": _pydobe_version(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "transport": args.transport,
+        "latency": args.latency,
+        "benchmarks": {
+            name: run_benchmark(name, args.repeat, args.latency, args.transport)
+            for name in args.names or BENCHMARKS
+        },
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
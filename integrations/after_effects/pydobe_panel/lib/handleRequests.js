@@ -1,15 +1,194 @@
 // Launch node server
 function SetupConnection() {
+    var fs = require('fs');
     var http = require('http');
+    var os = require('os');
+    var path = require('path');
+    var url = require('url');
     var hostname = '127.0.0.1';
     var port = 2000;
 
+    // print every script and result, slow with large payloads so off unless PYDOBE_PANEL_VERBOSE is set
+    var verbose = Boolean(process.env.PYDOBE_PANEL_VERBOSE);
+
+    // rolling counters served on GET /stats
+    var LATENCY_SAMPLES = 1000;  // percentiles are computed over the most recent requests
+    var RATE_WINDOW = 60;  // requests per second are averaged over the last minute
+    var stats = {
+        started: Date.now(),
+        requests: 0,
+        errors: 0,
+        bytesIn: 0,
+        bytesOut: 0,
+        latencies: [],  // ExtendScript evaluation time in ms
+        timestamps: [],  // end of the recent requests in ms
+        resultFiles: 0,
+        resultFileBytes: 0,
+        streamedResponses: 0
+    };
+
+    // large results are written to temporary files when pydobe asks for it, pydobe deletes them once read
+    var RESULT_FILE_PREFIX = 'pydobe-result-';
+    var RESULT_FILE_TTL = 10 * 60 * 1000;  // ms after which result files left behind are deleted
+
+    function writeResultFile(text){
+        stats.resultFiles += 1;
+        stats.resultFileBytes += text.length;
+        var name = RESULT_FILE_PREFIX + process.pid + '-' + Date.now() + '-' + stats.resultFiles + '.txt';
+        var filePath = path.join(os.tmpdir(), name);
+        fs.writeFileSync(filePath, text, 'utf8');
+        return filePath;
+    }
+
+    function removeStaleResultFiles(){
+        var now = Date.now();
+        fs.readdir(os.tmpdir(), function(error, names){
+            if(error){return}
+            names.forEach(function(name){
+                if(name.indexOf(RESULT_FILE_PREFIX) !== 0){return}
+                var filePath = path.join(os.tmpdir(), name);
+                fs.stat(filePath, function(error, stat){
+                    if(!error && now - stat.mtime.getTime() > RESULT_FILE_TTL){fs.unlink(filePath, function(){})}
+                });
+            });
+        });
+    }
+
+    removeStaleResultFiles();
+    setInterval(removeStaleResultFiles, RESULT_FILE_TTL);
+
+    function recordRequest(evalMs, bytesIn, bytesOut, failed){
+        var now = Date.now();
+        stats.requests += 1;
+        stats.bytesIn += bytesIn;
+        stats.bytesOut += bytesOut;
+        if(failed){stats.errors += 1}
+        stats.latencies.push(evalMs);
+        if(stats.latencies.length > LATENCY_SAMPLES){stats.latencies.shift()}
+        stats.timestamps.push(now);
+        while(stats.timestamps.length && stats.timestamps[0] < now - RATE_WINDOW * 1000){
+            stats.timestamps.shift();
+        }
+    }
+
+    function percentile(sorted, ratio){
+        if(!sorted.length){return null}
+        return sorted[Math.min(sorted.length - 1, Math.floor(ratio * sorted.length))];
+    }
+
+    function isError(result){
+        // uncaught errors, or errors caught by the try statement pydobe wraps every script in
+        return result === 'EvalScript error.' || result.slice(-20).indexOf('"error":true') !== -1;
+    }
+
+    function sendText(res, text, headers){
+        res.setHeader('Content-Type', 'text/plain; charset=utf-8');
+        for(var name in headers){res.setHeader(name, headers[name])}
+        res.end(text);
+    }
+
+    // results pydobe reads line by line as they arrive are sent in parts, node switching to chunked encoding
+    var STREAM_CHUNK_SIZE = 64 * 1024;
+
+    function streamText(res, text, headers){
+        stats.streamedResponses += 1;
+        res.setHeader('Content-Type', 'application/x-ndjson; charset=utf-8');
+        for(var name in headers){res.setHeader(name, headers[name])}
+        var start = 0;
+        function write(){
+            while(start < text.length){
+                var end = start + STREAM_CHUNK_SIZE;
+                // keep surrogate pairs within a part, a lone half would not encode
+                var code = text.charCodeAt(end - 1);
+                if(code >= 0xD800 && code <= 0xDBFF){end += 1}
+                var chunk = text.slice(start, end);
+                start = end;
+                if(!res.write(chunk, 'utf8')){
+                    // wait for the socket to take the written parts before going on
+                    res.once('drain', write);
+                    return;
+                }
+            }
+            res.end();
+        }
+        write();
+    }
+
+    function sendStats(res){
+        var cs = new CSInterface;
+        cs.evalScript('$._pydobe.panelStats()', function(result){
+            var script = {};
+            try{script = JSON.parse(result)}catch(e){}
+            var sorted = stats.latencies.slice().sort(function(a, b){return a - b});
+            var elapsed = Math.min((Date.now() - stats.started) / 1000, RATE_WINDOW);
+            res.setHeader('Content-Type', 'application/json');
+            res.end(JSON.stringify({
+                uptime: (Date.now() - stats.started) / 1000,
+                requests: stats.requests,
+                errors: stats.errors,
+                requests_per_second: elapsed > 0 ? stats.timestamps.length / elapsed : 0,
+                latency_ms: {p50: percentile(sorted, 0.5), p99: percentile(sorted, 0.99), max: percentile(sorted, 1)},
+                bytes_in: stats.bytesIn,
+                bytes_out: stats.bytesOut,
+                result_files: stats.resultFiles,
+                result_file_bytes: stats.resultFileBytes,
+                streamed_responses: stats.streamedResponses,
+                handles: isFinite(script.handles) ? Number(script.handles) : null,
+                script_cache: script.script_cache || null,
+                verbose: verbose
+            }));
+        });
+    }
+
+    // clients listening to pushed events (server-sent events on GET /events)
+    var eventClients = [];
+    var HEARTBEAT = 15000;  // ms between comments keeping idle event streams open
+
+    function broadcast(type, data){
+        var message = 'event: ' + type + '\ndata: ' + data + '\n\n';
+        for(var i = 0; i < eventClients.length; i++){eventClients[i].write(message)}
+    }
+
+    function openEventStream(req, res){
+        res.writeHead(200, {'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache', 'Connection': 'keep-alive'});
+        res.write(': connected\n\n');
+        eventClients.push(res);
+        req.on('close', function(){
+            eventClients.splice(eventClients.indexOf(res), 1);
+        });
+    }
+
+    setInterval(function(){
+        for(var i = 0; i < eventClients.length; i++){eventClients[i].write(': ping\n\n')}
+    }, HEARTBEAT);
+
+    new CSInterface().addEventListener('pydobe.renderStatus', function(event){
+        broadcast('render', typeof event.data === 'string' ? event.data : JSON.stringify(event.data));
+    });
+
     function handleConnection(req, res){
         res.statusCode = 200;
+        var request = url.parse(req.url, true);
+        if(request.pathname == "/events"){
+            openEventStream(req, res);
+            return;
+        }
+        if(request.pathname == "/stats"){
+            sendStats(res);
+            return;
+        }
+        if(request.pathname == "/config"){
+            // /config?verbose=1 switches script logging on, /config?verbose=0 off
+            if(typeof request.query.verbose !== 'undefined'){
+                verbose = request.query.verbose === '1' || request.query.verbose === 'true';
+            }
+            res.setHeader('Content-Type', 'application/json');
+            res.end(JSON.stringify({verbose: verbose}));
+            return;
+        }
         if(req.method == "GET"){
             // ping
-            res.setHeader('Content-Type', 'text/plain');
-            res.end('AfterEffects is alive');
+            sendText(res, 'AfterEffects is alive');
         }
         if(req.method == "POST"){
             // download all body data (req only get header)
@@ -19,16 +198,35 @@ function SetupConnection() {
             })
             req.on('end', function(){
                 // when everything is downloaded, send it to extend script, sending back the response
-                var parsed_data = JSON.parse(data);
-                console.log("\nExtendScript code to be executed :")
-                console.log(parsed_data["to_eval"]);
+                var body = Buffer.concat(data).toString();
+                var parsed_data = JSON.parse(body);
+                if(verbose){
+                    console.log("\nExtendScript code to be executed :")
+                    console.log(parsed_data["to_eval"]);
+                }
                 var cs = new CSInterface;
+                var start = process.hrtime();
                 cs.evalScript(parsed_data["to_eval"], function(extendScript_return){
-                    console.log("ExtendScript sent back :")
-                    console.log(extendScript_return);
-                    // html response
-                    res.setHeader('Content-Type', 'text/plain');
-                    res.end(extendScript_return);
+                    var elapsed = process.hrtime(start);
+                    var evalMs = elapsed[0] * 1000 + elapsed[1] / 1e6;
+                    if(verbose){
+                        console.log("ExtendScript sent back :")
+                        console.log(extendScript_return);
+                    }
+                    recordRequest(evalMs, body.length, extendScript_return.length, isError(extendScript_return));
+                    // html response, with the evaluation time for pydobe's profiler
+                    var headers = {'X-Pydobe-Eval-Ms': evalMs.toFixed(3)};
+                    var threshold = parsed_data["result_file_threshold"];
+                    if(threshold > 0 && extendScript_return.length >= threshold){
+                        // only the path goes through HTTP, pydobe reads the result from the file
+                        headers['X-Pydobe-Result-File'] = writeResultFile(extendScript_return);
+                        extendScript_return = '';
+                    }
+                    if(parsed_data["stream"]){
+                        streamText(res, extendScript_return, headers);
+                    } else {
+                        sendText(res, extendScript_return, headers);
+                    }
                 });
             })
         }
@@ -39,4 +237,4 @@ function SetupConnection() {
     server.listen(port, hostname, function(){
       console.log('Server running at http://' + String(hostname) + ':' + String(port));
     });
-}
\ No newline at end of file
+}
@@ -28,6 +28,325 @@ $._pydobe.generateId = function(){
 	return result;
 }
 
+// send an event to the panel, which pushes it to the clients listening on GET /events
+$._pydobe.dispatch = function(type, data){
+	if($._pydobe.plugPlugLoaded !== true){
+		new ExternalObject("lib:PlugPlugExternalObject");
+		$._pydobe.plugPlugLoaded = true;
+	}
+	var event = new CSXSEvent();
+	event.type = type;
+	event.data = data;
+	event.dispatch();
+}
+
+// report the status changes of every render queue item as "pydobe.renderStatus" events
+$._pydobe.renderEvents = {3016: "started", 3017: "stopped", 3018: "failed", 3019: "done"};
+$._pydobe.watchRenderQueue = function(){
+	var queue = app.project.renderQueue;
+	for (var i = 1; i <= queue.numItems; i++){
+		(function(item, index){
+			item.onStatusChanged = function(){
+				var done = 0;
+				var total = 0;
+				for (var j = 1; j <= queue.numItems; j++){
+					var status = queue.item(j).status;
+					if(queue.item(j).render || status === 3019){total++}
+					if(status === 3019){done++}
+				}
+				$._pydobe.dispatch("pydobe.renderStatus", ExtendJSON.stringify({
+					"event": $._pydobe.renderEvents[item.status] || "status",
+					"index": index,
+					"comp": item.comp.name,
+					"status": item.status,
+					"elapsed": item.elapsedSeconds,
+					"done": done,
+					"total": total
+				}));
+			};
+		})(queue.item(i), i);
+	}
+	return queue.numItems;
+}
+
+// LIBRARY called by name from pydobe, so that requests only carry the call and its arguments
+
+// JSON string literal of a text, the control characters JSON does not allow in strings being escaped
+$._pydobe.quote = function(text){
+	text = String(text).split("\\").join("\\\\").split('"').join('\\"');
+	text = text.split("\n").join("\\n").split("\r").join("\\r").split("\t").join("\\t");
+	return '"' + text.replace(/[\x00-\x1f]/g, function(character){
+		return '\\u' + ('0000' + character.charCodeAt(0).toString(16)).slice(-4);
+	}) + '"';
+}
+
+// JSON text of an array of plain values (and arrays of them), null if it holds objects
+$._pydobe.serialiseArray = function(array){
+	// arrays of numbers are joined natively, NaN and Infinity being read by Python's json module
+	var numbers = true;
+	for (var i = 0; i < array.length && numbers; i++){numbers = typeof array[i] === 'number'}
+	if(numbers){return '[' + array.join(',') + ']'}
+	var parts = [];
+	for (var i = 0; i < array.length; i++){
+		var value = array[i];
+		if(value === null || typeof value === 'undefined'){parts.push('null')}
+		else if(typeof value === 'number'){parts.push(isFinite(value) ? String(value) : 'null')}
+		else if(typeof value === 'boolean'){parts.push(String(value))}
+		else if(typeof value === 'string'){parts.push($._pydobe.quote(value))}
+		else if(value instanceof Array){
+			var text = $._pydobe.serialiseArray(value);
+			if(text === null){return null}
+			parts.push(text);
+		}
+		else {return null}
+	}
+	return '[' + parts.join(',') + ']';
+}
+
+// result of a pydobe request: objects are kept under a new id and described, arrays of plain values are serialised
+$._pydobe.register = function(value){
+	if(typeof value !== 'object' || value === null){return value}
+	if(value instanceof Array){
+		var text = $._pydobe.serialiseArray(value);
+		if(text !== null){return '{"pydobeArray":' + text + '}'}
+	}
+	var id = $._pydobe.generateId();
+	$._pydobe[id] = value;
+	return '{"isObject":true,"objectType":"' + value.reflect.name + '","pydobeId":"' + id + '"}';
+}
+
+// JSON text of any value, objects being registered
+$._pydobe.serialise = function(value){
+	if(value === null || typeof value === 'undefined'){return 'null'}
+	if(typeof value === 'object'){return $._pydobe.register(value)}
+	if(typeof value === 'string'){return $._pydobe.quote(value)}
+	if(typeof value === 'number'){return isFinite(value) ? String(value) : 'null'}
+	return String(value);
+}
+
+// the members of an array, or of a collection (indexed from 1)
+$._pydobe.membersOf = function(object){
+	var members = [];
+	var start = (object instanceof Array) ? 0 : 1;
+	for (var i = start; i < object.length + start; i++){members.push(object[i])}
+	return members;
+}
+
+$._pydobe.get = function(id, name){
+	return $._pydobe.register($._pydobe[id][name]);
+}
+
+// an attribute of several objects
+$._pydobe.getMany = function(objects, name){
+	var parts = [];
+	for (var i = 0; i < objects.length; i++){parts.push($._pydobe.serialise(objects[i][name]))}
+	return '[' + parts.join(',') + ']';
+}
+
+// set an attribute of several objects, to one value each
+$._pydobe.setMany = function(objects, name, values){
+	for (var i = 0; i < objects.length; i++){objects[i][name] = values[i]}
+	return objects.length;
+}
+
+// JSON text of an array of any values, plain values being serialised in one go when possible
+$._pydobe.serialiseColumn = function(values){
+	var text = $._pydobe.serialiseArray(values);
+	if(text !== null){return text}
+	var parts = [];
+	for (var i = 0; i < values.length; i++){parts.push($._pydobe.serialise(values[i]))}
+	return '[' + parts.join(',') + ']';
+}
+
+// the value of a dotted attribute name such as "source.name", the object itself for an empty name
+$._pydobe.attribute = function(object, name){
+	if(name === ''){return object}
+	var names = name.split('.');
+	for (var i = 0; i < names.length && object !== null && typeof object !== 'undefined'; i++){object = object[names[i]]}
+	return object;
+}
+
+// attributes of the members of an array or collection, one column of values per attribute
+$._pydobe.columns = function(source, names){
+	var members = $._pydobe.membersOf(source);
+	var columns = [];
+	for (var n = 0; n < names.length; n++){
+		var values = [];
+		for (var i = 0; i < members.length; i++){values.push($._pydobe.attribute(members[i], names[n]))}
+		columns.push($._pydobe.quote(names[n]) + ':' + $._pydobe.serialiseColumn(values));
+	}
+	return '{"pydobeColumns":{' + columns.join(',') + '},"length":' + members.length + '}';
+}
+
+// attributes of the members of an array or collection, one line of values per member, which pydobe reads as it arrives;
+// with locate, every line starts with the locator of the member rather than registering it
+$._pydobe.records = function(source, names, locate){
+	var members = $._pydobe.membersOf(source);
+	var lines = [];
+	for (var i = 0; i < members.length; i++){
+		var values = locate ? [$._pydobe.locator(members[i])] : [];
+		for (var n = 0; n < names.length; n++){values.push($._pydobe.serialise($._pydobe.attribute(members[i], names[n])))}
+		lines.push('[' + values.join(',') + ']');
+	}
+	return lines.join('\n');
+}
+
+// times and values of the keyframes of a property, as columns
+$._pydobe.keyframes = function(id){
+	var property = $._pydobe[id];
+	var times = [];
+	var values = [];
+	for (var i = 1; i <= property.numKeys; i++){
+		times.push(property.keyTime(i));
+		values.push(property.keyValue(i));
+	}
+	return '{"pydobeColumns":{"time":' + $._pydobe.serialiseColumn(times) + ',"value":' + $._pydobe.serialiseColumn(values)
+		+ '},"length":' + times.length + '}';
+}
+
+// every member of an array or collection
+$._pydobe.members = function(id){
+	var members = $._pydobe.membersOf($._pydobe[id]);
+	var parts = [];
+	for (var i = 0; i < members.length; i++){parts.push($._pydobe.serialise(members[i]))}
+	return '[' + parts.join(',') + ']';
+}
+
+// every member of an array or collection kept in one array under a new id, with the class of each member,
+// pydobe reaching the members through the array by index and registering only those it needs an id for
+$._pydobe.lazyMembers = function(id){
+	var members = $._pydobe.membersOf($._pydobe[id]);
+	var types = [];
+	for (var i = 0; i < members.length; i++){
+		types.push(members[i] !== null && typeof members[i] === 'object' ? members[i].reflect.name : null);
+	}
+	var arrayId = $._pydobe.generateId();
+	$._pydobe[arrayId] = members;
+	return '{"pydobeId":"' + arrayId + '","types":' + $._pydobe.serialiseArray(types) + '}';
+}
+
+// register every object of an array, null for what is not an object
+$._pydobe.registerAll = function(objects){
+	var parts = [];
+	for (var i = 0; i < objects.length; i++){parts.push($._pydobe.serialise(objects[i]))}
+	return '[' + parts.join(',') + ']';
+}
+
+// code reaching an object from app without any handle, such as 'app.project.itemByID(12)', null if it has none:
+// items and layers are reached by id, properties by the match names of their groups (by index in indexed groups)
+$._pydobe.addressOf = function(object){
+	if(object === null || typeof object !== 'object'){return null}
+	var type = object.reflect.name;
+	if(type === 'Application'){return 'app'}
+	if(type === 'Project'){return 'app.project'}
+	if(type === 'RenderQueue'){return 'app.project.renderQueue'}
+	if(type === 'ItemCollection'){return 'app.project.items'}
+	if(type === 'CompItem' || type === 'FolderItem' || type === 'FootageItem'){return 'app.project.itemByID(' + object.id + ')'}
+	if(type === 'AVLayer' || type === 'TextLayer' || type === 'ShapeLayer' || type === 'CameraLayer' || type === 'LightLayer'){
+		// layers have an id from After Effects 22, before which they are reached by index in their comp
+		if(typeof object.id === 'number'){return 'app.project.layerByID(' + object.id + ')'}
+		return 'app.project.itemByID(' + object.containingComp.id + ').layer(' + object.index + ')';
+	}
+	if(type === 'Property' || type === 'PropertyGroup' || type === 'MaskPropertyGroup'){
+		var path = '';
+		while(object.propertyDepth > 0){
+			var parent = object.parentProperty;
+			var step = parent.propertyType === PropertyType.INDEXED_GROUP ? object.propertyIndex : $._pydobe.quote(object.matchName);
+			path = '.property(' + step + ')' + path;
+			object = parent;
+		}
+		var layer = $._pydobe.addressOf(object);
+		return layer === null ? null : layer + path;
+	}
+	return null;
+}
+
+// the class and stable address of an object, without registering it, see addressOf; objects without one are registered
+$._pydobe.locator = function(object){
+	var address = $._pydobe.addressOf(object);
+	if(address === null){return $._pydobe.serialise(object)}
+	return '{"objectType":"' + object.reflect.name + '","address":' + $._pydobe.quote(address) + '}';
+}
+
+// the addresses of several objects, see addressOf
+$._pydobe.addresses = function(objects){
+	var parts = [];
+	for (var i = 0; i < objects.length; i++){
+		var address = $._pydobe.addressOf(objects[i]);
+		parts.push(address === null ? 'null' : $._pydobe.quote(address));
+	}
+	return '[' + parts.join(',') + ']';
+}
+
+// the first member of an array or collection whose attribute has the value, null if there is none
+$._pydobe.find = function(id, name, value){
+	var members = $._pydobe.membersOf($._pydobe[id]);
+	for (var i = 0; i < members.length; i++){
+		if(members[i][name] === value){return $._pydobe.register(members[i])}
+	}
+	return null;
+}
+
+// COMPILED SCRIPTS, functions compiled once and then run by the hash of their source
+
+$._pydobe.compiledScripts = {};  // hash: function
+$._pydobe.compiledOrder = [];  // hashes, the least recently used first
+$._pydobe.scriptCache = {limit: 256, hits: 0, misses: 0, evictions: 0, missed: null, fresh: null};
+
+// compile a script, or compile it again, as the most recently used; defining it and running it counts as one miss
+$._pydobe.define = function(hash, params, body){
+	var compiled = Function.apply(null, params.concat([body]));  // first, so that a syntax error leaves the cache as it was
+	var cache = $._pydobe.scriptCache;
+	var order = $._pydobe.compiledOrder;
+	var index = order.indexOf(hash);
+	if(index >= 0){order.splice(index, 1)}
+	order.push(hash);
+	while(order.length > cache.limit){
+		delete $._pydobe.compiledScripts[order.shift()];
+		cache.evictions++;
+	}
+	$._pydobe.compiledScripts[hash] = compiled;
+	// the miss was counted already when run was told the script is missing
+	if(cache.missed !== hash){cache.misses++}
+	cache.missed = null;
+	cache.fresh = hash;  // the run which follows belongs to this miss
+}
+
+// run a compiled script, pydobe defines it again when told it is missing
+$._pydobe.run = function(hash, args){
+	var cache = $._pydobe.scriptCache;
+	var compiled = $._pydobe.compiledScripts[hash];
+	if(typeof compiled !== 'function'){
+		cache.misses++;
+		cache.missed = hash;
+		return '{"pydobeCacheMiss":true}';
+	}
+	if(cache.fresh !== hash){cache.hits++}
+	cache.fresh = null;
+	var order = $._pydobe.compiledOrder;
+	for(var i = order.length - 2; i >= 0; i--){
+		if(order[i] === hash){
+			order.splice(i, 1);
+			order.push(hash);
+			break;
+		}
+	}
+	return compiled.apply(null, args);
+}
+
+$._pydobe.scriptCacheStats = function(){
+	var cache = $._pydobe.scriptCache;
+	var runs = cache.hits + cache.misses;
+	return '{"size":' + $._pydobe.compiledOrder.length + ',"limit":' + cache.limit + ',"hits":' + cache.hits
+		+ ',"misses":' + cache.misses + ',"evictions":' + cache.evictions
+		+ ',"hit_rate":' + (runs ? cache.hits / runs : 'null') + '}';
+}
+
+// counters of the ExtendScript side served by the panel on GET /stats
+$._pydobe.panelStats = function(){
+	return '{"handles":' + $._pydobe.generatedIds.length + ',"script_cache":' + $._pydobe.scriptCacheStats() + '}';
+}
+
 // replacer function to pass to ExtendJSON.stringify preventing infinite loop for $ objects
 function internal_variables_replacer(key, value){if(key !== "tmp" && key !== "_pydobe"){return value}}
 
@@ -1,3 +1,17 @@
-from pydobe.after_effects.objects.root import Root
+def __getattr__(name):
+    """Build the root object on first access so importing pydobe stays cheap and does not need After Effects"""
+    if name == "objects":
+        from pydobe.after_effects.objects.root import Root
 
-objects = Root()  # entry point to the root level ExtendScript objects available
+        global objects
+        objects = Root()  # entry point to the root level ExtendScript objects available
+        return objects
+    if name == "bulk_mode":
+        from pydobe.after_effects.objects.ae_objects import bulk_mode
+
+        return bulk_mode
+    raise AttributeError(f"module 'pydobe' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + ["objects", "bulk_mode"])
@@ -2,6 +2,8 @@ from pydobe.core import PydobeBaseObject
 
 
 class File(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -30,6 +32,8 @@ class File(PydobeBaseObject):
 
 
 class Folder(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
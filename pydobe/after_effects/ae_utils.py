@@ -1,12 +1,16 @@
 # AE GLOBAL FUNCTIONS
-from pydobe.core import eval_script_returning_object
+from pydobe.core import eval_script_returning_object, format_to_extend
 
 
 def time_to_current_format(time, fps):
-    return eval_script_returning_object(f"timeToCurrentFormat({time}, {fps})")
+    return eval_script_returning_object(
+        f"timeToCurrentFormat({format_to_extend(time)}, {format_to_extend(fps)})"
+    )
 
 
 def current_format_to_time(time, fps):
-    if type(time) == int:
-        return eval_script_returning_object(f"currentFormatToTime({time}, {fps})")
-    return eval_script_returning_object(f'currentFormatToTime("{time}", {fps})')
+    if type(time) != int:
+        time = str(time)  # a time in the current format, such as a timecode
+    return eval_script_returning_object(
+        f"currentFormatToTime({format_to_extend(time)}, {format_to_extend(fps)})"
+    )
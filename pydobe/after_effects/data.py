@@ -146,3 +146,18 @@ tool_dictionary = IntStringDict(
         9048: "Dolly To Cursor Tool",
     }
 )
+
+render_status_dictionary = IntStringDict(
+    {
+        3012: "Will Continue",
+        3013: "Needs Output",
+        3014: "Unqueued",
+        3015: "Queued",
+        3016: "Rendering",
+        3017: "User Stopped",
+        3018: "Err Stopped",
+        3019: "Done",
+    }
+)
+
+UNDO_COMMAND = 16  # app.executeCommand id of Edit > Undo
@@ -0,0 +1,2157 @@
+"""A small ExtendScript interpreter used by the fake After Effects
+
+It understands the subset of ExtendScript (ES3) pydobe sends to the panel and the panel library
+pydobeAEScript.jsx is written in: variables, functions, control flow, switch, try/catch, object, array
+and regular expression literals and the usual operators. Host objects are plain Python objects, see model.py.
+"""
+
+import functools
+import math
+import operator as _operator
+import re
+
+# VALUES
+
+
+class Undefined(object):
+    """The ExtendScript undefined value, null is None"""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self):
+        return "undefined"
+
+    def __bool__(self):
+        return False
+
+
+UNDEFINED = Undefined()
+
+
+class JSObject(dict):
+    """A plain ExtendScript object"""
+
+    type_name = "Object"
+
+    def js_get(self, name):
+        if name in self:
+            return self[name]
+        method = _OBJECT_METHODS.get(name)
+        if method:
+            return _bind(method, self)
+        return UNDEFINED
+
+    def js_set(self, name, value):
+        self[name] = value
+
+
+class JSError(JSObject):
+    """An ExtendScript Error object"""
+
+    type_name = "Error"
+
+    def __init__(self, message="", name="Error", line=0):
+        super().__init__(name=name, message=message, number=0, line=line, source="")
+
+    def __str__(self):
+        return f"{self.get('name', 'Error')}: {self.get('message', '')}"
+
+
+class JSFunction(object):
+    """A function defined in ExtendScript code"""
+
+    type_name = "Function"
+
+    def __init__(self, interpreter, name, params, body, scope):
+        self.interpreter = interpreter
+        self.name = name
+        self.params = params
+        self.body = body
+        self.scope = scope
+
+    def __call__(self, *args, this=None):
+        return self.interpreter.call_function(self, list(args), this)
+
+    def js_get(self, name):
+        if name == "length":
+            return len(self.params)
+        if name == "name":
+            return self.name or ""
+        if name == "apply":
+            return lambda this=None, args=None: self(*(args or []), this=this)
+        if name == "call":
+            return lambda this=None, *args: self(*args, this=this)
+        return UNDEFINED
+
+
+class JSRegExp(object):
+    """An ExtendScript regular expression, matched by Python's re module"""
+
+    type_name = "RegExp"
+
+    def __init__(self, source, flags=""):
+        self.source = source
+        self.flags = flags
+        self.global_ = "g" in flags
+        self.pattern = _compile_regex(source, flags)
+        self.lastIndex = 0
+
+    def js_get(self, name):
+        if name == "source":
+            return self.source
+        if name == "global":
+            return self.global_
+        if name == "ignoreCase":
+            return "i" in self.flags
+        if name == "multiline":
+            return "m" in self.flags
+        if name == "lastIndex":
+            return self.lastIndex
+        method = _REGEXP_METHODS.get(name)
+        return _bind(method, self) if method else UNDEFINED
+
+    def js_set(self, name, value):
+        if name == "lastIndex":
+            self.lastIndex = int(to_number(value))
+
+    def to_string(self):
+        return f"/{self.source}/{self.flags}"
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_regex(source, flags):
+    options = (re.IGNORECASE if "i" in flags else 0) | (
+        re.MULTILINE if "m" in flags else 0
+    )
+    try:
+        return re.compile(source, options)
+    except re.error as error:
+        raise ExtendScriptError(
+            f"Syntax error: invalid regular expression /{source}/: {error}",
+            "SyntaxError",
+        )
+
+
+class ExtendScriptError(Exception):
+    """Raised by host objects, becomes an Error object ExtendScript code can catch"""
+
+    def __init__(self, message, name="Error"):
+        super().__init__(message)
+        self.message = message
+        self.name = name
+
+
+class JSThrow(Exception):
+    """Carries a value thrown by ExtendScript code"""
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.value = value
+
+
+class _ControlFlow(Exception):
+    pass
+
+
+class _Break(_ControlFlow):
+    pass
+
+
+class _Continue(_ControlFlow):
+    pass
+
+
+class _Return(_ControlFlow):
+    def __init__(self, value):
+        self.value = value
+
+
+def thrown_value(error: Exception, line: int = 0):
+    """The ExtendScript value of an exception raised while evaluating code"""
+    if isinstance(error, JSThrow):
+        return error.value
+    if isinstance(error, ExtendScriptError):
+        return JSError(error.message, error.name, line)
+    return JSError(str(error) or type(error).__name__, "Error", line)
+
+
+_EMPTY = object()  # completion value of statements that do not produce one
+
+
+# CONVERSIONS
+
+
+def type_of(value) -> str:
+    if value is UNDEFINED:
+        return "undefined"
+    if value is None:
+        return "object"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, JSFunction) or (
+        callable(value) and (not hasattr(value, "js_get") or hasattr(value, "js_call"))
+    ):
+        return "function"
+    return "object"
+
+
+def reflect_name(value) -> str:
+    """Name of the ExtendScript class of a value, as given by value.reflect.name"""
+    if isinstance(value, list):
+        return "Array"
+    if isinstance(value, bool):
+        return "Boolean"
+    if isinstance(value, (int, float)):
+        return "Number"
+    if isinstance(value, str):
+        return "String"
+    if type_of(value) == "function" and not hasattr(value, "type_name"):
+        return "Function"
+    return getattr(value, "type_name", type(value).__name__)
+
+
+def truthy(value) -> bool:
+    if value is UNDEFINED or value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0 and value == value
+    if isinstance(value, str):
+        return value != ""
+    return True
+
+
+def number_to_string(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return "NaN"
+    if value in (math.inf, -math.inf):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == int(value) and abs(value) < 1e21:
+        return str(int(value))
+    text = repr(value)
+    if "e" in text:
+        mantissa, exponent = text.split("e")
+        sign = "-" if exponent.startswith("-") else "+"
+        text = f"{mantissa}e{sign}{exponent.lstrip('+-').lstrip('0') or '0'}"
+    return text
+
+
+def to_string(value) -> str:
+    if isinstance(value, str):
+        return value
+    if value is UNDEFINED:
+        return "undefined"
+    if value is None:
+        return "null"
+    if isinstance(value, (bool, int, float)):
+        return number_to_string(value)
+    if isinstance(value, list):
+        return ",".join(
+            "" if item is None or item is UNDEFINED else to_string(item)
+            for item in value
+        )
+    if isinstance(value, JSError):
+        return str(value)
+    if hasattr(value, "to_string"):
+        return value.to_string()
+    return f"[object {reflect_name(value)}]"
+
+
+def to_number(value):
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, (int, float)):
+        return value
+    if value is None:
+        return 0
+    if value is UNDEFINED:
+        return math.nan
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return 0
+        try:
+            if text.lower().startswith("0x"):
+                return int(text, 16)
+            number = float(text)
+        except ValueError:
+            if text in ("Infinity", "+Infinity"):
+                return math.inf
+            if text == "-Infinity":
+                return -math.inf
+            return math.nan
+        return normalise_number(number)
+    if isinstance(value, list):
+        if not value:
+            return 0
+        if len(value) == 1:
+            return to_number(to_string(value[0]))
+    return math.nan
+
+
+def normalise_number(value):
+    """Integral results are kept as int so they serialise like ExtendScript numbers"""
+    if isinstance(value, float) and value == value and abs(value) < 2**53:
+        if value == int(value) and not (value == 0 and math.copysign(1, value) < 0):
+            return int(value)
+    return value
+
+
+def to_int32(value) -> int:
+    number = to_number(value)
+    if number != number or number in (math.inf, -math.inf):
+        return 0
+    number = int(number) & 0xFFFFFFFF
+    return number - 0x100000000 if number & 0x80000000 else number
+
+
+def strict_equals(left, right) -> bool:
+    left_type, right_type = type_of(left), type_of(right)
+    if left_type != right_type:
+        return False
+    if left_type == "number":
+        return to_number(left) == to_number(right)
+    if left_type in ("string", "boolean", "undefined"):
+        return left == right
+    return left is right
+
+
+def loose_equals(left, right) -> bool:
+    if type_of(left) == type_of(right):
+        return strict_equals(left, right)
+    nullish = (None, UNDEFINED)
+    if left in nullish or right in nullish:
+        return left in nullish and right in nullish
+    primitives = ("number", "string", "boolean")
+    if type_of(left) in primitives and type_of(right) in primitives:
+        return to_number(left) == to_number(right)
+    if type_of(left) in primitives:
+        return loose_equals(left, to_primitive(right))
+    if type_of(right) in primitives:
+        return loose_equals(to_primitive(left), right)
+    return False
+
+
+def to_primitive(value):
+    if isinstance(value, (list, JSObject)) or hasattr(value, "js_get"):
+        return to_string(value)
+    return value
+
+
+def to_json(value, skip_keys=(), depth=None):
+    """Convert an ExtendScript value to data json.dumps understands, as ExtendJSON.stringify does"""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        if value != value or value in (math.inf, -math.inf):
+            return None
+        return normalise_number(value)
+    if value is UNDEFINED or type_of(value) == "function":
+        return UNDEFINED
+    if depth is not None and depth <= 0:
+        return {} if not isinstance(value, list) else []
+    next_depth = None if depth is None else depth - 1
+    if isinstance(value, list):
+        items = [to_json(item, skip_keys, next_depth) for item in value]
+        return [None if item is UNDEFINED else item for item in items]
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if key in skip_keys:
+                continue
+            item = to_json(item, skip_keys, next_depth)
+            if item is not UNDEFINED:
+                result[key] = item
+        return result
+    if hasattr(value, "to_json"):
+        return value.to_json()
+    return {}
+
+
+# BUILT IN METHODS
+
+
+def _bind(function, this):
+    def bound(*args):
+        return function(this, *args)
+
+    return bound
+
+
+def _argument(args, index, default=UNDEFINED):
+    return args[index] if len(args) > index else default
+
+
+def _slice_indices(length, args):
+    start = to_number(_argument(args, 0, 0))
+    end = _argument(args, 1)
+    end = length if end is UNDEFINED else to_number(end)
+    start = int(start if start >= 0 else max(length + start, 0))
+    end = int(end if end >= 0 else max(length + end, 0))
+    return min(start, length), min(end, length)
+
+
+def _string_index_of(this, search, start=0):
+    return this.find(to_string(search), int(to_number(start)))
+
+
+def _string_last_index_of(this, search, start=UNDEFINED):
+    if start is UNDEFINED:
+        return this.rfind(to_string(search))
+    return this.rfind(to_string(search), 0, int(to_number(start)) + len(search))
+
+
+def _string_substring(this, start, end=UNDEFINED):
+    length = len(this)
+    start = min(max(int(to_number(start) or 0), 0), length)
+    end = length if end is UNDEFINED else min(max(int(to_number(end) or 0), 0), length)
+    if start > end:
+        start, end = end, start
+    return this[start:end]
+
+
+def _string_substr(this, start, length=UNDEFINED):
+    start = int(to_number(start))
+    if start < 0:
+        start = max(len(this) + start, 0)
+    if length is UNDEFINED:
+        return this[start:]
+    return this[start : start + max(int(to_number(length)), 0)]
+
+
+def _string_split(this, separator=UNDEFINED, limit=UNDEFINED):
+    if separator is UNDEFINED:
+        parts = [this]
+    elif isinstance(separator, JSRegExp):
+        parts = [
+            UNDEFINED if part is None else part
+            for part in separator.pattern.split(this)
+        ]
+    elif separator == "":
+        parts = list(this)
+    else:
+        parts = this.split(to_string(separator))
+    if limit is not UNDEFINED:
+        parts = parts[: int(to_number(limit))]
+    return parts
+
+
+def _matches(this, search):
+    """(start, end, [match, *groups]) of the matches replace works on"""
+    if isinstance(search, JSRegExp):
+        found = (
+            search.pattern.finditer(this)
+            if search.global_
+            else [search.pattern.search(this)]
+        )
+        if search.global_:
+            search.lastIndex = 0
+        return [
+            (
+                match.start(),
+                match.end(),
+                [match.group()]
+                + [UNDEFINED if group is None else group for group in match.groups()],
+            )
+            for match in found
+            if match is not None
+        ]
+    search = to_string(search)
+    start = this.find(search)
+    return [] if start < 0 else [(start, start + len(search), [search])]
+
+
+_REPLACEMENT_PATTERN = re.compile(r"\$([$&`']|\d\d?)")
+
+
+def _string_replace(this, search, replacement=UNDEFINED):
+    parts = []
+    position = 0
+    for start, end, groups in _matches(this, search):
+        parts.append(this[position:start])
+        if type_of(replacement) == "function":
+            parts.append(to_string(replacement(*groups, start, this)))
+        else:
+            parts.append(
+                _expand_replacement(to_string(replacement), groups, start, end, this)
+            )
+        position = end
+    parts.append(this[position:])
+    return "".join(parts)
+
+
+def _expand_replacement(replacement, groups, start, end, text):
+    """The replacement of a match with $&, $1... $` and $' substituted"""
+
+    def substitute(match):
+        code = match.group(1)
+        if code == "$":
+            return "$"
+        if code == "&":
+            return groups[0]
+        if code == "`":
+            return text[:start]
+        if code == "'":
+            return text[end:]
+        index = int(code)
+        if 0 < index < len(groups):
+            return to_string(groups[index]) if groups[index] is not UNDEFINED else ""
+        return match.group()
+
+    return _REPLACEMENT_PATTERN.sub(substitute, replacement)
+
+
+def _string_match(this, pattern):
+    if not isinstance(pattern, JSRegExp):
+        pattern = JSRegExp(to_string(pattern))
+    if not pattern.global_:
+        return _regexp_exec(pattern, this)
+    pattern.lastIndex = 0
+    found = [match.group() for match in pattern.pattern.finditer(this)]
+    return found or None
+
+
+def _string_search(this, pattern):
+    if not isinstance(pattern, JSRegExp):
+        pattern = JSRegExp(to_string(pattern))
+    match = pattern.pattern.search(this)
+    return match.start() if match else -1
+
+
+_STRING_METHODS = {
+    "charAt": lambda this, index=0: (
+        this[int(index)] if 0 <= int(index) < len(this) else ""
+    ),
+    "charCodeAt": lambda this, index=0: (
+        ord(this[int(index)]) if 0 <= int(index) < len(this) else math.nan
+    ),
+    "indexOf": _string_index_of,
+    "lastIndexOf": _string_last_index_of,
+    "substring": _string_substring,
+    "substr": _string_substr,
+    "slice": lambda this, *args: this[slice(*_slice_indices(len(this), args))],
+    "toLowerCase": lambda this: this.lower(),
+    "toUpperCase": lambda this: this.upper(),
+    "split": _string_split,
+    "replace": _string_replace,
+    "match": _string_match,
+    "search": _string_search,
+    "concat": lambda this, *args: this + "".join(to_string(arg) for arg in args),
+    "toString": lambda this: this,
+    "valueOf": lambda this: this,
+}
+
+
+def _array_push(this, *items):
+    this.extend(items)
+    return len(this)
+
+
+def _array_pop(this):
+    return this.pop() if this else UNDEFINED
+
+
+def _array_shift(this):
+    return this.pop(0) if this else UNDEFINED
+
+
+def _array_unshift(this, *items):
+    this[0:0] = items
+    return len(this)
+
+
+def _array_index_of(this, item, start=0):
+    start = int(to_number(start))
+    if isinstance(
+        item, str
+    ):  # only strings equal strings, so the native search gives the same answer
+        try:
+            return this.index(item, start)
+        except ValueError:
+            return -1
+    for index in range(start, len(this)):
+        if strict_equals(this[index], item):
+            return index
+    return -1
+
+
+def _array_join(this, separator=","):
+    if separator is UNDEFINED:
+        separator = ","
+    return to_string(separator).join(
+        "" if item is None or item is UNDEFINED else to_string(item) for item in this
+    )
+
+
+def _array_splice(this, start, count=UNDEFINED, *items):
+    start, _ = _slice_indices(len(this), [start])
+    count = len(this) - start if count is UNDEFINED else int(to_number(count))
+    removed = this[start : start + count]
+    this[start : start + count] = items
+    return removed
+
+
+def _array_sort(this, compare=UNDEFINED):
+    if compare is UNDEFINED:
+        this.sort(key=to_string)
+    else:
+        this.sort(key=functools.cmp_to_key(lambda a, b: to_number(compare(a, b)) or 0))
+    return this
+
+
+def _array_concat(this, *args):
+    result = list(this)
+    for arg in args:
+        if isinstance(arg, list):
+            result.extend(arg)
+        else:
+            result.append(arg)
+    return result
+
+
+_ARRAY_METHODS = {
+    "push": _array_push,
+    "pop": _array_pop,
+    "shift": _array_shift,
+    "unshift": _array_unshift,
+    "indexOf": _array_index_of,
+    "join": _array_join,
+    "slice": lambda this, *args: this[slice(*_slice_indices(len(this), args))],
+    "splice": _array_splice,
+    "concat": _array_concat,
+    "reverse": lambda this: this.reverse() or this,
+    "sort": _array_sort,
+    "toString": lambda this: to_string(this),
+}
+
+_BOOLEAN_METHODS = {
+    "toString": lambda this: to_string(this),
+    "valueOf": lambda this: this,
+}
+
+_NUMBER_METHODS = {
+    "toFixed": lambda this, digits=0: f"{this:.{int(digits)}f}",
+    "toString": lambda this, radix=10: (
+        number_to_string(this) if radix == 10 else _to_radix(int(this), int(radix))
+    ),
+    "valueOf": lambda this: this,
+}
+
+
+def _has_own_property(this, name=UNDEFINED):
+    name = to_string(name)
+    if isinstance(this, dict):
+        return name in this
+    if isinstance(this, (list, str)):
+        return name == "length" or (name.isdigit() and int(name) < len(this))
+    if hasattr(this, "js_keys"):
+        return name in this.js_keys()
+    return False
+
+
+_OBJECT_METHODS = {
+    "hasOwnProperty": _has_own_property,
+    "toString": lambda this: to_string(this),
+}
+
+
+def _regexp_exec(this, string=UNDEFINED):
+    text = to_string(string)
+    start = this.lastIndex if this.global_ else 0
+    match = this.pattern.search(text, start) if 0 <= start <= len(text) else None
+    if this.global_:
+        this.lastIndex = match.end() if match else 0
+    if match is None:
+        return None
+    return [match.group()] + [
+        UNDEFINED if group is None else group for group in match.groups()
+    ]
+
+
+_REGEXP_METHODS = {
+    "exec": _regexp_exec,
+    "test": lambda this, string=UNDEFINED: _regexp_exec(this, string) is not None,
+    "toString": lambda this: this.to_string(),
+}
+
+
+def _to_radix(number, radix):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    if number == 0:
+        return "0"
+    sign = "-" if number < 0 else ""
+    number = abs(number)
+    text = ""
+    while number:
+        number, remainder = divmod(number, radix)
+        text = digits[remainder] + text
+    return sign + text
+
+
+def get_member(value, name):
+    """Read a property of any ExtendScript value"""
+    if isinstance(value, str):
+        if name == "length":
+            return len(value)
+        if isinstance(name, (int, float)) or (isinstance(name, str) and name.isdigit()):
+            index = int(name)
+            return value[index] if 0 <= index < len(value) else UNDEFINED
+        method = _STRING_METHODS.get(name)
+        if method:
+            return _bind(method, value)
+        return _constructor_of(value) if name == "constructor" else UNDEFINED
+    if isinstance(value, list):
+        if isinstance(name, (int, float)) and not isinstance(name, bool):
+            index = int(name)
+            return (
+                value[index] if 0 <= index < len(value) and index == name else UNDEFINED
+            )
+        if name == "length":
+            return len(value)
+        if name.isdigit():
+            return get_member(value, int(name))
+        if name == "reflect":
+            return Reflect(value)
+        method = _ARRAY_METHODS.get(name)
+        if method:
+            return _bind(method, value)
+        return _constructor_of(value) if name == "constructor" else UNDEFINED
+    if value is UNDEFINED or value is None:
+        raise ExtendScriptError(f"{to_string(value)} is not an object", "TypeError")
+    if isinstance(value, bool):
+        method = _BOOLEAN_METHODS.get(name)
+    elif isinstance(value, (int, float)):
+        method = _NUMBER_METHODS.get(name)
+    else:
+        if name == "reflect":
+            return Reflect(value)
+        if not isinstance(name, str):
+            name = to_string(name)
+        result = value.js_get(name)
+        if result is UNDEFINED and name == "constructor":
+            return _constructor_of(value)
+        return result
+    if method:
+        return _bind(method, value)
+    return _constructor_of(value) if name == "constructor" else UNDEFINED
+
+
+def _constructor_of(value):
+    """The constructor of a value, a built in one or the class of a host object"""
+    name = reflect_name(value)
+    constructor = _BUILTINS.get(name)
+    if isinstance(constructor, _Callable):
+        return constructor
+    return _Callable(
+        functools.partial(_illegal_constructor, name), members={"type_name": name}
+    )
+
+
+def _illegal_constructor(name, *args):
+    raise ExtendScriptError(f"{name} does not have a constructor")
+
+
+def set_member(target, name, value):
+    """Write a property of an ExtendScript object"""
+    if isinstance(target, list):
+        if name == "length":
+            del target[int(to_number(value)) :]
+            return
+        index = int(to_number(name))
+        while len(target) <= index:
+            target.append(UNDEFINED)
+        target[index] = value
+        return
+    if target is UNDEFINED or target is None:
+        raise ExtendScriptError(f"{to_string(target)} is not an object", "TypeError")
+    if isinstance(target, (str, int, float, bool)):
+        return
+    if not isinstance(name, str):
+        name = to_string(name)
+    target.js_set(name, value)
+
+
+class Reflect(object):
+    """The reflect property of ExtendScript objects"""
+
+    type_name = "Reflection"
+
+    def __init__(self, value):
+        self.value = value
+
+    def js_get(self, name):
+        if name == "name":
+            return reflect_name(self.value)
+        if name == "properties":
+            return object_keys(self.value)
+        return UNDEFINED
+
+
+def object_keys(value) -> list:
+    """The enumerable property names of an ExtendScript value"""
+    if isinstance(value, dict):
+        return list(value)
+    if isinstance(value, (list, str)):
+        return [str(index) for index in range(len(value))]
+    if hasattr(value, "js_keys"):
+        return value.js_keys()
+    return []
+
+
+# TOKENIZER
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>[ \t\r\f\v\ufeff]+)
+  | (?P<newline>\n)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<string>"(?:[^"\\\n]|\\.|\\\n)*"|'(?:[^'\\\n]|\\.|\\\n)*')
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punctuator>>>>=|===|!==|>>>|<<=|>>=|\+\+|--|&&|\|\||==|!=|<=|>=|\+=|-=|\*=|/=|%=|&=|\|=|\^=|<<|>>|[{}()\[\];,.<>+\-*/%&|^!~?:=])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# the body and flags of a regular expression literal, the opening / being already read
+_REGEX = re.compile(r"((?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+)/([gim]*)")
+# tokens after which / is a division rather than the start of a regular expression
+_OPERANDS = {"number", "string", "name", "regex"}
+_OPERAND_KEYWORDS = {"this", "true", "false", "null"}
+_OPERAND_PUNCTUATORS = {")", "]", "}"}
+
+_ESCAPES = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+    "0": "\0",
+    "\n": "",
+}
+_ESCAPE = re.compile(r"\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.|\n)", re.DOTALL)
+
+KEYWORDS = {
+    "var",
+    "function",
+    "return",
+    "if",
+    "else",
+    "for",
+    "in",
+    "while",
+    "do",
+    "break",
+    "continue",
+    "new",
+    "delete",
+    "typeof",
+    "instanceof",
+    "void",
+    "throw",
+    "try",
+    "catch",
+    "finally",
+    "this",
+    "true",
+    "false",
+    "null",
+    "switch",
+    "case",
+    "default",
+}
+
+
+def _unescape(match):
+    escape = match.group(1)
+    if escape[0] in "ux" and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return _ESCAPES.get(escape, escape)
+
+
+def tokenize(source: str) -> list:
+    """Split the source into (kind, value, line) tokens"""
+    tokens = []
+    line = 1
+    position = 0
+    length = len(source)
+    match = _TOKEN.match
+    while position < length:
+        if (
+            source[position] == "/"
+            and source[position + 1 : position + 2] not in ("/", "*")
+            and _regex_allowed(tokens)
+        ):
+            literal = _REGEX.match(source, position + 1)
+            if literal is None:
+                raise ExtendScriptError(
+                    f"Syntax error: unterminated regular expression on line {line}",
+                    "SyntaxError",
+                )
+            tokens.append(("regex", literal.groups(), line))
+            position = literal.end()
+            continue
+        token = match(source, position)
+        if token is None:
+            raise ExtendScriptError(
+                f"Syntax error: unexpected character {source[position]!r}",
+                "SyntaxError",
+            )
+        kind = token.lastgroup
+        text = token.group()
+        position = token.end()
+        if kind == "space":
+            continue
+        if kind == "newline":
+            line += 1
+            continue
+        if kind == "comment":
+            line += text.count("\n")
+            continue
+        if kind == "number":
+            value = int(text, 16) if text[:2].lower() == "0x" else float(text)
+            tokens.append(("number", normalise_number(value), line))
+        elif kind == "string":
+            tokens.append(("string", _ESCAPE.sub(_unescape, text[1:-1]), line))
+            line += text.count("\n")
+        elif kind == "name" and text in KEYWORDS:
+            tokens.append(("keyword", text, line))
+        else:
+            tokens.append((kind, text, line))
+    tokens.append(("end", None, line))
+    return tokens
+
+
+def _regex_allowed(tokens) -> bool:
+    """Whether a / starts a regular expression, which it does where an operand is expected"""
+    if not tokens:
+        return True
+    kind, value, _ = tokens[-1]
+    if kind in _OPERANDS:
+        return False
+    if kind == "keyword":
+        return value not in _OPERAND_KEYWORDS
+    return value not in _OPERAND_PUNCTUATORS
+
+
+# PARSER
+
+_BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "|": 3,
+    "^": 4,
+    "&": 5,
+    "==": 6,
+    "!=": 6,
+    "===": 6,
+    "!==": 6,
+    "<": 7,
+    ">": 7,
+    "<=": 7,
+    ">=": 7,
+    "instanceof": 7,
+    "in": 7,
+    "<<": 8,
+    ">>": 8,
+    ">>>": 8,
+    "+": 9,
+    "-": 9,
+    "*": 10,
+    "/": 10,
+    "%": 10,
+}
+_ASSIGNMENT = {
+    "=",
+    "+=",
+    "-=",
+    "*=",
+    "/=",
+    "%=",
+    "&=",
+    "|=",
+    "^=",
+    "<<=",
+    ">>=",
+    ">>>=",
+}
+
+
+class Parser(object):
+    """Builds a tree of tuples from the tokens, (node type, *children)"""
+
+    def __init__(self, source: str):
+        self.tokens = tokenize(source)
+        self.position = 0
+
+    # helpers
+
+    def peek(self, offset=0):
+        return self.tokens[self.position + offset]
+
+    def next(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def at(self, value, kind=None):
+        token = self.tokens[self.position]
+        return (
+            token[1] == value
+            and (kind is None or token[0] == kind)
+            and token[0] not in ("string", "number")
+        )
+
+    def accept(self, value):
+        if self.at(value):
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, value):
+        token = self.next()
+        if token[1] != value or token[0] in ("string", "number"):
+            raise ExtendScriptError(
+                f"Syntax error: expected {value!r} but found {token[1]!r} on line {token[2]}",
+                "SyntaxError",
+            )
+        return token
+
+    def identifier(self):
+        token = self.next()
+        if token[0] != "name":
+            raise ExtendScriptError(
+                f"Syntax error: expected a name but found {token[1]!r} on line {token[2]}",
+                "SyntaxError",
+            )
+        return token[1]
+
+    def end_statement(self):
+        self.accept(";")
+
+    # statements
+
+    def parse_program(self):
+        statements = []
+        while self.peek()[0] != "end":
+            statements.append(self.statement())
+        return ("block", statements)
+
+    def statement(self):
+        token = self.peek()
+        kind, value, line = token
+        if kind == "punctuator":
+            if value == "{":
+                return self.block()
+            if value == ";":
+                self.next()
+                return ("empty",)
+        if kind == "keyword":
+            if value == "var":
+                self.next()
+                node = self.var_declarations()
+                self.end_statement()
+                return node
+            if value == "if":
+                self.next()
+                self.expect("(")
+                test = self.expression()
+                self.expect(")")
+                consequent = self.statement()
+                alternate = self.statement() if self.accept("else") else None
+                return ("if", test, consequent, alternate)
+            if value == "for":
+                return self.for_statement()
+            if value == "while":
+                self.next()
+                self.expect("(")
+                test = self.expression()
+                self.expect(")")
+                return ("while", test, self.statement())
+            if value == "do":
+                self.next()
+                body = self.statement()
+                self.expect("while")
+                self.expect("(")
+                test = self.expression()
+                self.expect(")")
+                self.end_statement()
+                return ("dowhile", body, test)
+            if value == "function" and self.peek(1)[0] == "name":
+                self.next()
+                name = self.identifier()
+                return ("funcdecl", name, self.function_rest(name))
+            if value == "return":
+                self.next()
+                argument = None
+                if (
+                    not (self.at(";") or self.at("}") or self.peek()[0] == "end")
+                    and self.peek()[2] == line
+                ):
+                    argument = self.expression()
+                self.end_statement()
+                return ("return", argument)
+            if value in ("break", "continue"):
+                self.next()
+                self.end_statement()
+                return (value,)
+            if value == "throw":
+                self.next()
+                argument = self.expression()
+                self.end_statement()
+                return ("throw", argument, line)
+            if value == "try":
+                return self.try_statement()
+            if value == "switch":
+                return self.switch_statement()
+        expression = self.expression()
+        self.end_statement()
+        return ("expr", expression, line)
+
+    def block(self):
+        self.expect("{")
+        statements = []
+        while not self.at("}"):
+            if self.peek()[0] == "end":
+                raise ExtendScriptError("Syntax error: missing }", "SyntaxError")
+            statements.append(self.statement())
+        self.next()
+        return ("block", statements)
+
+    def var_declarations(self, allow_in=True):
+        declarations = []
+        while True:
+            name = self.identifier()
+            init = self.assignment(allow_in) if self.accept("=") else None
+            declarations.append((name, init))
+            if not self.accept(","):
+                return ("var", declarations)
+
+    def for_statement(self):
+        self.next()
+        self.expect("(")
+        init = None
+        if self.at("var"):
+            self.next()
+            if self.peek(1)[1] == "in" and self.peek(1)[0] == "keyword":
+                name = self.identifier()
+                self.expect("in")
+                subject = self.expression()
+                self.expect(")")
+                return ("forin", ("ident", name), subject, self.statement(), True)
+            init = self.var_declarations(allow_in=False)
+        elif not self.at(";"):
+            expression = self.expression(allow_in=False)
+            if self.accept("in"):
+                subject = self.expression()
+                self.expect(")")
+                return ("forin", expression, subject, self.statement(), False)
+            init = ("expr", expression, self.peek()[2])
+        self.expect(";")
+        test = None if self.at(";") else self.expression()
+        self.expect(";")
+        update = None if self.at(")") else self.expression()
+        self.expect(")")
+        return ("for", init, test, update, self.statement())
+
+    def try_statement(self):
+        self.next()
+        block = self.block()
+        parameter = handler = finalizer = None
+        if self.accept("catch"):
+            self.expect("(")
+            parameter = self.identifier()
+            self.expect(")")
+            handler = self.block()
+        if self.accept("finally"):
+            finalizer = self.block()
+        return ("try", block, parameter, handler, finalizer)
+
+    def switch_statement(self):
+        self.next()
+        self.expect("(")
+        discriminant = self.expression()
+        self.expect(")")
+        self.expect("{")
+        cases = []
+        while not self.accept("}"):
+            if self.accept("default"):
+                test = None
+            else:
+                self.expect("case")
+                test = self.expression()
+            self.expect(":")
+            statements = []
+            while not (self.at("case") or self.at("default") or self.at("}")):
+                if self.peek()[0] == "end":
+                    raise ExtendScriptError("Syntax error: missing }", "SyntaxError")
+                statements.append(self.statement())
+            cases.append((test, statements))
+        return ("switch", discriminant, cases)
+
+    def function_rest(self, name):
+        self.expect("(")
+        params = []
+        while not self.at(")"):
+            params.append(self.identifier())
+            if not self.accept(","):
+                break
+        self.expect(")")
+        body = self.block()
+        return (name, params, body)
+
+    # expressions
+
+    def expression(self, allow_in=True):
+        node = self.assignment(allow_in)
+        if self.at(","):
+            nodes = [node]
+            while self.accept(","):
+                nodes.append(self.assignment(allow_in))
+            return ("sequence", nodes)
+        return node
+
+    def assignment(self, allow_in=True):
+        target = self.conditional(allow_in)
+        token = self.peek()
+        if token[0] == "punctuator" and token[1] in _ASSIGNMENT:
+            self.next()
+            if target[0] not in ("ident", "member"):
+                raise ExtendScriptError(
+                    "Syntax error: invalid assignment target", "SyntaxError"
+                )
+            return ("assign", token[1], target, self.assignment(allow_in))
+        return target
+
+    def conditional(self, allow_in=True):
+        test = self.binary(0, allow_in)
+        if self.accept("?"):
+            consequent = self.assignment()
+            self.expect(":")
+            alternate = self.assignment(allow_in)
+            return ("conditional", test, consequent, alternate)
+        return test
+
+    def binary(self, minimum, allow_in=True):
+        left = self.unary()
+        while True:
+            kind, operator, _ = self.peek()
+            if kind not in ("punctuator", "keyword"):
+                return left
+            precedence = _BINARY_PRECEDENCE.get(operator)
+            if (
+                precedence is None
+                or precedence <= minimum
+                or (operator == "in" and not allow_in)
+            ):
+                return left
+            self.next()
+            right = self.binary(precedence, allow_in)
+            if operator in ("&&", "||"):
+                left = ("logical", operator, left, right)
+            else:
+                left = ("binary", operator, left, right)
+
+    def unary(self):
+        kind, value, _ = self.peek()
+        if kind in ("punctuator", "keyword") and value in (
+            "!",
+            "-",
+            "+",
+            "~",
+            "typeof",
+            "void",
+            "delete",
+        ):
+            self.next()
+            return ("unary", value, self.unary())
+        if kind == "punctuator" and value in ("++", "--"):
+            self.next()
+            return ("update", value, True, self.unary())
+        node = self.postfix()
+        return node
+
+    def postfix(self):
+        node = self.call()
+        kind, value, _ = self.peek()
+        if kind == "punctuator" and value in ("++", "--"):
+            self.next()
+            return ("update", value, False, node)
+        return node
+
+    def call(self):
+        if self.at("new", "keyword"):
+            self.next()
+            callee = self.member(self.primary(), allow_call=False)
+            args = self.arguments() if self.at("(") else []
+            node = ("new", callee, args)
+        else:
+            node = self.primary()
+        return self.member(node, allow_call=True)
+
+    def member(self, node, allow_call):
+        while True:
+            if self.accept("."):
+                token = self.next()
+                if token[0] not in ("name", "keyword"):
+                    raise ExtendScriptError(
+                        f"Syntax error: unexpected {token[1]!r} on line {token[2]}",
+                        "SyntaxError",
+                    )
+                node = ("member", node, ("literal", token[1]))
+            elif self.accept("["):
+                node = ("member", node, self.expression())
+                self.expect("]")
+            elif allow_call and self.at("("):
+                node = ("call", node, self.arguments())
+            else:
+                return node
+
+    def arguments(self):
+        self.expect("(")
+        args = []
+        while not self.at(")"):
+            args.append(self.assignment())
+            if not self.accept(","):
+                break
+        self.expect(")")
+        return args
+
+    def primary(self):
+        kind, value, line = self.next()
+        if kind in ("number", "string"):
+            return ("literal", value)
+        if kind == "regex":
+            return ("regex", *value)
+        if kind == "name":
+            return ("ident", value)
+        if kind == "keyword":
+            if value == "true":
+                return ("literal", True)
+            if value == "false":
+                return ("literal", False)
+            if value == "null":
+                return ("literal", None)
+            if value == "this":
+                return ("this",)
+            if value == "function":
+                name = self.identifier() if self.peek()[0] == "name" else None
+                return ("function", self.function_rest(name))
+        if kind == "punctuator":
+            if value == "(":
+                node = self.expression()
+                self.expect(")")
+                return node
+            if value == "[":
+                elements = []
+                while not self.at("]"):
+                    if self.at(","):
+                        self.next()
+                        elements.append(("literal", UNDEFINED))
+                        continue
+                    elements.append(self.assignment())
+                    if not self.accept(","):
+                        break
+                self.expect("]")
+                return ("array", elements)
+            if value == "{":
+                properties = []
+                while not self.at("}"):
+                    key_kind, key, _ = self.next()
+                    if key_kind == "number":
+                        key = number_to_string(key)
+                    self.expect(":")
+                    properties.append((key, self.assignment()))
+                    if not self.accept(","):
+                        break
+                self.expect("}")
+                return ("object", properties)
+        raise ExtendScriptError(
+            f"Syntax error: unexpected {value!r} on line {line}", "SyntaxError"
+        )
+
+
+# EVALUATION
+
+
+class Scope(object):
+    __slots__ = ("variables", "parent", "this")
+
+    def __init__(self, parent=None, this=None):
+        self.variables = {}
+        self.parent = parent
+        self.this = this if this is not None else (parent.this if parent else None)
+
+    def find(self, name):
+        scope = self
+        while scope is not None:
+            if name in scope.variables:
+                return scope
+            scope = scope.parent
+        return None
+
+
+class Interpreter(object):
+    """Evaluates ExtendScript source against a dictionary of global values"""
+
+    def __init__(self, global_values: dict = None, cache_size: int = 256):
+        self.globals = Scope()
+        self.globals.variables.update(_BUILTINS)
+        self.globals.variables["Function"] = _Callable(
+            self.compile_function,
+            members={"type_name": "Function", "prototype": JSObject()},
+        )
+        self.globals.variables["eval"] = self.eval
+        self.globals.variables.update(global_values or {})
+        self.cache_size = cache_size
+        self._cache = {}
+        self._statements = {
+            "block": self.exec_block,
+            "var": self.exec_var,
+            "expr": self.exec_expression,
+            "if": self.exec_if,
+            "for": self.exec_for,
+            "forin": self.exec_for_in,
+            "while": self.exec_while,
+            "dowhile": self.exec_do_while,
+            "return": self.exec_return,
+            "break": self.exec_break,
+            "continue": self.exec_continue,
+            "throw": self.exec_throw,
+            "try": self.exec_try,
+            "switch": self.exec_switch,
+            "funcdecl": self.exec_function_declaration,
+            "empty": lambda node, scope: _EMPTY,
+        }
+        self._expressions = {
+            "literal": lambda node, scope: node[1],
+            "ident": self.eval_identifier,
+            "this": lambda node, scope: (
+                scope.this if scope.this is not None else UNDEFINED
+            ),
+            "member": self.eval_member,
+            "call": self.eval_call,
+            "new": self.eval_new,
+            "unary": self.eval_unary,
+            "update": self.eval_update,
+            "binary": self.eval_binary,
+            "logical": self.eval_logical,
+            "conditional": self.eval_conditional,
+            "assign": self.eval_assign,
+            "sequence": self.eval_sequence,
+            "array": lambda node, scope: [
+                self.evaluate(item, scope) for item in node[1]
+            ],
+            "object": lambda node, scope: JSObject(
+                (key, self.evaluate(value, scope)) for key, value in node[1]
+            ),
+            "function": lambda node, scope: JSFunction(self, *node[1], scope),
+            "regex": lambda node, scope: JSRegExp(node[1], node[2]),
+        }
+
+    def define(self, name, value):
+        self.globals.variables[name] = value
+
+    def parse(self, source: str):
+        """Parse the source, keeping the most recent programs to skip parsing repeated scripts"""
+        program = self._cache.get(source)
+        if program is None:
+            program = Parser(source).parse_program()
+            if len(self._cache) >= self.cache_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[source] = program
+        return program
+
+    def run(self, source: str):
+        """Run the source and return the completion value, as eval() would"""
+        program = self.parse(source)
+        self.hoist(program[1], self.globals)
+        try:
+            value = self.exec_block(program, self.globals)
+        except JSThrow:
+            raise
+        except _ControlFlow:
+            raise JSThrow(JSError("Illegal statement", "SyntaxError"))
+        except Exception as error:
+            raise JSThrow(thrown_value(error))
+        return UNDEFINED if value is _EMPTY else value
+
+    def eval(self, source=UNDEFINED):
+        """The global eval, which runs code in the global scope"""
+        if not isinstance(source, str):
+            return source
+        return self.run(source)
+
+    def compile_function(self, *args):
+        """The Function constructor, parameter names first and the body last"""
+        params = ",".join(to_string(arg) for arg in args[:-1])
+        body = to_string(args[-1]) if args else ""
+        program = self.parse(f"(function anonymous({params}){{\n{body}\n}})")
+        return self.evaluate(program[1][0][1], self.globals)
+
+    def hoist(self, statements, scope):
+        for statement in statements:
+            if statement[0] == "funcdecl":
+                name, params, body = statement[2]
+                scope.variables[statement[1]] = JSFunction(
+                    self, name, params, body, scope
+                )
+
+    # statements
+
+    def execute(self, node, scope):
+        return self._statements[node[0]](node, scope)
+
+    def exec_block(self, node, scope):
+        value = _EMPTY
+        for statement in node[1]:
+            result = self._statements[statement[0]](statement, scope)
+            if result is not _EMPTY:
+                value = result
+        return value
+
+    def exec_var(self, node, scope):
+        function_scope = scope
+        for name, init in node[1]:
+            if init is not None:
+                function_scope.variables[name] = self.evaluate(init, scope)
+            elif name not in function_scope.variables:
+                function_scope.variables[name] = UNDEFINED
+        return _EMPTY
+
+    def exec_expression(self, node, scope):
+        try:
+            return self.evaluate(node[1], scope)
+        except (JSThrow, _ControlFlow):
+            raise
+        except Exception as error:
+            raise JSThrow(thrown_value(error, node[2]))
+
+    def exec_if(self, node, scope):
+        if truthy(self.evaluate(node[1], scope)):
+            return self.execute(node[2], scope)
+        if node[3] is not None:
+            return self.execute(node[3], scope)
+        return _EMPTY
+
+    def _loop_body(self, body, scope):
+        try:
+            return self.execute(body, scope), False
+        except _Break:
+            return _EMPTY, True
+        except _Continue:
+            return _EMPTY, False
+
+    def exec_for(self, node, scope):
+        _, init, test, update, body = node
+        value = _EMPTY
+        if init is not None:
+            self.execute(init, scope)
+        while test is None or truthy(self.evaluate(test, scope)):
+            result, stop = self._loop_body(body, scope)
+            if result is not _EMPTY:
+                value = result
+            if stop:
+                break
+            if update is not None:
+                self.evaluate(update, scope)
+        return value
+
+    def exec_for_in(self, node, scope):
+        _, target, subject, body, _ = node
+        subject = self.evaluate(subject, scope)
+        value = _EMPTY
+        for key in object_keys(subject):
+            self.assign(target, key, scope)
+            result, stop = self._loop_body(body, scope)
+            if result is not _EMPTY:
+                value = result
+            if stop:
+                break
+        return value
+
+    def exec_while(self, node, scope):
+        value = _EMPTY
+        while truthy(self.evaluate(node[1], scope)):
+            result, stop = self._loop_body(node[2], scope)
+            if result is not _EMPTY:
+                value = result
+            if stop:
+                break
+        return value
+
+    def exec_do_while(self, node, scope):
+        value = _EMPTY
+        while True:
+            result, stop = self._loop_body(node[1], scope)
+            if result is not _EMPTY:
+                value = result
+            if stop or not truthy(self.evaluate(node[2], scope)):
+                return value
+
+    def exec_return(self, node, scope):
+        raise _Return(UNDEFINED if node[1] is None else self.evaluate(node[1], scope))
+
+    def exec_break(self, node, scope):
+        raise _Break()
+
+    def exec_continue(self, node, scope):
+        raise _Continue()
+
+    def exec_throw(self, node, scope):
+        raise JSThrow(self.evaluate(node[1], scope))
+
+    def exec_try(self, node, scope):
+        _, block, parameter, handler, finalizer = node
+        try:
+            try:
+                return self.execute(block, scope)
+            except _ControlFlow:
+                raise
+            except Exception as error:
+                if handler is None:
+                    raise
+                thrown = thrown_value(error)
+            catch_scope = Scope(scope)
+            catch_scope.variables[parameter] = thrown
+            # variables declared in the catch block belong to the enclosing function
+            return self.exec_catch(handler, catch_scope, scope)
+        finally:
+            if finalizer is not None:
+                self.execute(finalizer, scope)
+
+    def exec_switch(self, node, scope):
+        _, discriminant, cases = node
+        value = self.evaluate(discriminant, scope)
+        start = None
+        for index, (test, _) in enumerate(cases):
+            if test is not None and strict_equals(self.evaluate(test, scope), value):
+                start = index
+                break
+        if start is None:
+            start = next(
+                (index for index, (test, _) in enumerate(cases) if test is None),
+                len(cases),
+            )
+        result = _EMPTY
+        try:
+            for _, statements in cases[start:]:
+                for statement in statements:
+                    completion = self.execute(statement, scope)
+                    if completion is not _EMPTY:
+                        result = completion
+        except _Break:
+            pass
+        return result
+
+    def exec_catch(self, handler, catch_scope, scope):
+        value = _EMPTY
+        for statement in handler[1]:
+            if statement[0] == "var":
+                for name, init in statement[1]:
+                    scope.variables[name] = (
+                        self.evaluate(init, catch_scope)
+                        if init is not None
+                        else scope.variables.get(name, UNDEFINED)
+                    )
+                continue
+            result = self.execute(statement, catch_scope)
+            if result is not _EMPTY:
+                value = result
+        return value
+
+    def exec_function_declaration(self, node, scope):
+        if node[1] not in scope.variables:
+            name, params, body = node[2]
+            scope.variables[node[1]] = JSFunction(self, name, params, body, scope)
+        return _EMPTY
+
+    def call_function(self, function, args, this=None):
+        scope = Scope(function.scope, this)
+        for index, param in enumerate(function.params):
+            scope.variables[param] = args[index] if index < len(args) else UNDEFINED
+        scope.variables["arguments"] = list(args)
+        self.hoist(function.body[1], scope)
+        try:
+            self.exec_block(function.body, scope)
+        except _Return as result:
+            return result.value
+        return UNDEFINED
+
+    # expressions
+
+    def evaluate(self, node, scope):
+        return self._expressions[node[0]](node, scope)
+
+    def eval_identifier(self, node, scope):
+        name = node[1]
+        while scope is not None:
+            variables = scope.variables
+            if name in variables:
+                return variables[name]
+            scope = scope.parent
+        raise ExtendScriptError(f"{name} is undefined", "ReferenceError")
+
+    def eval_member(self, node, scope):
+        target = self.evaluate(node[1], scope)
+        key = node[2][1] if node[2][0] == "literal" else self.evaluate(node[2], scope)
+        if isinstance(key, float):
+            key = normalise_number(key)
+        return get_member(target, key)
+
+    def eval_call(self, node, scope):
+        callee_node = node[1]
+        this = None
+        if callee_node[0] == "member":
+            this = self.evaluate(callee_node[1], scope)
+            key = (
+                callee_node[2][1]
+                if callee_node[2][0] == "literal"
+                else self.evaluate(callee_node[2], scope)
+            )
+            function = get_member(this, key)
+        else:
+            function = self.evaluate(callee_node, scope)
+        args = [self.evaluate(arg, scope) for arg in node[2]]
+        if isinstance(function, JSFunction):
+            return self.call_function(function, args, this)
+        if (
+            not callable(function)
+            or hasattr(function, "js_get")
+            and not hasattr(function, "js_call")
+        ):
+            raise ExtendScriptError(
+                f"{_describe(callee_node)} is not a function", "TypeError"
+            )
+        if hasattr(function, "js_call"):
+            return function.js_call(*args)
+        return function(*args)
+
+    def eval_new(self, node, scope):
+        constructor = self.evaluate(node[1], scope)
+        args = [self.evaluate(arg, scope) for arg in node[2]]
+        if isinstance(constructor, JSFunction):
+            instance = JSObject()
+            result = self.call_function(constructor, args, instance)
+            return (
+                result
+                if type_of(result) == "object" and result is not None
+                else instance
+            )
+        if hasattr(constructor, "js_new"):
+            return constructor.js_new(*args)
+        if callable(constructor):
+            return constructor(*args)
+        raise ExtendScriptError(
+            f"{_describe(node[1])} is not a constructor", "TypeError"
+        )
+
+    def eval_unary(self, node, scope):
+        operator = node[1]
+        if operator == "typeof":
+            if node[2][0] == "ident" and scope.find(node[2][1]) is None:
+                return "undefined"
+            return type_of(self.evaluate(node[2], scope))
+        if operator == "delete":
+            if node[2][0] == "member":
+                target = self.evaluate(node[2][1], scope)
+                key = self._member_key(node[2], scope)
+                if isinstance(target, dict):
+                    target.pop(to_string(key), None)
+                elif hasattr(target, "js_delete"):
+                    target.js_delete(to_string(key))
+            return True
+        value = self.evaluate(node[2], scope)
+        if operator == "!":
+            return not truthy(value)
+        if operator == "-":
+            return normalise_number(-to_number(value))
+        if operator == "+":
+            return to_number(value)
+        if operator == "~":
+            return ~to_int32(value)
+        return UNDEFINED
+
+    def _member_key(self, node, scope):
+        return node[2][1] if node[2][0] == "literal" else self.evaluate(node[2], scope)
+
+    def eval_update(self, node, scope):
+        _, operator, prefix, target = node
+        old = to_number(self.evaluate(target, scope))
+        new = old + 1 if operator == "++" else old - 1
+        self.assign(target, new, scope)
+        return new if prefix else old
+
+    def eval_binary(self, node, scope):
+        left = self.evaluate(node[2], scope)
+        right = self.evaluate(node[3], scope)
+        left_type = type(left)
+        if left_type is type(
+            right
+        ):  # numbers and strings compared or added to their kind, the bulk of loops
+            if left_type is int or left_type is float:
+                operation = _NUMBER_OPERATIONS.get(node[1])
+                if operation is not None:
+                    return operation(left, right)
+            elif left_type is str:
+                operation = _STRING_OPERATIONS.get(node[1])
+                if operation is not None:
+                    return operation(left, right)
+        return binary_operation(node[1], left, right)
+
+    def eval_logical(self, node, scope):
+        left = self.evaluate(node[2], scope)
+        if node[1] == "&&":
+            return self.evaluate(node[3], scope) if truthy(left) else left
+        return left if truthy(left) else self.evaluate(node[3], scope)
+
+    def eval_conditional(self, node, scope):
+        if truthy(self.evaluate(node[1], scope)):
+            return self.evaluate(node[2], scope)
+        return self.evaluate(node[3], scope)
+
+    def eval_assign(self, node, scope):
+        _, operator, target, value_node = node
+        if operator == "=":
+            value = self.evaluate(value_node, scope)
+        else:
+            value = binary_operation(
+                operator[:-1],
+                self.evaluate(target, scope),
+                self.evaluate(value_node, scope),
+            )
+        self.assign(target, value, scope)
+        return value
+
+    def assign(self, target, value, scope):
+        if target[0] == "ident":
+            found = scope.find(target[1])
+            (found or self.globals).variables[target[1]] = value
+        elif target[0] == "member":
+            set_member(
+                self.evaluate(target[1], scope), self._member_key(target, scope), value
+            )
+        else:
+            raise ExtendScriptError("Invalid assignment target", "ReferenceError")
+
+    def eval_sequence(self, node, scope):
+        value = UNDEFINED
+        for item in node[1]:
+            value = self.evaluate(item, scope)
+        return value
+
+
+_COMPARISONS = {
+    "===": _operator.eq,
+    "!==": _operator.ne,
+    "==": _operator.eq,
+    "!=": _operator.ne,
+    "<": _operator.lt,
+    ">": _operator.gt,
+    "<=": _operator.le,
+    ">=": _operator.ge,
+}
+_NUMBER_OPERATIONS = dict(
+    _COMPARISONS,
+    **{
+        "+": lambda left, right: normalise_number(left + right),
+        "-": lambda left, right: normalise_number(left - right),
+        "*": lambda left, right: normalise_number(left * right),
+    },
+)
+_STRING_OPERATIONS = dict(_COMPARISONS, **{"+": _operator.add})
+
+
+def binary_operation(operator, left, right):
+    if operator == "+":
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            return normalise_number(left + right)
+        left, right = to_primitive(left), to_primitive(right)
+        if isinstance(left, str) or isinstance(right, str):
+            return to_string(left) + to_string(right)
+        return normalise_number(to_number(left) + to_number(right))
+    if operator == "===":
+        return strict_equals(left, right)
+    if operator == "!==":
+        return not strict_equals(left, right)
+    if operator == "==":
+        return loose_equals(left, right)
+    if operator == "!=":
+        return not loose_equals(left, right)
+    if operator in ("<", ">", "<=", ">="):
+        left, right = to_primitive(left), to_primitive(right)
+        if not (isinstance(left, str) and isinstance(right, str)):
+            left, right = to_number(left), to_number(right)
+            if left != left or right != right:
+                return False
+        if operator == "<":
+            return left < right
+        if operator == ">":
+            return left > right
+        if operator == "<=":
+            return left <= right
+        return left >= right
+    if operator == "in":
+        if isinstance(right, list):
+            return 0 <= to_number(left) < len(right)
+        if isinstance(right, dict):
+            return to_string(left) in right
+        return get_member(right, to_string(left)) is not UNDEFINED
+    if operator == "instanceof":
+        if type_of(left) != "object" or left is None:
+            return False
+        if isinstance(right, _Callable):
+            return reflect_name(left) == right.members.get("type_name")
+        return reflect_name(left) == getattr(right, "type_name", None)
+    if operator in ("&", "|", "^", "<<", ">>", ">>>"):
+        left, right = to_int32(left), to_int32(right)
+        if operator == "&":
+            return left & right
+        if operator == "|":
+            return to_int32(left | right)
+        if operator == "^":
+            return to_int32(left ^ right)
+        if operator == "<<":
+            return to_int32(left << (right & 31))
+        if operator == ">>":
+            return left >> (right & 31)
+        return (left & 0xFFFFFFFF) >> (right & 31)
+    left, right = to_number(left), to_number(right)
+    if operator == "-":
+        return normalise_number(left - right)
+    if operator == "*":
+        return normalise_number(left * right)
+    if operator == "/":
+        if right == 0:
+            if left == 0 or left != left:
+                return math.nan
+            return math.copysign(math.inf, left) * math.copysign(1, right)
+        return normalise_number(left / right)
+    if operator == "%":
+        if right == 0 or left != left or right != right:
+            return math.nan
+        return normalise_number(math.fmod(left, right))
+    raise ExtendScriptError(f"Unknown operator {operator}", "SyntaxError")
+
+
+def _describe(node) -> str:
+    if node[0] == "ident":
+        return node[1]
+    if node[0] == "member" and node[2][0] == "literal":
+        return f"{_describe(node[1])}.{node[2][1]}"
+    return "expression"
+
+
+# GLOBALS
+
+
+class _Callable(object):
+    """A built in function which can also be used with new, members holds its name (type_name) and prototype"""
+
+    type_name = "Function"
+
+    def __init__(self, function, constructor=None, members=None):
+        self.function = function
+        self.constructor = constructor or function
+        self.members = members or {}
+
+    def js_call(self, *args):
+        return self.function(*args)
+
+    def __call__(self, *args):
+        return self.function(*args)
+
+    def js_new(self, *args):
+        return self.constructor(*args)
+
+    def js_get(self, name):
+        if name in self.members:
+            return self.members[name]
+        if name == "name":
+            return self.members.get("type_name", "")
+        if name == "apply":
+            return lambda this=UNDEFINED, args=UNDEFINED: self.function(
+                *_apply_arguments(args)
+            )
+        if name == "call":
+            return lambda this=UNDEFINED, *args: self.function(*args)
+        return UNDEFINED
+
+    def js_set(self, name, value):
+        self.members[name] = value
+
+
+class _Method(object):
+    """A built in method read from a prototype, such as Object.prototype.toString, run on the this given to call or apply"""
+
+    type_name = "Function"
+
+    def __init__(self, function):
+        self.function = function
+
+    def js_call(self, *args):
+        return self.function(UNDEFINED, *args)
+
+    def __call__(self, *args):
+        return self.function(UNDEFINED, *args)
+
+    def js_get(self, name):
+        if name == "apply":
+            return lambda this=UNDEFINED, args=UNDEFINED: self.function(
+                this, *_apply_arguments(args)
+            )
+        if name == "call":
+            return lambda this=UNDEFINED, *args: self.function(this, *args)
+        return UNDEFINED
+
+
+def _apply_arguments(args) -> list:
+    return [] if args is UNDEFINED or args is None else list(args)
+
+
+def _prototype(*methods) -> JSObject:
+    prototype = JSObject()
+    for table in methods:
+        prototype.update((name, _Method(method)) for name, method in table.items())
+    return prototype
+
+
+def _parse_int(value, radix=10):
+    match = re.match(r"\s*([+-]?)(0[xX])?([0-9a-zA-Z]+)", to_string(value))
+    if not match:
+        return math.nan
+    sign, prefix, digits = match.groups()
+    radix = 16 if prefix else int(to_number(radix) or 10)
+    result = ""
+    for digit in digits:
+        if int(digit, 36) >= radix:
+            break
+        result += digit
+    if not result:
+        return math.nan
+    return int(sign + result, radix)
+
+
+def _parse_float(value):
+    match = re.match(
+        r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)", to_string(value)
+    )
+    return normalise_number(float(match.group(1))) if match else math.nan
+
+
+def _math_round(value):
+    return math.floor(to_number(value) + 0.5)
+
+
+_MATH = JSObject(
+    {
+        "floor": lambda value: normalise_number(math.floor(to_number(value))),
+        "ceil": lambda value: normalise_number(math.ceil(to_number(value))),
+        "round": _math_round,
+        "abs": lambda value: abs(to_number(value)),
+        "sqrt": lambda value: normalise_number(math.sqrt(to_number(value))),
+        "pow": lambda base, exponent: normalise_number(
+            math.pow(to_number(base), to_number(exponent))
+        ),
+        "min": lambda *values: min(
+            (to_number(value) for value in values), default=math.inf
+        ),
+        "max": lambda *values: max(
+            (to_number(value) for value in values), default=-math.inf
+        ),
+        "random": lambda: __import__("random").random(),
+        "PI": math.pi,
+    }
+)
+
+
+def _object_to_string(this):
+    """Object.prototype.toString, which json2 uses to tell arrays from objects"""
+    if this is UNDEFINED or this is None:
+        return "[object Object]"
+    return f"[object {reflect_name(this)}]"
+
+
+def _unsupported(feature, *args):
+    raise ExtendScriptError(f"{feature} are not supported by the fake After Effects")
+
+
+def _array_constructor(*args):
+    if (
+        len(args) == 1
+        and isinstance(args[0], (int, float))
+        and not isinstance(args[0], bool)
+    ):
+        return [UNDEFINED] * int(args[0])
+    return list(args)
+
+
+_BUILTINS = {
+    "undefined": UNDEFINED,
+    "NaN": math.nan,
+    "Infinity": math.inf,
+    "Math": _MATH,
+    "parseInt": _parse_int,
+    "parseFloat": _parse_float,
+    "isNaN": lambda value: to_number(value) != to_number(value),
+    "isFinite": lambda value: to_number(value) not in (math.inf, -math.inf, math.nan)
+    and to_number(value) == to_number(value),
+    "String": _Callable(
+        lambda value="": to_string(value),
+        members={"type_name": "String", "prototype": _prototype(_STRING_METHODS)},
+    ),
+    "Number": _Callable(
+        lambda value=0: to_number(value),
+        members={"type_name": "Number", "prototype": _prototype(_NUMBER_METHODS)},
+    ),
+    "Boolean": _Callable(
+        lambda value=False: truthy(value),
+        members={"type_name": "Boolean", "prototype": _prototype(_BOOLEAN_METHODS)},
+    ),
+    "Array": _Callable(
+        _array_constructor,
+        members={"type_name": "Array", "prototype": _prototype(_ARRAY_METHODS)},
+    ),
+    "Object": _Callable(
+        lambda: JSObject(),
+        members={
+            "type_name": "Object",
+            "prototype": _prototype(_OBJECT_METHODS, {"toString": _object_to_string}),
+        },
+    ),
+    "RegExp": _Callable(
+        lambda source="", flags="": JSRegExp(to_string(source), to_string(flags)),
+        members={"type_name": "RegExp", "prototype": _prototype(_REGEXP_METHODS)},
+    ),
+    "Date": _Callable(
+        functools.partial(_unsupported, "Date objects"),
+        members={"type_name": "Date", "prototype": JSObject()},
+    ),
+    "Error": _Callable(
+        lambda message="": JSError(to_string(message)),
+        members={"type_name": "Error", "prototype": _prototype(_OBJECT_METHODS)},
+    ),
+    "SyntaxError": _Callable(
+        lambda message="": JSError(to_string(message), "SyntaxError"),
+        members={"name": "SyntaxError"},
+    ),
+    "TypeError": _Callable(
+        lambda message="": JSError(to_string(message), "TypeError"),
+        members={"name": "TypeError"},
+    ),
+}
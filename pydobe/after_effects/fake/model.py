@@ -0,0 +1,1677 @@
+"""Python stand-ins for the After Effects scripting objects
+
+Attributes and methods use the ExtendScript (camelCase) names so the interpreter can expose them as
+they are. Only the state pydobe reads and writes is modelled, rendering and pixels are not.
+"""
+
+import contextvars
+import os
+import uuid
+from types import MethodType
+
+from pydobe.after_effects.fake.interpreter import (
+    UNDEFINED,
+    ExtendScriptError,
+    JSObject,
+    to_number,
+)
+
+UNDO_COMMAND = 16  # app.executeCommand id of Edit > Undo
+CALLED = object()  # journaled in place of the previous value when a method is called
+
+# application of the script being evaluated, which journals the attributes set within undo groups
+active_application = contextvars.ContextVar("active_application", default=None)
+
+
+class ModelObject(object):
+    """Base of every fake After Effects object"""
+
+    type_name = "Object"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "type_name" not in cls.__dict__:
+            cls.type_name = cls.__name__
+
+    def js_get(self, name):
+        if "_" in name:  # python side helpers, scripting attributes are camelCase
+            return UNDEFINED
+        value = getattr(self, name, UNDEFINED)
+        if type(value) is MethodType:
+            # the changes made by methods are not journaled, only that one was called
+            app = active_application.get()
+            if app is not None and app is not self:
+                app.journal(self, name, CALLED)
+        return value
+
+    def js_set(self, name, value):
+        if "_" in name:
+            raise ExtendScriptError(f'Unable to set "{name}"')
+        app = active_application.get()
+        previous = getattr(self, name, UNDEFINED)
+        try:
+            setattr(self, name, value)
+        except AttributeError:
+            raise ExtendScriptError(f'Unable to set "{name}" as it is read only')
+        if app is not None:
+            app.journal(self, name, previous)
+
+    def js_keys(self) -> list:
+        """Names listed by reflect.properties"""
+        names = [name for name in vars(self) if "_" not in name]
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if (
+                    isinstance(value, property)
+                    and "_" not in name
+                    and name not in names
+                ):
+                    names.append(name)
+        return names
+
+    def to_string(self):
+        return f"[object {self.type_name}]"
+
+
+def _enumeration(*names, start):
+    return JSObject((name, start + index) for index, name in enumerate(names))
+
+
+ENUMERATIONS = {
+    "CloseOptions": _enumeration(
+        "DO_NOT_SAVE_CHANGES", "PROMPT_TO_SAVE_CHANGES", "SAVE_CHANGES", start=1212
+    ),
+    "PulldownMethod": _enumeration("PULLDOWN_3_2", "ADVANCE_24P", start=3612),
+    "ImportAsType": _enumeration(
+        "COMP_CROPPED_LAYERS", "FOOTAGE", "COMP", "PROJECT", start=3812
+    ),
+    "TimeDisplayType": JSObject(TIMECODE=2012, FRAMES=2013),
+    "PropertyType": _enumeration(
+        "PROPERTY", "INDEXED_GROUP", "NAMED_GROUP", start=6212
+    ),
+}
+
+TIMECODE = 2012
+FRAMES = 2013
+VIDEO_EXTENSIONS = (".mov", ".mp4", ".avi", ".mxf", ".m4v", ".webm")
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".aif", ".aiff")
+PROJECT_EXTENSIONS = (".aep", ".aepx")
+
+
+# FILES
+
+
+class File(ModelObject):
+    def __init__(self, path=""):
+        self._path = str(path).replace("\\", "/")
+
+    @property
+    def fsName(self):
+        return os.path.normpath(self._path) if self._path else ""
+
+    @property
+    def fullName(self):
+        return self._path
+
+    @property
+    def absoluteURI(self):
+        return self._path
+
+    @property
+    def name(self):
+        return self._path.rstrip("/").rsplit("/", 1)[-1]
+
+    @property
+    def displayName(self):
+        return self.name
+
+    @property
+    def path(self):
+        return self._path.rstrip("/").rsplit("/", 1)[0] if "/" in self._path else ""
+
+    @property
+    def parent(self):
+        return Folder(self.path)
+
+    @property
+    def exists(self):
+        return os.path.exists(self.fsName)
+
+    def to_string(self):
+        return self._path
+
+
+class Folder(File):
+    @property
+    def parent(self):
+        return Folder(self.path)
+
+    def getFiles(self, mask="*"):
+        if not os.path.isdir(self.fsName):
+            return []
+        return [
+            File(os.path.join(self.fsName, name))
+            for name in sorted(os.listdir(self.fsName))
+        ]
+
+
+class ImportOptions(ModelObject):
+    def __init__(self, file=UNDEFINED):
+        self.file = None if file is UNDEFINED else file
+        self.sequence = False
+        self.forceAlphabetical = False
+        self.importAs = ENUMERATIONS["ImportAsType"]["FOOTAGE"]
+        self.rangeStart = 0
+        self.rangeEnd = 0
+
+    def canImportAs(self, import_as):
+        return import_as == ENUMERATIONS["ImportAsType"]["FOOTAGE"]
+
+    def isFileNameNumbered(self, file=UNDEFINED):
+        file = self.file if file is UNDEFINED else file
+        return _sequence_pattern(file.name) is not None
+
+
+# APPLICATION
+
+
+class Application(ModelObject):
+    """The app object
+
+    With require_existing_files, importing files which are not on disk fails as it does in After Effects,
+    otherwise any path can be imported, which is convenient to build large projects for load tests.
+    """
+
+    def __init__(self, require_existing_files: bool = False):
+        self.version = "23.0x53"
+        self.buildName = "pydobe fake"
+        self.language = 0
+        self.isRenderEngine = False
+        self.availableGPUAccelTypes = [1816]
+        self.commands = []  # ids passed to executeCommand
+        # not an After Effects attribute, set by begin/endSuppressDialogs
+        self.dialogsSuppressed = False
+        self._require_existing_files = require_existing_files
+        self._next_id = 1
+        self._undo_groups = []
+        # attributes set and methods called in the open undo group, as (object, name, previous value or CALLED)
+        self._undo_journal = None
+        # (name, journal) of the closed undo groups, undone by executeCommand(UNDO_COMMAND)
+        self.undo_stack = []
+        # projects saved during the session by path, open() loads them back
+        self.saved_projects = {}
+        self.project = Project(self)
+
+    def new_id(self):
+        identifier = self._next_id
+        self._next_id += 1
+        return identifier
+
+    def newProject(self):
+        self.project = Project(self)
+        return self.project
+
+    def open(self, file=UNDEFINED):
+        if file is UNDEFINED or file is None:
+            return None
+        project = self.saved_projects.get(file.fsName)
+        if project is None:
+            if self._require_existing_files and not file.exists:
+                raise ExtendScriptError(
+                    f'Unable to open "{file.fsName}", the file does not exist'
+                )
+            project = Project(self)
+            project.file = file
+        self.project = project
+        return project
+
+    def executeCommand(self, command_id):
+        command_id = int(to_number(command_id))
+        self.commands.append(command_id)
+        if command_id == UNDO_COMMAND and self.undo_stack:
+            self.undo()
+
+    def undo(self):
+        """Revert the attributes set in the last undo group, changes made by methods are not journaled"""
+        name, journal = self.undo_stack.pop()
+        for target, attribute, previous in reversed(journal):
+            if previous is CALLED:
+                continue
+            if previous is UNDEFINED:
+                delattr(target, attribute)
+            else:
+                setattr(target, attribute, previous)
+
+    def findMenuCommandId(self, name):
+        return 0
+
+    def notify_status_changed(self, item):
+        """Called when the status of a render queue item changes"""
+        if item.onStatusChanged is not None:
+            item.onStatusChanged()
+
+    def journal(self, target, name, previous):
+        if self._undo_journal is not None:
+            self._undo_journal.append((target, name, previous))
+
+    def beginUndoGroup(self, name=""):
+        if not self._undo_groups:
+            self._undo_journal = []
+        self._undo_groups.append(name)
+
+    def endUndoGroup(self):
+        if self._undo_groups:
+            name = self._undo_groups.pop()
+            if not self._undo_groups:  # nested groups are part of the outermost one
+                # as in After Effects, a group in which nothing happened is no undo step
+                if self._undo_journal:
+                    self.undo_stack.append((name, self._undo_journal))
+                self._undo_journal = None
+
+    def beginSuppressDialogs(self):
+        self.dialogsSuppressed = True
+
+    def endSuppressDialogs(self, alert=True):
+        self.dialogsSuppressed = False
+
+    def purge(self, target=UNDEFINED):
+        pass
+
+    def quit(self):
+        pass
+
+
+class Project(ModelObject):
+    def __init__(self, app):
+        self._app = app
+        self._items = []
+        self._items_by_id = {}
+        self.rootFolder = FolderItem(self, "Root", None)
+        self.file = None
+        self.dirty = False
+        self.revision = 1
+        self.bitsPerChannel = 8
+        self.compensateForSceneReferredProfiles = True
+        self.displayStartFrame = 0
+        self.expressionEngine = "javascript-1.0"
+        self.feetFramesFilmType = 2413
+        self.footageTimecodeDisplayStartType = 2212
+        self.framesCountType = 2612
+        self.framesUseFeetFrames = False
+        self.gpuAccelType = 1816
+        self.linearBlending = False
+        self.linearizeWorkingSpace = False
+        self.timeDisplayType = TIMECODE
+        self.toolType = 9012
+        self.transparencyGridThumbnails = False
+        self.workingGamma = 2.4
+        self.workingSpace = "None"
+        self.xmpPacket = (
+            '<?xpacket begin="" id="W5M0MpCehiHzreSzNTczkc9d"?>'
+            '<x:xmpmeta xmlns:x="adobe:ns:meta/"></x:xmpmeta><?xpacket end="w"?>'
+        )
+        self.renderQueue = RenderQueue(self)
+        self.defaultImportFolder = None
+        self.windowShown = True
+
+    # items bookkeeping
+
+    def add_item(self, item, folder=None):
+        folder = folder or self.rootFolder
+        item._parent = folder
+        folder._children.append(item)
+        self._items.append(item)
+        self._items_by_id[item.id] = item
+        self.touch()
+        return item
+
+    def remove_item(self, item):
+        if item in self._items:
+            self._items.remove(item)
+            self._items_by_id.pop(item.id, None)
+            item._parent._children.remove(item)
+            self.touch()
+
+    def touch(self):
+        self.dirty = True
+        self.revision += 1
+
+    @property
+    def items(self):
+        return ItemCollection(self, None)
+
+    @property
+    def numItems(self):
+        return len(self._items)
+
+    @property
+    def activeItem(self):
+        selection = self.selection
+        return selection[0] if len(selection) == 1 else None
+
+    @property
+    def selection(self):
+        return [item for item in self._items if item.selected]
+
+    def item(self, index):
+        index = int(to_number(index))
+        if not 1 <= index <= len(self._items):
+            raise ExtendScriptError("Item index out of range")
+        return self._items[index - 1]
+
+    def itemByID(self, item_id):
+        return self._items_by_id.get(int(to_number(item_id)))
+
+    def layerByID(self, layer_id):
+        layer_id = int(to_number(layer_id))
+        for item in self._items:
+            if isinstance(item, CompItem):
+                for layer in item._layers:
+                    if layer.id == layer_id:
+                        return layer
+        return None
+
+    # import
+
+    def importFile(self, options):
+        file = options.file
+        if file is None:
+            raise ExtendScriptError("ImportOptions has no file to import")
+        if self._app._require_existing_files and not file.exists:
+            raise ExtendScriptError(
+                f'Unable to import "{file.fsName}", the file does not exist'
+            )
+        if file.name.lower().endswith(
+            PROJECT_EXTENSIONS
+        ):  # the items of the project, in a folder
+            return self.add_item(FolderItem(self, file.name))
+        footage = FootageItem(self, file.name, FileSource(file))
+        if options.sequence:
+            frames = _sequence_frames(file)
+            footage.mainSource.isStill = False
+            footage.frameRate = 25
+            footage.duration = frames / 25
+            footage.name = _sequence_name(file.name, frames)
+        elif file.name.lower().endswith(VIDEO_EXTENSIONS):
+            footage.mainSource.isStill = False
+            footage.duration = 10
+            footage.frameRate = 25
+            footage.hasAudio = True
+        elif file.name.lower().endswith(AUDIO_EXTENSIONS):
+            footage.hasVideo = False
+            footage.hasAudio = True
+            footage.duration = 10
+            footage.width = footage.height = 0
+        return self.add_item(footage)
+
+    def importPlaceholder(self, name, width, height, frame_rate, duration):
+        footage = FootageItem(self, name, PlaceholderSource())
+        footage.width = width
+        footage.height = height
+        footage.frameRate = frame_rate
+        footage.duration = duration
+        return self.add_item(footage)
+
+    def importFileWithDialog(self):
+        return None
+
+    # project functions
+
+    def save(self, file=UNDEFINED):
+        if file is not UNDEFINED:
+            self.file = file
+        if self.file is None:
+            return False
+        self._app.saved_projects[self.file.fsName] = self
+        self.dirty = False
+        return True
+
+    def saveWithDialog(self):
+        return False
+
+    def close(self, close_options):
+        if close_options == ENUMERATIONS["CloseOptions"]["SAVE_CHANGES"]:
+            self.save()
+        self._app.project = Project(self._app)
+        return True
+
+    def consolidateFootage(self):
+        return 0
+
+    def removeUnusedFootage(self):
+        unused = [
+            item
+            for item in self._items
+            if isinstance(item, FootageItem) and not item.usedIn
+        ]
+        for item in unused:
+            self.remove_item(item)
+        return len(unused)
+
+    def reduceProject(self, items):
+        keep = set(id(item) for item in items)
+        removed = [item for item in self._items if id(item) not in keep]
+        for item in removed:
+            self.remove_item(item)
+        return len(removed)
+
+    def listColorProfiles(self):
+        return [
+            "None",
+            "sRGB IEC61966-2.1",
+            "HDTV (Rec. 709)",
+            "ACEScg ACES Working Space AMPAS S-2014-004",
+        ]
+
+    def setDefaultImportFolder(self, folder):
+        self.defaultImportFolder = folder
+        return True
+
+    def showWindow(self, show):
+        self.windowShown = bool(show)
+
+    def autoFixExpressions(self, old_text, new_text):
+        pass
+
+
+# ITEMS
+
+
+class Item(ModelObject):
+    type_label = "Item"
+
+    def __init__(self, project, name, parent=None):
+        self._project = project
+        self._parent = parent
+        self.id = project._app.new_id()
+        self.name = name
+        self.comment = ""
+        self.label = 0
+        self.selected = False
+        self.guides = []
+        self.dynamicLinkGUID = str(uuid.uuid4())
+
+    @property
+    def typeName(self):
+        return self.type_label
+
+    @property
+    def parentFolder(self):
+        return self._parent
+
+    @parentFolder.setter
+    def parentFolder(self, folder):
+        if not isinstance(folder, FolderItem):
+            raise ExtendScriptError("parentFolder must be a FolderItem")
+        self._parent._children.remove(self)
+        folder._children.append(self)
+        self._parent = folder
+
+    def remove(self):
+        for child in list(getattr(self, "_children", [])):
+            child.remove()
+        self._project.remove_item(self)
+
+    def addGuide(self, orientation, position):
+        self.guides.append(
+            JSObject(orientationType=orientation, positionType=0, position=position)
+        )
+        return len(self.guides) - 1
+
+    def removeGuide(self, index):
+        del self.guides[int(index)]
+
+    def setGuide(self, position, index):
+        self.guides[int(index)]["position"] = position
+
+
+class FolderItem(Item):
+    type_label = "Folder"
+
+    def __init__(self, project, name, parent=None):
+        self._children = []
+        super().__init__(project, name, parent)
+        self.label = 2
+
+    @property
+    def items(self):
+        return ItemCollection(self._project, self)
+
+    @property
+    def numItems(self):
+        return len(self._children)
+
+    def item(self, index):
+        index = int(to_number(index))
+        if not 1 <= index <= len(self._children):
+            raise ExtendScriptError("Item index out of range")
+        return self._children[index - 1]
+
+
+class AVItem(Item):
+    def __init__(self, project, name, parent=None):
+        super().__init__(project, name, parent)
+        self.width = 1920
+        self.height = 1080
+        self.pixelAspect = 1
+        self.duration = 0
+        self.frameRate = 25
+        self.hasAudio = False
+        self.hasVideo = True
+        self.proxySource = None
+        self.useProxy = False
+        self.time = 0
+        self.isMediaReplacementCompatible = False
+
+    @property
+    def frameDuration(self):
+        return 1 / self.frameRate if self.frameRate else 0
+
+    @frameDuration.setter
+    def frameDuration(self, value):
+        self.frameRate = 1 / to_number(value)
+
+    @property
+    def footageMissing(self):
+        return False
+
+    @property
+    def usedIn(self):
+        return [
+            item
+            for item in self._project._items
+            if isinstance(item, CompItem)
+            and any(getattr(layer, "_source", None) is self for layer in item._layers)
+        ]
+
+    def setProxy(self, file):
+        self.proxySource = FileSource(file)
+        self.useProxy = True
+
+    def setProxyToNone(self):
+        self.proxySource = None
+        self.useProxy = False
+
+    def setProxyWithSequence(self, file, force_alphabetical=False):
+        self.setProxy(file)
+        self.proxySource.isStill = False
+
+    def setProxyWithSolid(self, color, name, width, height, pixel_aspect):
+        self.proxySource = SolidSource(color)
+        self.useProxy = True
+
+    def setProxyWithPlaceholder(self, name, width, height, frame_rate, duration):
+        self.proxySource = PlaceholderSource()
+        self.useProxy = True
+
+
+class CompItem(AVItem):
+    type_label = "Composition"
+
+    def __init__(
+        self,
+        project,
+        name,
+        width=1920,
+        height=1080,
+        pixel_aspect=1,
+        duration=10,
+        frame_rate=25,
+    ):
+        super().__init__(project, name)
+        self.width = width
+        self.height = height
+        self.pixelAspect = pixel_aspect
+        self.duration = duration
+        self.frameRate = frame_rate
+        self.label = 15
+        self._layers = []
+        self.bgColor = [0, 0, 0]
+        self.displayStartTime = 0
+        self.draft3d = False
+        self.dropFrame = False
+        self.frameBlending = False
+        self.hideShyLayers = False
+        self.motionBlur = False
+        self.motionBlurAdaptiveSampleLimit = 128
+        self.motionBlurSamplesPerFrame = 16
+        self.motionGraphicsTemplateName = ""
+        self.motionGraphicsTemplateControllerCount = 0
+        self.preserveNestedFrameRate = False
+        self.preserveNestedResolution = False
+        self.renderer = "ADBE Advanced 3d"
+        self.renderers = ["ADBE Advanced 3d", "ADBE Calder", "ADBE Ernst"]
+        self.resolutionFactor = [1, 1]
+        self.shutterAngle = 180
+        self.shutterPhase = -90
+        self.workAreaStart = 0
+        self.workAreaDuration = duration
+        self.markerProperty = PropertyGroup("Marker", "ADBE Marker")
+
+    @property
+    def displayStartFrame(self):
+        return round(self.displayStartTime * self.frameRate)
+
+    @displayStartFrame.setter
+    def displayStartFrame(self, value):
+        self.displayStartTime = to_number(value) / self.frameRate
+
+    @property
+    def layers(self):
+        return LayerCollection(self)
+
+    @property
+    def numLayers(self):
+        return len(self._layers)
+
+    @property
+    def selectedLayers(self):
+        return [layer for layer in self._layers if layer.selected]
+
+    @property
+    def selectedProperties(self):
+        return []
+
+    @property
+    def activeCamera(self):
+        for layer in self._layers:
+            if isinstance(layer, CameraLayer) and layer.enabled:
+                return layer
+        return None
+
+    def layer(self, index_or_name, relative_index=UNDEFINED):
+        if relative_index is not UNDEFINED:
+            index = self._layers.index(index_or_name) + int(to_number(relative_index))
+            return self._layers[index] if 0 <= index < len(self._layers) else None
+        if isinstance(index_or_name, str):
+            return LayerCollection(self).byName(index_or_name)
+        index = int(to_number(index_or_name))
+        if not 1 <= index <= len(self._layers):
+            raise ExtendScriptError("Layer index out of range")
+        return self._layers[index - 1]
+
+    def duplicate(self):
+        copy = CompItem(
+            self._project,
+            self.name + " 2",
+            self.width,
+            self.height,
+            self.pixelAspect,
+            self.duration,
+            self.frameRate,
+        )
+        self._project.add_item(copy, self._parent)
+        return copy
+
+    def openInViewer(self):
+        return Viewer()
+
+    def openInEssentialGraphics(self):
+        pass
+
+    def exportAsMotionGraphicsTemplate(self, overwrite=False, path=UNDEFINED):
+        return True
+
+    def getMotionGraphicsTemplateControllerName(self, index):
+        return ""
+
+
+class FootageItem(AVItem):
+    type_label = "Footage"
+
+    def __init__(self, project, name, source):
+        super().__init__(project, name)
+        self.mainSource = source
+
+    @property
+    def file(self):
+        return self.mainSource.file if isinstance(self.mainSource, FileSource) else None
+
+    @property
+    def footageMissing(self):
+        source = self.mainSource
+        return isinstance(source, PlaceholderSource) or bool(
+            isinstance(source, FileSource) and source.missingFootagePath
+        )
+
+    def replace(self, file):
+        self.mainSource = FileSource(file)
+        self.name = file.name
+        self._project.touch()
+
+    def replaceWithSequence(self, file, force_alphabetical=False):
+        self.replace(file)
+        self.mainSource.isStill = False
+        self.name = _sequence_name(file.name, _sequence_frames(file))
+
+    def replaceWithPlaceholder(self, name, width, height, frame_rate, duration):
+        self.mainSource = PlaceholderSource()
+        self.name = name
+        self.width = width
+        self.height = height
+        self.frameRate = frame_rate
+        self.duration = duration
+
+    def replaceWithSolid(self, color, name, width, height, pixel_aspect):
+        self.mainSource = SolidSource(color)
+        self.name = name
+        self.width = width
+        self.height = height
+        self.pixelAspect = pixel_aspect
+
+
+# SOURCES
+
+
+class FootageSource(ModelObject):
+    def __init__(self):
+        self.alphaMode = 5413
+        self.conformFrameRate = 0
+        self.fieldSeparationType = 5613
+        self.hasAlpha = False
+        self.highQualityFieldSeparation = False
+        self.invertAlpha = False
+        self.isStill = True
+        self.loop = 1
+        self.nativeFrameRate = 25
+        self.premulColor = [0, 0, 0]
+        self.removePulldown = 5813
+
+    @property
+    def displayFrameRate(self):
+        return self.conformFrameRate or self.nativeFrameRate
+
+    def guessAlphaMode(self):
+        self.alphaMode = 5414 if self.hasAlpha else 5413
+
+    def guessPulldown(self, method):
+        self.removePulldown = 5813
+
+
+class FileSource(FootageSource):
+    def __init__(self, file):
+        super().__init__()
+        self.file = file
+        self.hasAlpha = file.name.lower().endswith((".png", ".exr", ".tif", ".tiff"))
+
+    @property
+    def missingFootagePath(self):
+        return "" if self.file.exists else self.file.fsName
+
+    def reload(self):
+        pass
+
+
+class SolidSource(FootageSource):
+    def __init__(self, color=None):
+        super().__init__()
+        self.color = color or [0, 0, 0]
+
+
+class PlaceholderSource(FootageSource):
+    pass
+
+
+# PROPERTIES
+
+
+class PropertyBase(ModelObject):
+    matchName = ""
+
+    def __init__(self, name, match_name):
+        self.name = name
+        self.matchName = match_name
+        self._parent = None
+        self.enabled = True
+        self.selected = False
+        self.isModified = False
+
+    @property
+    def parentProperty(self):
+        return self._parent
+
+    @property
+    def propertyDepth(self):
+        depth = 0
+        parent = self._parent
+        while parent is not None:
+            depth += 1
+            parent = parent._parent
+        return depth
+
+    @property
+    def propertyIndex(self):
+        if self._parent is None:
+            return 0
+        return self._parent._properties.index(self) + 1
+
+    @property
+    def propertyType(self):
+        if isinstance(self, Property):
+            return ENUMERATIONS["PropertyType"]["PROPERTY"]
+        if self.matchName in ("ADBE Effect Parade", "ADBE Mask Parade"):
+            return ENUMERATIONS["PropertyType"]["INDEXED_GROUP"]
+        return ENUMERATIONS["PropertyType"]["NAMED_GROUP"]
+
+    @property
+    def active(self):
+        return self.enabled
+
+    @property
+    def canSetEnabled(self):
+        return True
+
+    @property
+    def isEffect(self):
+        return (
+            self._parent is not None and self._parent.matchName == "ADBE Effect Parade"
+        )
+
+    @property
+    def isMask(self):
+        return self._parent is not None and self._parent.matchName == "ADBE Mask Parade"
+
+
+class PropertyGroup(PropertyBase):
+    def __init__(self, name, match_name, properties=()):
+        super().__init__(name, match_name)
+        self._properties = []
+        for property_ in properties:
+            self.add(property_)
+
+    def add(self, property_):
+        property_._parent = self
+        self._properties.append(property_)
+        return property_
+
+    def js_get(self, name):
+        value = super().js_get(name)
+        if value is UNDEFINED:
+            for property_ in self._properties:
+                if name in (property_.name, property_.matchName):
+                    return property_
+        return value
+
+    @property
+    def numProperties(self):
+        return len(self._properties)
+
+    def property(self, index_or_name):
+        if isinstance(index_or_name, str):
+            for property_ in self._properties:
+                if index_or_name in (property_.name, property_.matchName):
+                    return property_
+            return None
+        index = int(to_number(index_or_name))
+        if not 1 <= index <= len(self._properties):
+            raise ExtendScriptError("Property index out of range")
+        return self._properties[index - 1]
+
+    def canAddProperty(self, match_name):
+        return self.matchName in ("ADBE Effect Parade", "ADBE Mask Parade")
+
+    def addProperty(self, match_name):
+        if not self.canAddProperty(match_name):
+            raise ExtendScriptError(f"Can not add a property to {self.name}")
+        return self.add(PropertyGroup(match_name, match_name))
+
+
+class Property(PropertyBase):
+    def __init__(self, name, match_name, value=0):
+        super().__init__(name, match_name)
+        self._value = value
+        self._keys = []  # [time, value] pairs sorted by time
+        self.expression = ""
+        self.expressionEnabled = False
+        self.canSetExpression = True
+        self.canVaryOverTime = True
+
+    @property
+    def value(self):
+        return self._keys[0][1] if self._keys else self._value
+
+    @property
+    def numKeys(self):
+        return len(self._keys)
+
+    @property
+    def isTimeVarying(self):
+        return bool(self._keys) or bool(self.expressionEnabled)
+
+    def setValue(self, value):
+        if self._keys:
+            raise ExtendScriptError("Can not use setValue on a property with keyframes")
+        self._value = value
+        self.isModified = True
+
+    def valueAtTime(self, time, pre_expression=False):
+        if not self._keys:
+            return self._value
+        time = to_number(time)
+        previous = self._keys[0]
+        for key in self._keys:
+            if key[0] >= time:
+                if key is previous or key[0] == previous[0]:
+                    return key[1]
+                ratio = (time - previous[0]) / (key[0] - previous[0])
+                return _interpolate(previous[1], key[1], ratio)
+            previous = key
+        return self._keys[-1][1]
+
+    def setValueAtTime(self, time, value):
+        time = to_number(time)
+        for key in self._keys:
+            if key[0] == time:
+                key[1] = value
+                return
+        self._keys.append([time, value])
+        self._keys.sort(key=lambda key: key[0])
+        self.isModified = True
+
+    def setValuesAtTimes(self, times, values):
+        for time, value in zip(times, values):
+            self.setValueAtTime(time, value)
+
+    def addKey(self, time):
+        self.setValueAtTime(time, self.valueAtTime(time))
+        return self.nearestKeyIndex(time)
+
+    def nearestKeyIndex(self, time):
+        time = to_number(time)
+        distances = [abs(key[0] - time) for key in self._keys]
+        return distances.index(min(distances)) + 1
+
+    def removeKey(self, index):
+        del self._keys[self._key_index(index)]
+
+    def keyTime(self, index):
+        return self._keys[self._key_index(index)][0]
+
+    def keyValue(self, index):
+        return self._keys[self._key_index(index)][1]
+
+    def _key_index(self, index):
+        index = int(to_number(index))
+        if not 1 <= index <= len(self._keys):
+            raise ExtendScriptError("Key index out of range")
+        return index - 1
+
+
+def _interpolate(start, end, ratio):
+    if isinstance(start, list):
+        return [_interpolate(a, b, ratio) for a, b in zip(start, end)]
+    return start + (end - start) * ratio
+
+
+# LAYERS
+
+
+class Layer(PropertyGroup):
+    layer_match_name = "ADBE AV Layer"
+
+    def __init__(self, comp, name):
+        super().__init__(name, self.layer_match_name)
+        self._comp = comp
+        self.id = comp._project._app.new_id()
+        self.comment = ""
+        self.label = 0
+        self.locked = False
+        self.shy = False
+        self.solo = False
+        self.inPoint = 0
+        self.outPoint = comp.duration
+        self.startTime = 0
+        self.stretch = 100
+        self.nullLayer = False
+        self.hasVideo = True
+        self.isNameSet = False
+        self._layer_parent = None
+        self.add(PropertyGroup("Marker", "ADBE Marker"))
+        self.add(
+            PropertyGroup(
+                "Transform",
+                "ADBE Transform Group",
+                [
+                    Property("Anchor Point", "ADBE Anchor Point", [0, 0, 0]),
+                    Property(
+                        "Position",
+                        "ADBE Position",
+                        [comp.width / 2, comp.height / 2, 0],
+                    ),
+                    Property("Scale", "ADBE Scale", [100, 100, 100]),
+                    Property("X Rotation", "ADBE Rotate X", 0),
+                    Property("Y Rotation", "ADBE Rotate Y", 0),
+                    Property("Rotation", "ADBE Rotate Z", 0),
+                    Property("Opacity", "ADBE Opacity", 100),
+                ],
+            )
+        )
+
+    @property
+    def containingComp(self):
+        return self._comp
+
+    @property
+    def index(self):
+        return self._comp._layers.index(self) + 1
+
+    @property
+    def time(self):
+        return self._comp.time
+
+    @property
+    def parent(self):
+        return self._layer_parent
+
+    @parent.setter
+    def parent(self, layer):
+        self._layer_parent = layer
+
+    @property
+    def transform(self):
+        return self.property("ADBE Transform Group")
+
+    @property
+    def marker(self):
+        return self.property("ADBE Marker")
+
+    def _transform(self, match_name):
+        return self.transform.property(match_name)
+
+    @property
+    def anchorPoint(self):
+        return self._transform("ADBE Anchor Point")
+
+    @property
+    def position(self):
+        return self._transform("ADBE Position")
+
+    @property
+    def scale(self):
+        return self._transform("ADBE Scale")
+
+    @property
+    def rotation(self):
+        return self._transform("ADBE Rotate Z")
+
+    @property
+    def xRotation(self):
+        return self._transform("ADBE Rotate X")
+
+    @property
+    def yRotation(self):
+        return self._transform("ADBE Rotate Y")
+
+    @property
+    def opacity(self):
+        return self._transform("ADBE Opacity")
+
+    def activeAtTime(self, time):
+        return self.enabled and self.inPoint <= to_number(time) < self.outPoint
+
+    def remove(self):
+        self._comp._layers.remove(self)
+        self._comp._project.touch()
+
+    def moveToBeginning(self):
+        self._comp._layers.remove(self)
+        self._comp._layers.insert(0, self)
+
+    def moveToEnd(self):
+        self._comp._layers.remove(self)
+        self._comp._layers.append(self)
+
+    def moveBefore(self, layer):
+        self._comp._layers.remove(self)
+        self._comp._layers.insert(self._comp._layers.index(layer), self)
+
+    def moveAfter(self, layer):
+        self._comp._layers.remove(self)
+        self._comp._layers.insert(self._comp._layers.index(layer) + 1, self)
+
+    def duplicate(self):
+        copy = type(self)(self._comp, self.name)
+        self._comp._layers.insert(self._comp._layers.index(self), copy)
+        return copy
+
+
+class AVLayer(Layer):
+    def __init__(self, comp, name, source=None):
+        super().__init__(comp, name)
+        self._source = source
+        self.adjustmentLayer = False
+        self.audioEnabled = bool(source is not None and source.hasAudio)
+        self.blendingMode = 5212
+        self.collapseTransformation = False
+        self.effectsActive = True
+        self.environmentLayer = False
+        self.frameBlending = False
+        self.frameBlendingType = 4012
+        self.guideLayer = False
+        self.hasTrackMatte = False
+        self.isTrackMatte = False
+        self.motionBlur = False
+        self.preserveTransparency = False
+        self.threeDLayer = False
+        self.timeRemapEnabled = False
+        self.add(PropertyGroup("Masks", "ADBE Mask Parade"))
+        self.add(PropertyGroup("Effects", "ADBE Effect Parade"))
+
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def isNameFromSource(self):
+        return self._source is not None and not self.isNameSet
+
+    @property
+    def width(self):
+        return self._source.width if self._source is not None else self._comp.width
+
+    @property
+    def height(self):
+        return self._source.height if self._source is not None else self._comp.height
+
+    @property
+    def hasAudio(self):
+        return bool(self._source is not None and self._source.hasAudio)
+
+    @property
+    def audioActive(self):
+        return self.hasAudio and self.audioEnabled
+
+    @property
+    def canSetCollapseTransformation(self):
+        return isinstance(self._source, CompItem)
+
+    @property
+    def canSetTimeRemapEnabled(self):
+        if isinstance(self._source, FootageItem):
+            return not self._source.mainSource.isStill
+        return self._source is not None
+
+    def replaceSource(self, item, fix_expressions=False):
+        self._source = item
+
+
+class TextLayer(AVLayer):
+    layer_match_name = "ADBE Text Layer"
+
+    def __init__(self, comp, name, text=""):
+        super().__init__(comp, name)
+        self.add(
+            PropertyGroup(
+                "Text",
+                "ADBE Text Properties",
+                [Property("Source Text", "ADBE Text Document", text)],
+            )
+        )
+
+
+class ShapeLayer(AVLayer):
+    layer_match_name = "ADBE Vector Layer"
+
+
+class CameraLayer(Layer):
+    layer_match_name = "ADBE Camera Layer"
+
+
+class LightLayer(Layer):
+    layer_match_name = "ADBE Light Layer"
+
+
+# COLLECTIONS
+
+
+class Collection(ModelObject):
+    """Base of the 1-indexed collections"""
+
+    def elements(self):
+        raise NotImplementedError
+
+    def js_get(self, name):
+        if name.isdigit():
+            elements = self.elements()
+            index = int(name)
+            return elements[index - 1] if 1 <= index <= len(elements) else UNDEFINED
+        return super().js_get(name)
+
+    @property
+    def length(self):
+        return len(self.elements())
+
+
+class ItemCollection(Collection):
+    def __init__(self, project, folder=None):
+        self._project = project
+        self._folder = folder
+
+    def elements(self):
+        return self._folder._children if self._folder else self._project._items
+
+    def addComp(self, name, width, height, pixel_aspect, duration, frame_rate):
+        comp = CompItem(
+            self._project, name, width, height, pixel_aspect, duration, frame_rate
+        )
+        return self._project.add_item(comp, self._folder)
+
+    def addFolder(self, name):
+        return self._project.add_item(FolderItem(self._project, name), self._folder)
+
+
+class RQItemCollection(Collection):
+    def __init__(self, queue):
+        self._queue = queue
+
+    def elements(self):
+        return self._queue._items
+
+    def add(self, comp):
+        if not isinstance(comp, CompItem):
+            raise ExtendScriptError(
+                "Only compositions can be added to the render queue"
+            )
+        item = RenderQueueItem(self._queue, comp)
+        self._queue._items.append(item)
+        return item
+
+
+class OMCollection(Collection):
+    def __init__(self, item):
+        self._item = item
+
+    def elements(self):
+        return self._item._output_modules
+
+    def add(self):
+        module = OutputModule(self._item)
+        self._item._output_modules.append(module)
+        return module
+
+
+class LayerCollection(Collection):
+    def __init__(self, comp):
+        self._comp = comp
+
+    def elements(self):
+        return self._comp._layers
+
+    def _insert(self, layer):
+        self._comp._layers.insert(0, layer)
+        self._comp._project.touch()
+        return layer
+
+    def add(self, item, duration=UNDEFINED):
+        layer = AVLayer(self._comp, item.name, item)
+        if duration is not UNDEFINED:
+            layer.outPoint = to_number(duration)
+        return self._insert(layer)
+
+    def addNull(self, duration=UNDEFINED):
+        layer = AVLayer(self._comp, f"Null {len(self._comp._layers) + 1}")
+        layer.nullLayer = True
+        return self._insert(layer)
+
+    def addSolid(self, color, name, width, height, pixel_aspect, duration=UNDEFINED):
+        project = self._comp._project
+        solid = FootageItem(project, name, SolidSource(color))
+        solid.width = width
+        solid.height = height
+        solid.pixelAspect = pixel_aspect
+        project.add_item(solid, _solids_folder(project))
+        return self._insert(AVLayer(self._comp, name, solid))
+
+    def addText(self, source_text=""):
+        return self._insert(TextLayer(self._comp, source_text or "Text", source_text))
+
+    def addBoxText(self, size, source_text=""):
+        return self._insert(TextLayer(self._comp, source_text or "Text", source_text))
+
+    def addShape(self):
+        return self._insert(
+            ShapeLayer(self._comp, f"Shape Layer {len(self._comp._layers) + 1}")
+        )
+
+    def addCamera(self, name, center_point):
+        return self._insert(CameraLayer(self._comp, name))
+
+    def addLight(self, name, center_point):
+        return self._insert(LightLayer(self._comp, name))
+
+    def byName(self, name):
+        for layer in self._comp._layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def precompose(self, indices, name, move_all_attributes=True):
+        comp = self._comp
+        layers = [comp._layers[int(index) - 1] for index in indices]
+        new_comp = ItemCollection(comp._project).addComp(
+            name,
+            comp.width,
+            comp.height,
+            comp.pixelAspect,
+            comp.duration,
+            comp.frameRate,
+        )
+        position = min(comp._layers.index(layer) for layer in layers)
+        for layer in layers:
+            comp._layers.remove(layer)
+            layer._comp = new_comp
+            new_comp._layers.append(layer)
+        comp._layers.insert(position, AVLayer(comp, name, new_comp))
+        return new_comp
+
+
+# MISC
+
+
+class Viewer(ModelObject):
+    def __init__(self):
+        self.active = True
+        self.maximized = False
+        self.type = 0
+
+    def setActive(self):
+        self.active = True
+        return True
+
+
+def _solids_folder(project):
+    for item in project.rootFolder._children:
+        if isinstance(item, FolderItem) and item.name == "Solids":
+            return item
+    return project.add_item(FolderItem(project, "Solids"))
+
+
+# RENDER QUEUE
+
+QUEUED = 3015
+UNQUEUED = 3014
+RENDERING = 3016
+USER_STOPPED = 3017
+DONE = 3019
+
+RENDER_SETTINGS_TEMPLATES = [
+    "Best Settings",
+    "Current Settings",
+    "DV Settings",
+    "Draft Settings",
+    "Multi-Machine Settings",
+]
+OUTPUT_MODULE_TEMPLATES = [
+    "High Quality",
+    "High Quality with Alpha",
+    "H.264 - Match Render Settings - 15 Mbps",
+    "Lossless",
+    "Lossless with Alpha",
+    "Photoshop",
+    "TIFF Sequence with Alpha",
+]
+
+
+class RenderQueue(ModelObject):
+    """Rendering is instantaneous, render() marks every queued item as done"""
+
+    def __init__(self, project):
+        self._project = project
+        self._items = []
+        self.rendering = False
+        self.canQueueInAME = False
+        self.queueNotify = False
+        self._paused = False
+        self._stopped = False
+
+    @property
+    def items(self):
+        return RQItemCollection(self)
+
+    @property
+    def numItems(self):
+        return len(self._items)
+
+    def item(self, index):
+        index = int(to_number(index))
+        if not 1 <= index <= len(self._items):
+            raise ExtendScriptError("Render queue item index out of range")
+        return self._items[index - 1]
+
+    def render(self):
+        self.rendering = True
+        self._stopped = False
+        try:
+            for item in self._items:
+                if item.status != QUEUED:
+                    continue
+                if self._stopped:
+                    break
+                item.render_item()
+        finally:
+            self.rendering = False
+
+    def pauseRendering(self, pause):
+        self._paused = bool(pause)
+
+    def stopRendering(self):
+        self._stopped = True
+
+    def showWindow(self, show):
+        pass
+
+    def queueInAME(self, render_immediately):
+        raise ExtendScriptError("Adobe Media Encoder is not installed")
+
+
+class RenderQueueItem(ModelObject):
+    def __init__(self, queue, comp):
+        self._queue = queue
+        self.comp = comp
+        self.elapsedSeconds = None
+        self.startTime = None
+        self.skipFrames = 0
+        self.logType = 3212
+        self.timeSpanStart = comp.workAreaStart
+        self.timeSpanDuration = comp.workAreaDuration
+        self.templates = list(RENDER_SETTINGS_TEMPLATES)
+        self.onStatusChanged = None
+        self._status = QUEUED
+        self._settings_template = "Best Settings"
+        self._output_modules = [OutputModule(self)]
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def render(self):
+        return self._status in (QUEUED, RENDERING, DONE)
+
+    @render.setter
+    def render(self, value):
+        if self._status in (QUEUED, UNQUEUED):
+            self._status = QUEUED if value else UNQUEUED
+
+    @property
+    def numOutputModules(self):
+        return len(self._output_modules)
+
+    @property
+    def outputModules(self):
+        return OMCollection(self)
+
+    def outputModule(self, index):
+        index = int(to_number(index))
+        if not 1 <= index <= len(self._output_modules):
+            raise ExtendScriptError("Output module index out of range")
+        return self._output_modules[index - 1]
+
+    def applyTemplate(self, name):
+        if name not in self.templates:
+            raise ExtendScriptError(f'Render settings template "{name}" does not exist')
+        self._settings_template = name
+
+    def saveAsTemplate(self, name):
+        self.templates.append(name)
+
+    def duplicate(self):
+        copy = RenderQueueItem(self._queue, self.comp)
+        self._queue._items.append(copy)
+        return copy
+
+    def remove(self):
+        if self._status == RENDERING:
+            raise ExtendScriptError("Can not remove an item while it is rendering")
+        self._queue._items.remove(self)
+
+    def render_item(self):
+        self.startTime = 0
+        self.set_status(RENDERING)
+        self.elapsedSeconds = 0
+        self.set_status(DONE)
+
+    def set_status(self, status):
+        self._status = status
+        self._queue._project._app.notify_status_changed(self)
+
+
+class OutputModule(ModelObject):
+    def __init__(self, item):
+        self._item = item
+        self.file = File(f"~/Desktop/{item.comp.name}.mov")
+        self.includeSourceXMP = False
+        self.postRenderAction = 3612
+        self.templates = list(OUTPUT_MODULE_TEMPLATES)
+        self._template = "High Quality"
+
+    @property
+    def name(self):
+        return self._template
+
+    def applyTemplate(self, name):
+        if name not in self.templates:
+            raise ExtendScriptError(f'Output module template "{name}" does not exist')
+        self._template = name
+
+    def saveAsTemplate(self, name):
+        self.templates.append(name)
+
+    def remove(self):
+        if len(self._item._output_modules) == 1:
+            raise ExtendScriptError(
+                "A render queue item needs at least one output module"
+            )
+        self._item._output_modules.remove(self)
+
+
+# SEQUENCES
+
+
+def _sequence_pattern(file_name):
+    """Split a numbered file name into prefix, frame number and suffix"""
+    stem, extension = os.path.splitext(file_name)
+    digits = len(stem) - len(stem.rstrip("0123456789"))
+    if not digits:
+        return None
+    return stem[:-digits], stem[-digits:], extension
+
+
+def _sequence_frames(file):
+    pattern = _sequence_pattern(file.name)
+    directory = file.parent.fsName
+    if pattern is None or not os.path.isdir(directory):
+        return 1
+    prefix, digits, extension = pattern
+    return max(
+        sum(
+            1
+            for name in os.listdir(directory)
+            if name.startswith(prefix)
+            and name.endswith(extension)
+            and name[len(prefix) : len(name) - len(extension)].isdigit()
+        ),
+        1,
+    )
+
+
+def _sequence_name(file_name, frames):
+    pattern = _sequence_pattern(file_name)
+    if pattern is None:
+        return file_name
+    prefix, digits, extension = pattern
+    last = str(int(digits) + frames - 1).zfill(len(digits))
+    return f"{prefix}[{digits}-{last}]{extension}"
+
+
+# TIME
+
+
+def time_to_current_format(project, time, frame_rate, is_duration=False):
+    frames = round(to_number(time) * to_number(frame_rate))
+    if project.timeDisplayType == FRAMES:
+        return str(frames + (0 if is_duration is True else project.displayStartFrame))
+    rate = max(round(to_number(frame_rate)), 1)
+    seconds, frame = divmod(frames, rate)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}:{frame:02d}"
+
+
+def current_format_to_time(project, formatted, frame_rate, is_duration=False):
+    frame_rate = to_number(frame_rate)
+    text = str(formatted).strip()
+    if ":" in text or ";" in text:
+        parts = [int(part) for part in text.replace(";", ":").split(":")]
+        while len(parts) < 4:
+            parts.insert(0, 0)
+        hours, minutes, seconds, frames = parts
+        rate = max(round(frame_rate), 1)
+        return (hours * 3600 + minutes * 60 + seconds) + frames / rate
+    frames = to_number(text)
+    if project.timeDisplayType == FRAMES and is_duration is not True:
+        frames -= project.displayStartFrame
+    return frames / frame_rate
+
+
+# LOAD TESTS
+
+
+def build_project(
+    project,
+    footage: int = 0,
+    compositions: int = 0,
+    folders: int = 0,
+    layers_per_composition: int = 0,
+    selected_layers: int = 0,
+):
+    """Fill the project with generated items, to load test pydobe against large projects
+
+    Footage items point to (missing) numbered image files and are spread across the folders,
+    compositions are filled with layers using the footage.
+    """
+    folder_items = [
+        project.add_item(FolderItem(project, f"Folder {index + 1}"))
+        for index in range(folders)
+    ]
+    footage_items = []
+    for index in range(footage):
+        file = File(f"/fake/footage/shot_{index + 1:05d}_0001.png")
+        item = FootageItem(project, file.name, FileSource(file))
+        folder = folder_items[index % len(folder_items)] if folder_items else None
+        footage_items.append(project.add_item(item, folder))
+    for index in range(compositions):
+        comp = CompItem(project, f"Comp {index + 1}")
+        project.add_item(comp)
+        for layer_index in range(layers_per_composition):
+            source = (
+                footage_items[layer_index % len(footage_items)]
+                if footage_items
+                else None
+            )
+            layer = AVLayer(
+                comp, source.name if source else f"Layer {layer_index + 1}", source
+            )
+            layer.selected = layer_index < selected_layers
+            comp._layers.append(layer)
+    return project
@@ -0,0 +1,516 @@
+"""A fake After Effects and pydobe panel, to run and benchmark pydobe without After Effects
+
+    from pydobe.after_effects.fake.panel import FakePanel
+
+    with FakePanel() as panel, panel.connect():
+        comp = pydobe.objects.app.project.items.add_comp("Comp", 1920, 1080, 1, 10, 25)
+
+FakePanel serves the same HTTP protocol as the CEP panel, FakeTransport skips HTTP altogether.
+"""
+
+import functools
+import json
+import os
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from pydobe.core import (
+    HOST,
+    RESULT_FILE_HEADER,
+    SERVER_TIME_HEADER,
+    STREAM_CHUNK_SIZE,
+    EventStream,
+    HttpTransport,
+    use_transport,
+)
+from pydobe.after_effects.fake import model
+from pydobe.after_effects.fake.interpreter import (
+    _MATH,
+    Interpreter,
+    JSObject,
+    JSThrow,
+    _Callable,
+    _illegal_constructor,
+    get_member,
+    number_to_string,
+    to_string,
+)
+
+EVAL_SCRIPT_ERROR = "EvalScript error."
+LATENCY_SAMPLES = 1000  # percentiles are computed over the most recent requests, as in handleRequests.js
+RATE_WINDOW = 60  # requests per second are averaged over the last minute
+RESULT_FILE_PREFIX = "pydobe-result-"  # temporary files large results are written to, as in handleRequests.js
+RESULT_FILE_TTL = 10 * 60  # seconds after which result files left behind are deleted
+EVENT_NAMES = {
+    "pydobe.renderStatus": "render"
+}  # CSXS event types pushed to the panel clients
+# the library the panel loads into After Effects (the ScriptPath of its manifest), run by the fake as it is
+LIBRARY_PATH = os.path.normpath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "../../../integrations/after_effects/pydobe_panel/lib/pydobeAEScript.jsx",
+    )
+)
+# classes of the object model which scripts test with instanceof, which matches the exact class as subclasses are not modelled
+DOM_CLASSES = (
+    "CompItem",
+    "FolderItem",
+    "FootageItem",
+    "FileSource",
+    "SolidSource",
+    "PlaceholderSource",
+    "AVLayer",
+    "TextLayer",
+    "ShapeLayer",
+    "CameraLayer",
+    "LightLayer",
+    "Property",
+    "PropertyGroup",
+    "RenderQueueItem",
+    "OutputModule",
+)
+
+
+class FakeAfterEffects(object):
+    """Evaluates the scripts sent by pydobe against a model of After Effects
+
+    Scripts are evaluated one at a time, as After Effects does, each of them waiting for latency
+    seconds to simulate the cost of a round trip to the real application. With verbose, scripts and
+    results are printed to stderr.
+    """
+
+    def __init__(
+        self,
+        app: model.Application = None,
+        latency: float = 0.0,
+        seed: int = None,
+        verbose: bool = False,
+    ):
+        self.app = app or model.Application()
+        self.latency = latency
+        self.verbose = verbose
+        self.log = []  # lines written with $.writeln
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._listeners = []  # queues of the open event streams
+        self.interpreter = Interpreter(self._globals())
+        with open(LIBRARY_PATH, encoding="utf-8") as file:
+            self.interpreter.run(file.read())
+        self.handles = self.interpreter.globals.variables["$"][
+            "_pydobe"
+        ]  # $._pydobe, objects by id and the library
+        self.reset_stats()
+
+    def _globals(self) -> dict:
+        values = {
+            "app": self.app,
+            "$": JSObject(
+                writeln=lambda *args: self.log.append(
+                    " ".join(to_string(arg) for arg in args)
+                ),
+                write=lambda *args: self.log.append(
+                    "".join(to_string(arg) for arg in args)
+                ),
+                sleep=lambda milliseconds: time.sleep(milliseconds / 1000),
+            ),
+            "Math": JSObject(_MATH, random=self._random.random),
+            "File": _Callable(lambda path="": model.File(to_string(path))),
+            "Folder": _Callable(lambda path="": model.Folder(to_string(path))),
+            "ImportOptions": _Callable(model.ImportOptions),
+            "CSXSEvent": _Callable(lambda: _CSXSEvent(self)),
+            "ExternalObject": _Callable(lambda name="": JSObject()),
+            "timeToCurrentFormat": lambda *args: model.time_to_current_format(
+                self.app.project, *args
+            ),
+            "currentFormatToTime": lambda *args: model.current_format_to_time(
+                self.app.project, *args
+            ),
+        }
+        for name in DOM_CLASSES:
+            values[name] = _Callable(
+                functools.partial(_illegal_constructor, name),
+                members={"type_name": name},
+            )
+        values.update(model.ENUMERATIONS)
+        return values
+
+    def script_cache_stats(self) -> dict:
+        """Compiled scripts kept, hits and misses, as served by the panel on GET /stats"""
+        with self._lock:
+            return json.loads(self.interpreter.run("$._pydobe.scriptCacheStats()"))
+
+    def dispatch(self, event_type: str, data: str):
+        """Push an event to the open event streams, as CSXSEvent.dispatch and the panel do"""
+        name = EVENT_NAMES.get(event_type)
+        if name:
+            for listener in list(self._listeners):
+                listener.put((name, data))
+
+    def listen(self) -> queue.Queue:
+        """Register a queue receiving (event name, data) of every pushed event"""
+        listener = queue.Queue()
+        self._listeners.append(listener)
+        return listener
+
+    def unlisten(self, listener: queue.Queue):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @property
+    def handle_count(self) -> int:
+        """Number of objects kept alive for pydobe"""
+        return len(get_member(self.handles, "generatedIds"))
+
+    def reset_stats(self):
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.eval_time = 0.0
+        self.result_files = 0
+        self.result_file_bytes = 0
+        self.streamed_responses = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._timestamps = deque()
+
+    def write_result_file(self, text: str) -> str:
+        """Write a large result to a temporary file and return its path, which pydobe deletes once read"""
+        with self._lock:
+            self.result_files += 1
+            self.result_file_bytes += len(text)
+            name = f"{RESULT_FILE_PREFIX}{os.getpid()}-{int(time.time() * 1000)}-{self.result_files}.txt"
+        path = os.path.join(tempfile.gettempdir(), name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return path
+
+    def stats(self) -> dict:
+        """The counters served by the panel on GET /stats, along with the total evaluation time"""
+        with self._lock:
+            panel_stats = json.loads(self.interpreter.run("$._pydobe.panelStats()"))
+            now = time.time()
+            latencies = sorted(self._latencies)
+            while self._timestamps and self._timestamps[0] < now - RATE_WINDOW:
+                self._timestamps.popleft()
+            elapsed = min(now - self.started, RATE_WINDOW)
+            return {
+                "uptime": now - self.started,
+                "requests": self.requests,
+                "errors": self.errors,
+                "requests_per_second": (
+                    len(self._timestamps) / elapsed if elapsed > 0 else 0
+                ),
+                "latency_ms": {
+                    "p50": _percentile(latencies, 0.5),
+                    "p99": _percentile(latencies, 0.99),
+                    "max": _percentile(latencies, 1),
+                },
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "result_files": self.result_files,
+                "result_file_bytes": self.result_file_bytes,
+                "streamed_responses": self.streamed_responses,
+                "handles": panel_stats["handles"],
+                "script_cache": panel_stats["script_cache"],
+                "verbose": self.verbose,
+                "eval_time": self.eval_time,
+            }
+
+    def configure(self, verbose: bool = None) -> dict:
+        if verbose is not None:
+            self.verbose = bool(verbose)
+        return {"verbose": self.verbose}
+
+    def evaluate(self, payload: dict) -> tuple:
+        """Evaluate the script of the payload as CSInterface.evalScript would
+
+        Return the response text and the evaluation time in seconds.
+        """
+        script = payload["to_eval"]
+        with self._lock:
+            if self.latency:
+                time.sleep(self.latency)
+            if self.verbose:
+                print(
+                    f"\nExtendScript code to be executed :\n{script}", file=sys.stderr
+                )
+            start = time.perf_counter()
+            token = model.active_application.set(self.app)
+            try:
+                text = _result_text(self.interpreter.run(script))
+            except JSThrow:
+                text = EVAL_SCRIPT_ERROR
+            finally:
+                model.active_application.reset(token)
+            eval_time = time.perf_counter() - start
+            if self.verbose:
+                print(f"ExtendScript sent back :\n{text}", file=sys.stderr)
+            self.requests += 1
+            self.errors += _is_error(text)
+            self.bytes_in += len(script)
+            self.bytes_out += len(text)
+            self.eval_time += eval_time
+            self._latencies.append(eval_time * 1000)
+            self._timestamps.append(time.time())
+        return text, eval_time
+
+
+class FakeTransport(object):
+    """Sends requests straight to a FakeAfterEffects, without any HTTP"""
+
+    def __init__(self, after_effects: FakeAfterEffects = None):
+        self.after_effects = after_effects or FakeAfterEffects()
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def send(self, payload: dict) -> tuple:
+        return self.after_effects.evaluate(payload)
+
+    def stats(self) -> dict:
+        return self.after_effects.stats()
+
+    def configure(self, verbose: bool = None) -> dict:
+        return self.after_effects.configure(verbose)
+
+    def events(self) -> EventStream:
+        listener = self.after_effects.listen()
+
+        def read():
+            while True:
+                message = listener.get()
+                if message is None:
+                    return
+                event = json.loads(message[1])
+                event["type"] = message[0]
+                yield event
+
+        def close():
+            self.after_effects.unlisten(listener)
+            listener.put(None)
+
+        return EventStream(read(), close)
+
+
+class FakePanel(object):
+    """Serves a FakeAfterEffects over HTTP from a background thread, like the pydobe CEP panel
+
+    The port defaults to a free one, use connect() to send pydobe requests to this panel.
+    """
+
+    def __init__(
+        self,
+        after_effects: FakeAfterEffects = None,
+        host: str = HOST,
+        port: int = 0,
+        latency: float = 0.0,
+    ):
+        self.after_effects = after_effects or FakeAfterEffects(latency=latency)
+        self.host = host
+        self.requested_port = port
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1] if self._server else self.requested_port
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        remove_stale_result_files()
+        self._server = ThreadingHTTPServer(
+            (self.host, self.requested_port), _PanelHandler
+        )
+        self._server.daemon_threads = True
+        self._server.after_effects = self.after_effects
+        self._server.closing = False
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="pydobe-fake-panel", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._server:
+            self._server.closing = True
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def transport(self) -> HttpTransport:
+        return HttpTransport(self.host, self.port)
+
+    def connect(self):
+        """Context manager sending the requests of the current thread to this panel"""
+        return use_transport(self.transport())
+
+
+class _PanelHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive as node does
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # pydobe closed a streamed response it stopped reading
+
+    def do_GET(self):
+        request = urlparse(self.path)
+        after_effects = self.server.after_effects
+        if request.path == "/events":
+            self._stream_events()
+        elif request.path == "/stats":
+            self._respond(
+                json.dumps(after_effects.stats()), content_type="application/json"
+            )
+        elif request.path == "/config":
+            verbose = parse_qs(request.query).get("verbose")
+            settings = after_effects.configure(
+                verbose[0] in ("1", "true") if verbose else None
+            )
+            self._respond(json.dumps(settings), content_type="application/json")
+        else:
+            self._respond("AfterEffects is alive")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = json.loads(body)
+        text, eval_time = self.server.after_effects.evaluate(payload)
+        headers = {SERVER_TIME_HEADER: f"{eval_time * 1000:.3f}"}
+        threshold = payload.get("result_file_threshold")
+        if threshold and threshold > 0 and len(text) >= threshold:
+            headers[RESULT_FILE_HEADER] = self.server.after_effects.write_result_file(
+                text
+            )
+            text = ""
+        if payload.get("stream"):
+            self._stream(text, headers)
+        else:
+            self._respond(text, headers)
+
+    def _stream_events(self):
+        """Server-sent events, until the client disconnects or the panel stops"""
+        after_effects = self.server.after_effects
+        listener = after_effects.listen()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while not self.server.closing:
+                try:
+                    name, data = listener.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                self.wfile.write(f"event: {name}\ndata: {data}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            after_effects.unlisten(listener)
+
+    def _respond(
+        self,
+        text: str,
+        headers: dict = None,
+        content_type: str = "text/plain; charset=utf-8",
+    ):
+        data = text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, text: str, headers: dict):
+        """Chunked response, as node sends a response written in several parts"""
+        with self.server.after_effects._lock:
+            self.server.after_effects.streamed_responses += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        for start in range(0, len(text), STREAM_CHUNK_SIZE):
+            data = text[start : start + STREAM_CHUNK_SIZE].encode("utf-8")
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CSXSEvent(JSObject):
+    type_name = "CSXSEvent"
+
+    def __init__(self, after_effects):
+        super().__init__(
+            type="", data="", scope="APPLICATION", appId="", extensionId=""
+        )
+        self["dispatch"] = lambda: after_effects.dispatch(
+            self["type"], to_string(self["data"])
+        )
+
+
+def _percentile(values: list, ratio: float):
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(ratio * len(values)))]
+
+
+def _is_error(text: str) -> bool:
+    """Uncaught errors, or errors caught by the try statement pydobe wraps every script in"""
+    return text == EVAL_SCRIPT_ERROR or '"error":true' in text[-20:]
+
+
+def _result_text(value) -> str:
+    """Convert the completion value of a script to text, as CSInterface.evalScript does"""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return number_to_string(value)
+    return to_string(value)
+
+
+def remove_stale_result_files(ttl: float = RESULT_FILE_TTL):
+    """Delete the result files older than ttl seconds, left behind by clients which did not read them"""
+    directory = tempfile.gettempdir()
+    now = time.time()
+    for name in os.listdir(directory):
+        if name.startswith(RESULT_FILE_PREFIX):
+            path = os.path.join(directory, name)
+            try:
+                if now - os.stat(path).st_mtime > ttl:
+                    os.remove(path)
+            except OSError:
+                pass
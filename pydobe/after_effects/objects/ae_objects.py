@@ -1,22 +1,36 @@
 from __future__ import annotations
 
+import os
+from collections import namedtuple
+
 import pydobe
 from pydobe.core import (
     PydobeBaseObject,
     PydobeBaseCollection,
     format_to_extend,
     create_python_object,
+    eval_script,
+    raise_for_error,
+    call,
+    Code,
+    _decode_value,
+    columns_to_numpy,
+    CompiledScript,
+    BulkMode,
+    Transaction,
+    in_bulk_mode,
 )
-from pydobe.adobe_objects import File, Folder
+from pydobe.adobe_objects import File
 from pydobe.utils import hex_to_rgb
 from pydobe.after_effects.data import *
 from pydobe.after_effects.ae_utils import *
 
-
 # BASE OBJECTS
 
 
 class Application(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -33,7 +47,11 @@ class Application(PydobeBaseObject):
     @property
     def project(self) -> Project:
         kwargs = self._eval_on_object("project")
-        return Project(**kwargs) if kwargs else None
+        if not kwargs:
+            return None
+        project = Project(**kwargs)
+        project.address = "app.project"
+        return project
 
     # FUNCTIONS
 
@@ -57,15 +75,35 @@ class Application(PydobeBaseObject):
         else:
             self.project.close(save=False)
         if path:
-            file = File(**eval_script_returning_object(f'File("{path}")'))
-            extend_file_object = format_to_extend(file)
-            kwargs = self._eval_on_object(f"open({extend_file_object})")
+            kwargs = self._eval_on_object(f"open(new File({format_to_extend(path)}))")
         else:
-            kwargs = self._eval_on_object(f"open()")
+            _raise_in_bulk_mode("Opening a project without a path")
+            kwargs = self._eval_on_object("open()")
         return Project(**kwargs) if kwargs else None
 
 
+def bulk_mode(hide_project_panel: bool = True) -> BulkMode:
+    """Suppress dialogs and hide the Project panel for heavy jobs, within it functions which would wait
+    on a dialog raise instead. Scripts can not read whether the Project panel is shown, so it is shown
+    when bulk mode ends even if it was hidden before, pass hide_project_panel=False to leave it as it is"""
+    enter = "app.beginSuppressDialogs();"
+    exit = "app.endSuppressDialogs(false);"
+    if hide_project_panel:
+        enter += "\napp.project.showWindow(false);"
+        exit += "\napp.project.showWindow(true);"
+    return BulkMode(enter, exit)
+
+
+def _raise_in_bulk_mode(action: str):
+    if in_bulk_mode():
+        raise RuntimeError(
+            f"{action} would wait on a dialog, which bulk mode does not allow"
+        )
+
+
 class Project(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -96,7 +134,7 @@ class Project(PydobeBaseObject):
                 "Unable to set 'bits_per_channel', value must be 8, 16, or 32"
             )
         else:
-            self._eval_on_object(f"bitsPerChannel = {value}")
+            self._set_on_object("bitsPerChannel", value)
 
     """Compensate for scene referred profiles"""
 
@@ -106,8 +144,7 @@ class Project(PydobeBaseObject):
 
     @compensate_for_scene_referred_profiles.setter
     def compensate_for_scene_referred_profiles(self, value):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"compensateForSceneReferredProfiles = {extend_value}")
+        self._set_on_object("compensateForSceneReferredProfiles", value)
 
     """Returns True if file has been modified since last save. False if it has not"""
 
@@ -125,7 +162,7 @@ class Project(PydobeBaseObject):
     def display_start_frame(self, value: int):
         if value > 1:
             raise ValueError("Display start frame must be set to either 0 or 1")
-        self._eval_on_object(f"displayStartFrame = {value}")
+        self._set_on_object("displayStartFrame", value)
 
     """The expression engine setting in the Project Settings dialog box"""
 
@@ -137,7 +174,7 @@ class Project(PydobeBaseObject):
     def expression_engine(self, value: str):
         if value != "javascript-1.0" and value != "extendscript":
             raise ValueError("No engine exists by this name")
-        self._eval_on_object(f'expressionEngine = "{value}"')
+        self._set_on_object("expressionEngine", value)
 
     """The Use Feet + Frames menu setting"""
 
@@ -151,7 +188,7 @@ class Project(PydobeBaseObject):
     def feet_frames_film_type(self, value: int or str):
         if type(value) == str:
             value = feet_and_frames_dictionary[value]
-        self._eval_on_object(f"feetFramesFilmType = {value}")
+        self._set_on_object("feetFramesFilmType", value)
 
     """"Identifies the file object containing the project"""
 
@@ -172,7 +209,7 @@ class Project(PydobeBaseObject):
     def footage_timecode_display_start_type(self, value: int):
         if type(value) == str:
             value = footage_start_time_dictionary[value]
-        self._eval_on_object(f"footageTimecodeDisplayStartType = {value}")
+        self._set_on_object("footageTimecodeDisplayStartType", value)
 
     """The frame count menu setting"""
 
@@ -187,7 +224,7 @@ class Project(PydobeBaseObject):
     def frames_count_type(self, value: int):
         if type(value) == str:
             value = frames_count_dictionary[value]
-        self._eval_on_object(f"framesCountType = {value}")
+        self._set_on_object("framesCountType", value)
 
     """The Use Feet + Frames menu setting - 16mm or 35mm"""
 
@@ -197,8 +234,7 @@ class Project(PydobeBaseObject):
 
     @frames_use_feet_frames.setter
     def frames_use_feet_frames(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"framesUseFeetFrames = {extend_value}")
+        self._set_on_object("framesUseFeetFrames", value)
 
     """The frame count menu setting"""
 
@@ -214,7 +250,7 @@ class Project(PydobeBaseObject):
             value = gpu_accel_type_dictionary[value]
         if value not in pydobe.objects.app.available_gpu_accel_types:
             raise ValueError("This GPU Acceleration is not available")
-        self._eval_on_object(f"gpuAccelType = {value}")
+        self._set_on_object("gpuAccelType", value)
 
     """All of the items in the project"""
 
@@ -231,8 +267,7 @@ class Project(PydobeBaseObject):
 
     @linear_blending.setter
     def linear_blending(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"linearBlending = {extend_value}")
+        self._set_on_object("linearBlending", value)
 
     """True if linearize working space should be enabled for this project"""
 
@@ -242,8 +277,7 @@ class Project(PydobeBaseObject):
 
     @linearize_working_space.setter
     def linearize_working_space(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"linearizeWorkingSpace = {extend_value}")
+        self._set_on_object("linearizeWorkingSpace", value)
 
     """The number of items within the project"""
 
@@ -296,7 +330,7 @@ class Project(PydobeBaseObject):
     def time_display_type(self, value: int or str):
         if type(value) == str:
             value = time_display_dictionary[value]
-        self._eval_on_object(f"timeDisplayType = {value}")
+        self._set_on_object("timeDisplayType", value)
 
     """The active tool in the tools panel"""
 
@@ -310,7 +344,7 @@ class Project(PydobeBaseObject):
     def tool_type(self, value: int or str):
         if type(value) == str:
             value = tool_dictionary[value]
-        self._eval_on_object(f"toolType = {value}")
+        self._set_on_object("toolType", value)
 
     """When true, thumbnail views use the transparency checkerboard pattern."""
 
@@ -320,8 +354,7 @@ class Project(PydobeBaseObject):
 
     @transparency_grid_thumbnails.setter
     def transparency_grid_thumbnails(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"transparencyGridThumbnails = {extend_value}")
+        self._set_on_object("transparencyGridThumbnails", value)
 
     """Working gamma value. Only used when color working space is set to none"""
 
@@ -334,7 +367,7 @@ class Project(PydobeBaseObject):
         if value not in [2.2, 2.4]:
             raise ValueError("Unable to set 'working_gamma', value must be 2.2 or 2.4")
         else:
-            self._eval_on_object(f'workingGamma = "{value}"')
+            self._set_on_object("workingGamma", value)
 
     """Color profile description"""
 
@@ -345,7 +378,7 @@ class Project(PydobeBaseObject):
     @working_space.setter
     def working_space(self, value: str):
         if value in self.list_color_profiles():
-            self._eval_on_object(f'workingSpace = "{value}"')
+            self._set_on_object("workingSpace", value)
         else:
             raise ValueError(
                 "Unable to set 'workingSpace', value must be an accepted color profile"
@@ -359,7 +392,7 @@ class Project(PydobeBaseObject):
 
     @xmp_packet.setter
     def xmp_packet(self, value: str):
-        self._eval_on_object(f'xmpPacket = "{value}"')
+        self._set_on_object("xmpPacket", value)
 
     # CUSTOM PROPERTIES
 
@@ -397,11 +430,12 @@ class Project(PydobeBaseObject):
 
     def auto_fix_expressions(self, old_text, new_text):
         """Automatically replaces text found in broken expressions in the project"""
-        self._eval_on_object(f'autoFixExpressions("{old_text}", "{new_text})')
+        self._call_on_object("autoFixExpressions", old_text, new_text)
 
     def close(self, save: bool = None) -> bool:
         """This will close the current project with an option to save changes or not"""
         if save is None:
+            _raise_in_bulk_mode("Closing the project without save=True or save=False")
             return self._eval_on_object("close(CloseOptions.PROMPT_TO_SAVE_CHANGES)")
         elif save:
             return self._eval_on_object("close(CloseOptions.SAVE_CHANGES)")
@@ -413,108 +447,215 @@ class Project(PydobeBaseObject):
         return self._eval_on_object("consolidateFootage()")
 
     def import_file(
-            self, path: str, sequence: bool = False, force_alphabetical: bool = False
+        self, path: str, sequence: bool = False, force_alphabetical: bool = False
     ):
         """This will import a file"""
         import_options = ImportOptions(
             **eval_script_returning_object("new ImportOptions()")
         )
-        file = File(**eval_script_returning_object(f'File("{path}")'))
-        import_options.file = file
+        import_options.file = File(
+            **eval_script_returning_object(f"new File({format_to_extend(path)})")
+        )
         import_options.sequence = sequence
         import_options.force_alphabetical = force_alphabetical
-        extend_import_options = format_to_extend(import_options)
-        kwargs = self._eval_on_object(f"importFile({extend_import_options})")
-        return FootageItem(**kwargs) if kwargs else None
+        kwargs = self._call_on_object("importFile", import_options)
+        return create_python_object(kwargs["object_type"])(**kwargs) if kwargs else None
+
+    def import_files(
+        self,
+        paths: list[str],
+        sequence: bool = False,
+        force_alphabetical: bool = False,
+        target_folder: FolderItem = None,
+    ) -> ImportResult:
+        """Import files in a single call, returns the imported items and the error message of every path which failed
+
+        Paths can be FileSequence objects from pydobe.scanner, which are imported as sequences when they have several frames.
+        Errors are keyed by path, a path given several times which failed keeps the message of its last failure
+        """
+        paths = list(paths)
+        sequences = [getattr(path, "is_sequence", sequence) for path in paths]
+        paths = [os.fspath(path) for path in paths]
+        if not paths:
+            return ImportResult([], {})
+        result = raise_for_error(
+            _IMPORT_SCRIPT(paths, sequences, force_alphabetical, target_folder, self)
+        )
+        items = []
+        for value in result["items"]:
+            # projects and layered files are imported as folders or compositions
+            kwargs = _decode_value(value)
+            items.append(create_python_object(kwargs["object_type"])(**kwargs))
+        errors = {paths[index]: message for index, message in result["errors"]}
+        return ImportResult(items, errors)
+
+    def relink(
+        self,
+        rules: dict or list,
+        only_missing: bool = False,
+        check_exists: bool = True,
+        dry_run: bool = False,
+    ) -> RelinkReport:
+        """Relink file footage to new paths in two calls, rules map old path prefixes to new ones
+
+        Rules are a {old prefix: new prefix} dict, or a list of (old prefix, new prefix) pairs and functions
+        returning the new path of a path (or None), the first matching rule applies. New paths are checked
+        on this machine in parallel, footage whose new path does not exist is left alone.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from pydobe.scanner import SEQUENCE_EXTENSIONS
+
+        rules = list(rules.items()) if isinstance(rules, dict) else list(rules)
+        footage = raise_for_error(_FILE_FOOTAGE_SCRIPT(self))
+
+        unmatched = []
+        candidates = []
+        item_ids = {}  # id() of the items: their After Effects id
+        for item_id, path, is_still, is_missing in footage:
+            # reached by id when used, rather than registering every file footage item of the project
+            item = FootageItem.at(f"app.project.itemByID({item_id})")
+            item_ids[id(item)] = item_id
+            new_path = _map_path(path, rules)
+            if new_path is None:
+                unmatched.append((item, path))
+            elif new_path != path and (is_missing or not only_missing):
+                is_sequence = (
+                    not is_still
+                    and os.path.splitext(path)[1].lower() in SEQUENCE_EXTENSIONS
+                )
+                candidates.append((item, path, new_path, is_sequence))
+
+        if check_exists and candidates:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                exists = list(
+                    executor.map(
+                        os.path.exists, [new_path for _, _, new_path, _ in candidates]
+                    )
+                )
+        else:
+            exists = [True] * len(candidates)
+        relinks = [candidate for candidate, found in zip(candidates, exists) if found]
+        not_found = [
+            (item, path, new_path)
+            for (item, path, new_path, _), found in zip(candidates, exists)
+            if not found
+        ]
+
+        errors = []
+        if relinks and not dry_run:
+            relink_list = [
+                [item_ids[id(item)], new_path, is_sequence]
+                for item, _, new_path, is_sequence in relinks
+            ]
+            errors = [
+                (relinks[index][0], relinks[index][1], message)
+                for index, message in raise_for_error(_RELINK_SCRIPT(relink_list, self))
+            ]
+        failed = {id(item) for item, _, _ in errors}
+        relinked = [
+            (item, path, new_path)
+            for item, path, new_path, _ in relinks
+            if id(item) not in failed
+        ]
+        return RelinkReport(relinked, not_found, unmatched, errors)
 
     def import_file_with_dialog(self) -> list:
         """Shows an import file dialog box"""
+        _raise_in_bulk_mode("Importing with a dialog")
         return self._eval_on_object("importFileWithDialog()")
 
     def import_placeholder(
-            self,
-            name: str,
-            width: int,
-            height: int,
-            frame_rate: float,
-            duration: float or str,
-            duration_in_current_format: bool = True,
+        self,
+        name: str,
+        width: int,
+        height: int,
+        frame_rate: float,
+        duration: float or str,
+        duration_in_current_format: bool = True,
     ) -> object:
         """Shows an import file dialog box"""
         if duration_in_current_format:
             duration = time_to_current_format(duration, frame_rate)
-        kwargs = self._eval_on_object(
-            f'importPlaceholder("{name}", {width}, {height}, {frame_rate}, {duration})'
+        kwargs = self._call_on_object(
+            "importPlaceholder", name, width, height, frame_rate, duration
         )
         return FootageItem(**kwargs) if kwargs else None
 
     def item(self, index: int) -> object:
         """Retrieves an item at a specified index position"""
-        index = index + 1
-        kwargs = self._eval_on_object(f"item({index})")
+        kwargs = self._call_on_object("item", index + 1)
         object_type = kwargs["object_type"]
         item = create_python_object(object_type)(**kwargs)
         return item
 
     def item_by_id(self, item_id: int) -> Item:
         """Retrieves an item by its ID"""
-        kwargs = self._eval_on_object(f"itemByID({item_id})")
+        kwargs = self._call_on_object("itemByID", item_id)
         object_type = kwargs["object_type"]
         item = create_python_object(object_type)(**kwargs)
+        item.address = f"app.project.itemByID({int(item_id)})"
         return item
 
     def layer_by_id(self, layer_id: int) -> Layer:
         """Retrieves a layer by its ID"""
-        kwargs = self._eval_on_object(f"layerByID({layer_id})")
+        kwargs = self._call_on_object("layerByID", layer_id)
         object_type = kwargs["object_type"]
         layer = create_python_object(object_type)(**kwargs)
+        layer.address = f"app.project.layerByID({int(layer_id)})"
         return layer
 
     def reduce_project(self, items: list[Item]) -> int:
         """Removes all items from the project except those specified"""
-        extend_items = format_to_extend(items)
-        return self._eval_on_object(f"reduceProject({extend_items})")
+        return self._call_on_object("reduceProject", items)
 
     def remove_unused_footage(self) -> int:
         """Removes unused footage from the project"""
-        return self._eval_on_object(f"removeUnusedFootage()")
+        return self._eval_on_object("removeUnusedFootage()")
 
     def set_default_import_folder(self, path: str) -> bool:
         """Sets the folder that will be shown in the file import dialog"""
-        folder = Folder(**eval_script_returning_object(f'Folder("{path}")'))
-        extend_folder = format_to_extend(folder)
-        return self._eval_on_object(f"setDefaultImportFolder({extend_folder})")
+        return self._eval_on_object(
+            f"setDefaultImportFolder(new Folder({format_to_extend(path)}))"
+        )
 
     def save(self, path: str = None) -> bool:
         """This will save the current scene"""
         if path:
-            file = File(**eval_script_returning_object(f'File("{path}")'))
-            extend_file_object = format_to_extend(file)
-            return self._eval_on_object(f"save({extend_file_object})")
+            return self._eval_on_object(f"save(new File({format_to_extend(path)}))")
         else:
             return self._eval_on_object("save()")
 
     def save_with_dialog(self) -> bool:
         """This will prompt the user to save with a dialog box"""
+        _raise_in_bulk_mode("Saving with a dialog")
         return self._eval_on_object("saveWithDialog()")
 
     def show_window(self, show: bool):
         """Shows or hides the Project panel."""
-        extend_show = format_to_extend(show)
-        return self._eval_on_object(f"showWindow({extend_show})")
+        return self._call_on_object("showWindow", show)
 
     def list_color_profiles(self) -> list[list]:
         """List of available color profile descriptions"""
-        return self._eval_on_object(f"listColorProfiles()")
+        return self._eval_on_object("listColorProfiles()")
 
     # CUSTOM FUNCTIONS
 
+    def transaction(self, name: str) -> Transaction:
+        """Group the changes made within the context into one undo step, sending attribute changes in as few
+        requests as possible. Everything done within the transaction is undone if it fails
+        """
+        return Transaction(
+            begin=f"app.beginUndoGroup({format_to_extend(name)});",
+            commit="app.endUndoGroup();",
+            rollback=f"app.endUndoGroup();\napp.executeCommand({UNDO_COMMAND});",
+        )
+
     def item_by_name(self, name: str) -> Item:
         """Get an item by its name from within this project"""
-        for item in self.items:
-            if item.name == name:
-                return item
-        raise LookupError("There is no item by this name in your project")
+        kwargs = call("find", self.items.pydobe_id, "name", name)
+        if not kwargs:
+            raise LookupError("There is no item by this name in your project")
+        return create_python_object(kwargs["object_type"])(**kwargs)
 
     def save_incremental(self):
         """Save incremental"""
@@ -524,7 +665,107 @@ class Project(PydobeBaseObject):
 # ITEMS
 
 
+ImportResult = namedtuple(
+    "ImportResult",
+    [
+        "items",  # items imported, in the order of their paths: FootageItems, or FolderItems and CompItems
+        "errors",  # error message by path, for the paths which could not be imported, once per path
+    ],
+)
+
+RelinkReport = namedtuple(
+    "RelinkReport",
+    [
+        "relinked",  # (FootageItem, old path, new path) of the footage relinked
+        "not_found",  # (FootageItem, old path, new path) of the footage left alone as its new path does not exist
+        "unmatched",  # (FootageItem, path) of the file footage no rule applies to
+        "errors",  # (FootageItem, old path, error message) of the replacements After Effects refused
+    ],
+)
+
+_IMPORT_SCRIPT = CompiledScript(
+    ["paths", "sequences", "forceAlphabetical", "folder", "project"],
+    r"""var quote = $._pydobe.quote;
+var items = [];
+var errors = [];
+for (var i = 0; i < paths.length; i++) {
+    try {
+        var options = new ImportOptions();
+        options.file = new File(paths[i]);
+        options.sequence = sequences[i];
+        options.forceAlphabetical = forceAlphabetical;
+        var item = project.importFile(options);
+        if (folder !== null) {item.parentFolder = folder}
+        items.push($._pydobe.register(item));
+    } catch (e) {
+        errors.push("[" + i + "," + quote(e.message) + "]");
+    }
+}
+return '{"items":[' + items.join(",") + '],"errors":[' + errors.join(",") + ']}';""",
+)
+
+_FILE_FOOTAGE_SCRIPT = CompiledScript(
+    ["project"],
+    r"""var quote = $._pydobe.quote;
+var footage = [];
+for (var i = 1; i <= project.numItems; i++) {
+    var item = project.item(i);
+    if (!(item instanceof FootageItem) || !(item.mainSource instanceof FileSource)) {continue}
+    var source = item.mainSource;
+    var path = source.missingFootagePath || (source.file ? source.file.fsName : "");
+    if (!path) {continue}
+    footage.push("[" + item.id + "," + quote(path) + "," + source.isStill + "," + (source.missingFootagePath !== "") + "]");
+}
+return '[' + footage.join(",") + ']';""",
+    changes=False,
+)
+
+_RELINK_SCRIPT = CompiledScript(
+    ["relinks", "project"],
+    r"""var quote = $._pydobe.quote;
+var errors = [];
+for (var i = 0; i < relinks.length; i++) {
+    try {
+        var item = project.itemByID(relinks[i][0]);
+        if (relinks[i][2]) {
+            item.replaceWithSequence(new File(relinks[i][1]), false);
+        } else {
+            item.replace(new File(relinks[i][1]));
+        }
+    } catch (e) {
+        errors.push("[" + i + "," + quote(e.message) + "]");
+    }
+}
+return '[' + errors.join(",") + ']';""",
+)
+
+
+def _map_path(path: str, rules: list) -> str or None:
+    """Apply the first matching rule to a path, rules being (old prefix, new prefix) pairs or functions
+
+    Prefixes match whole folder names whatever their case and separators, as paths written on Windows
+    (D:\\Plates) are read back from projects in other forms (d:/plates)."""
+    parts = path.replace("\\", "/").split("/")
+    folded = [part.casefold() for part in parts]
+    for rule in rules:
+        if callable(rule):
+            new_path = rule(path)
+            if new_path:
+                return new_path
+            continue
+        old_prefix, new_prefix = rule
+        old_parts = [
+            part.casefold()
+            for part in old_prefix.replace("\\", "/").rstrip("/").split("/")
+        ]
+        if folded[: len(old_parts)] == old_parts:
+            return "/".join([new_prefix.rstrip("/\\")] + parts[len(old_parts) :])
+    return None
+
+
 class Item(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -541,7 +782,7 @@ class Item(PydobeBaseObject):
 
     @comment.setter
     def comment(self, value: str):
-        self._eval_on_object(f'comment = "{value}"')
+        self._set_on_object("comment", value)
 
     """A unique and persistent identification number used for the dynamic link"""
 
@@ -581,7 +822,7 @@ class Item(PydobeBaseObject):
                     "Cannot set label, value is not an available label color"
                 )
             int_value = label_dictionary[value]
-        self._eval_on_object(f"label = {int_value};")
+        self._set_on_object("label", int_value)
 
     """The name of the item as displayed in the Project panel"""
 
@@ -591,7 +832,7 @@ class Item(PydobeBaseObject):
 
     @name.setter
     def name(self, value: str):
-        self._eval_on_object(f'name = "{value}"')
+        self._set_on_object("name", value)
 
     """The folder object that the item is parented to"""
 
@@ -603,8 +844,7 @@ class Item(PydobeBaseObject):
     @parent_folder.setter
     def parent_folder(self, value: FolderItem):
         if value.object_type == "FolderItem":
-            extend_value = format_to_extend(value)
-            self._eval_on_object(f"parentFolder = {extend_value}")
+            self._set_on_object("parentFolder", value)
         else:
             raise TypeError("Unable to set 'parent_folder', type must be 'Folder'")
 
@@ -616,8 +856,7 @@ class Item(PydobeBaseObject):
 
     @selected.setter
     def selected(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"selected = {extend_value}")
+        self._set_on_object("selected", value)
 
     """User readable name for Item type"""
 
@@ -629,7 +868,7 @@ class Item(PydobeBaseObject):
 
     def add_guide(self, orientation: int, position: int):
         """Creates a new guide and adds it to the guides object of the Item."""
-        self._eval_on_object(f"addGuide({orientation},{position})")
+        self._call_on_object("addGuide", orientation, position)
 
     def duplicate(self):
         """Duplicates the Item"""
@@ -645,16 +884,18 @@ class Item(PydobeBaseObject):
         """Removes an existing guide. Choose the guide based on its index"""
         if index not in range(len(self.guides)):
             raise ValueError("The index provided is outside of the range of guides")
-        self._eval_on_object(f"removeGuide({index})")
+        self._call_on_object("removeGuide", index)
 
     def set_guide(self, position: int, index: int):
         """Modifies the position of an existing guide"""
         if index not in range(len(self.guides)):
             raise ValueError("The index provided is outside of the range of guides")
-        self._eval_on_object(f"setGuide({position}, {index})")
+        self._call_on_object("setGuide", position, index)
 
 
 class AVItem(Item):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -666,7 +907,7 @@ class AVItem(Item):
 
     @duration.setter
     def duration(self, value: float):
-        self._eval_on_object(f"duration = {value}")
+        self._set_on_object("duration", value)
 
     """When true the item is a placeholder"""
 
@@ -682,7 +923,7 @@ class AVItem(Item):
 
     @frame_duration.setter
     def frame_duration(self, value: float):
-        self._eval_on_object(f"frameDuration = {value}")
+        self._set_on_object("frameDuration", value)
 
     """The fps of the item, when set the frame duration is automatically set"""
 
@@ -692,7 +933,7 @@ class AVItem(Item):
 
     @frame_rate.setter
     def frame_rate(self, value: float):
-        self._eval_on_object(f"frameRate = {value}")
+        self._set_on_object("frameRate", value)
 
     """Returns True if the item has an audio component"""
 
@@ -714,7 +955,7 @@ class AVItem(Item):
 
     @height.setter
     def height(self, value: int):
-        self._eval_on_object(f"height = {value}")
+        self._set_on_object("height", value)
 
     """Test whether the AVItem can be used as an alternate source when calling Property.set_alternate_source()."""
 
@@ -730,7 +971,7 @@ class AVItem(Item):
 
     @pixel_aspect.setter
     def pixel_aspect(self, value: float):
-        self._eval_on_object(f"pixelAspect = {value}")
+        self._set_on_object("pixelAspect", value)
 
     """The Footage Source being used as a proxy"""
 
@@ -747,7 +988,7 @@ class AVItem(Item):
 
     @time.setter
     def time(self, value: float):
-        self._eval_on_object(f'time = "{value}"')
+        self._set_on_object("time", value)
 
     """A list of compositions that use this item"""
 
@@ -768,8 +1009,7 @@ class AVItem(Item):
 
     @use_proxy.setter
     def use_proxy(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f'useProxy = "{extend_value}"')
+        self._set_on_object("useProxy", value)
 
     """The width of the item in pixels"""
 
@@ -779,7 +1019,7 @@ class AVItem(Item):
 
     @width.setter
     def width(self, value: int):
-        self._eval_on_object(f"width = {value}")
+        self._set_on_object("width", value)
 
     # CUSTOM PROPERTIES
 
@@ -790,7 +1030,7 @@ class AVItem(Item):
     @time_in_current_format.setter
     def time_in_current_format(self, value: str):
         value = current_format_to_time(value, self.frame_rate)
-        self._eval_on_object(f'time = "{value}"')
+        self._set_on_object("time", value)
 
     @property
     def duration_in_current_format(self) -> str:
@@ -799,48 +1039,45 @@ class AVItem(Item):
     @duration_in_current_format.setter
     def duration_in_current_format(self, value: str):
         value = current_format_to_time(value, self.frame_rate)
-        self._eval_on_object(f'duration = "{value}"')
+        self._set_on_object("duration", value)
 
     # FUNCTIONS
 
     def set_proxy(self, file_path: str):
         """Sets a file as the proxy of this AVItem."""
-        file = File(**eval_script_returning_object(f'File("{file_path}")'))
-        extend_file_object = format_to_extend(file)
-        self._eval_on_object(f"setProxy({extend_file_object})")
+        self._eval_on_object(f"setProxy(new File({format_to_extend(file_path)}))")
 
     def set_proxy_to_none(self):
         """Removes the proxy from this AVItem"""
         self._eval_on_object("setProxyToNone()")
 
     def set_proxy_with_placeholder(
-            self, name: str, width: int, height: int, frame_rate: int, duration: float
+        self, name: str, width: int, height: int, frame_rate: int, duration: float
     ):
         """Creates a PlaceholderSource object with specified values, sets this as the value of the proxySource
         attribute"""
-        self._eval_on_object(
-            f'setProxyWithPlaceholder("{name}", {width}, {height}, {frame_rate}, {duration})'
+        self._call_on_object(
+            "setProxyWithPlaceholder", name, width, height, frame_rate, duration
         )
 
     def set_proxy_with_sequence(self, file_path: str, force_alphabetical: bool = False):
         """Sets a sequence of files as the proxy of this AVItem"""
-        file = File(**eval_script_returning_object(f'File("{file_path}")'))
-        extend_file_object = format_to_extend(file)
-        extend_force_alphabetical = format_to_extend(force_alphabetical)
         self._eval_on_object(
-            f"setProxyWithSequence({extend_file_object}, {extend_force_alphabetical})"
+            f"setProxyWithSequence(new File({format_to_extend(file_path)}), {format_to_extend(force_alphabetical)})"
         )
 
     def set_proxy_with_solid(
-            self, color: list, name: str, width: int, height: int, pixel_aspect: float
+        self, color: list, name: str, width: int, height: int, pixel_aspect: float
     ):
         """Creates a SolidSource object with specified values, sets this as the value of the proxySource attribute"""
-        self._eval_on_object(
-            f'setProxyWithSolid({color}, "{name}", {width}, {height}, {pixel_aspect})'
+        self._call_on_object(
+            "setProxyWithSolid", color, name, width, height, pixel_aspect
         )
 
 
 class CompItem(AVItem):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -863,7 +1100,7 @@ class CompItem(AVItem):
     def bg_color(self, value: list or str):
         if type(value) == str:
             value = hex_to_rgb(value)
-        self._eval_on_object(f"bgColor = {value}")
+        self._set_on_object("bgColor", value)
 
     """The time set as the beginning of the composition in frames"""
 
@@ -873,7 +1110,7 @@ class CompItem(AVItem):
 
     @display_start_frame.setter
     def display_start_frame(self, value: int):
-        self._eval_on_object(f"displayStartFrame = {value}")
+        self._set_on_object("displayStartFrame", value)
 
     """The time set as the beginning of the composition in seconds"""
 
@@ -883,7 +1120,7 @@ class CompItem(AVItem):
 
     @display_start_time.setter
     def display_start_time(self, value: float):
-        self._eval_on_object(f"displayStartTime = {value}")
+        self._set_on_object("displayStartTime", value)
 
     """When true, Draft 3D mode is enabled for the Composition panel."""
 
@@ -893,8 +1130,7 @@ class CompItem(AVItem):
 
     @draft_3d.setter
     def draft_3d(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"draft3d = {extend_value}")
+        self._set_on_object("draft3d", value)
 
     """When true, indicates that the composition uses drop-frame timecode."""
 
@@ -904,8 +1140,7 @@ class CompItem(AVItem):
 
     @drop_frame.setter
     def drop_frame(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"dropFrame = {extend_value}")
+        self._set_on_object("dropFrame", value)
 
     """When true, frame blending is enabled for this Composition."""
 
@@ -915,8 +1150,7 @@ class CompItem(AVItem):
 
     @frame_blending.setter
     def frame_blending(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"frameBlending = {extend_value}")
+        self._set_on_object("frameBlending", value)
 
     """The duration of a frame, in seconds. This is the inverse of the frameRate value"""
 
@@ -926,7 +1160,7 @@ class CompItem(AVItem):
 
     @frame_duration.setter
     def frame_duration(self, value: float):
-        self._eval_on_object(f"frameDuration = {value}")
+        self._set_on_object("frameDuration", value)
 
     """When true, only layers with shy set to false are shown in the Timeline panel"""
 
@@ -936,8 +1170,7 @@ class CompItem(AVItem):
 
     @hide_shy_layers.setter
     def hide_shy_layers(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"hideShyLayers = {extend_value}")
+        self._set_on_object("hideShyLayers", value)
 
     """All of the layers in the composition"""
 
@@ -961,8 +1194,7 @@ class CompItem(AVItem):
 
     @motion_blur.setter
     def motion_blur(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"motionBlur = {extend_value}")
+        self._set_on_object("motionBlur", value)
 
     """The maximum number of motion blur samples of 2D layer motion."""
 
@@ -976,7 +1208,7 @@ class CompItem(AVItem):
             raise ValueError(
                 "Cannot set motion blur adaptive sample limit, value must be between 16 and 256"
             )
-        self._eval_on_object(f"motionBlurAdaptiveSampleLimit = {value}")
+        self._set_on_object("motionBlurAdaptiveSampleLimit", value)
 
     """The minimum number of motion blur samples per frame for Classic 3D layers, shape layers, and certain effects"""
 
@@ -990,7 +1222,7 @@ class CompItem(AVItem):
             raise ValueError(
                 "Cannot set motion blur adaptive sample limit, value must be between 2 and 64"
             )
-        self._eval_on_object(f"motionBlurSamplesPerFrame = {value}")
+        self._set_on_object("motionBlurSamplesPerFrame", value)
 
     """The number of properties in the Essential Graphics panel for the composition"""
 
@@ -1006,7 +1238,7 @@ class CompItem(AVItem):
 
     @motion_graphics_template_name.setter
     def motion_graphics_template_name(self, value: str):
-        self._eval_on_object(f'motionGraphicsTemplateName = "{value}"')
+        self._set_on_object("motionGraphicsTemplateName", value)
 
     """The number of Layers in the Composition"""
 
@@ -1022,8 +1254,7 @@ class CompItem(AVItem):
 
     @preserve_nested_frame_rate.setter
     def preserve_nested_frame_rate(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"preserveNestedFrameRate = {extend_value}")
+        self._set_on_object("preserveNestedFrameRate", value)
 
     """When true, the resolution of nested compositions is preserved in the current composition."""
 
@@ -1033,8 +1264,7 @@ class CompItem(AVItem):
 
     @preserve_nested_resolution.setter
     def preserve_nested_resolution(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"preserveNestedResolution = {extend_value}")
+        self._set_on_object("preserveNestedResolution", value)
 
     """The current rendering plug-in module to be used to render this composition"""
 
@@ -1046,8 +1276,7 @@ class CompItem(AVItem):
     def renderer(self, value: str):
         if value not in self.renderers:
             raise ValueError(f"{value} is not a valid renderer")
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"renderer = {extend_value}")
+        self._set_on_object("renderer", value)
 
     """The available rendering plugin modules"""
 
@@ -1063,7 +1292,7 @@ class CompItem(AVItem):
 
     @resolution_factor.setter
     def resolution_factor(self, value: list[int]):
-        self._eval_on_object(f"resolutionFactor = {value}")
+        self._set_on_object("resolutionFactor", value)
 
     """All of the selected layers in this composition."""
 
@@ -1104,7 +1333,7 @@ class CompItem(AVItem):
             raise ValueError(
                 "Cannot set shutter angle, value must be between 0 and 720"
             )
-        self._eval_on_object(f"shutterAngle = {value}")
+        self._set_on_object("shutterAngle", value)
 
     """The shutter phase setting for the composition."""
 
@@ -1118,7 +1347,7 @@ class CompItem(AVItem):
             raise ValueError(
                 "Cannot set shutter phase, value must be between -360 and 360"
             )
-        self._eval_on_object(f"shutterPhase = {value}")
+        self._set_on_object("shutterPhase", value)
 
     """The duration of the work area in seconds"""
 
@@ -1128,7 +1357,7 @@ class CompItem(AVItem):
 
     @work_area_duration.setter
     def work_area_duration(self, value: float):
-        self._eval_on_object(f"workAreaDuration = {value}")
+        self._set_on_object("workAreaDuration", value)
 
     """The time when the Composition work area begins, in seconds."""
 
@@ -1138,7 +1367,7 @@ class CompItem(AVItem):
 
     @work_area_start.setter
     def work_area_start(self, value: float):
-        self._eval_on_object(f"workAreaStart = {value}")
+        self._set_on_object("workAreaStart", value)
 
     # CUSTOM PROPERTIES
 
@@ -1151,7 +1380,7 @@ class CompItem(AVItem):
     @work_area_duration_in_current_format.setter
     def work_area_duration_in_current_format(self, value: str or int):
         value = current_format_to_time(value, self.frame_rate)
-        self._eval_on_object(f"workAreaDuration = {value}")
+        self._set_on_object("workAreaDuration", value)
 
     @property
     def work_area_start_in_current_format(self) -> str:
@@ -1162,50 +1391,45 @@ class CompItem(AVItem):
     @work_area_start_in_current_format.setter
     def work_area_start_in_current_format(self, value: str or int):
         value = current_format_to_time(value, self.frame_rate)
-        self._eval_on_object(f"workAreaStart = {value}")
+        self._set_on_object("workAreaStart", value)
 
     # FUNCTIONS
 
     def export_as_motion_graphics_template(
-            self, overwrite: bool = True, path: str = None
+        self, overwrite: bool = True, path: str = None
     ) -> bool:
         """Exports the composition as a Motion Graphics template."""
-        extend_overwrite = format_to_extend(overwrite)
         if path:
-            return self._eval_on_object(
-                f'exportAsMotionGraphicsTemplate({extend_overwrite},"{path}")'
+            return self._call_on_object(
+                "exportAsMotionGraphicsTemplate", overwrite, path
             )
         else:
-            return self._eval_on_object(
-                f"exportAsMotionGraphicsTemplate({extend_overwrite})"
-            )
+            return self._call_on_object("exportAsMotionGraphicsTemplate", overwrite)
 
     def get_motion_graphics_template_controller_name(self, index: int) -> str:
         """Gets the name of a single property in the Essential Graphics panel."""
-        index += 1
-        return self._eval_on_object(f"getMotionGraphicsTemplateControllerName({index})")
+        return self._call_on_object(
+            "getMotionGraphicsTemplateControllerName", index + 1
+        )
 
     def set_get_motion_graphics_controller_name(self, index: int, name: str) -> str:
         """Sets the name of a single property in the Essential Graphics panel."""
-        index += 1
-        return self._eval_on_object(
-            f'getMotionGraphicsTemplateControllerName({index}, "{name}")'
+        return self._call_on_object(
+            "getMotionGraphicsTemplateControllerName", index + 1, name
         )
 
     def layer(self, layer, relative_index=None):
         """Returns a Layer object, which can be specified by name, an index position in this layer,
         or an index position relative to another layer."""
         if relative_index:
-            layer = format_to_extend(layer)
-            kwargs = self._eval_on_object(f"layer({layer}, {relative_index})")
+            kwargs = self._call_on_object("layer", layer, relative_index)
             if not kwargs.get("pydobe_id"):
                 raise ValueError("The value for the relative index is out of range")
         else:
             if type(layer) == str:
-                kwargs = self._eval_on_object(f'layer("{layer}")')
+                kwargs = self._call_on_object("layer", layer)
             else:
-                layer += 1
-                kwargs = self._eval_on_object(f"layer({layer})")
+                kwargs = self._call_on_object("layer", layer + 1)
         object_type = kwargs["object_type"]
         layer = create_python_object(object_type)(**kwargs)
         return layer
@@ -1221,6 +1445,8 @@ class CompItem(AVItem):
 
 
 class FolderItem(Item):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1275,14 +1501,15 @@ class FolderItem(Item):
 
     def item(self, sub_index: int) -> Item:
         """Returns the top-level item in this folder at the specified index position."""
-        sub_index += 1
-        kwargs = self._eval_on_object(f"item({sub_index})")
+        kwargs = self._call_on_object("item", sub_index + 1)
         object_type = kwargs["object_type"]
         item = create_python_object(object_type)(**kwargs)
         return item
 
 
 class FootageItem(AVItem):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1328,7 +1555,7 @@ class FootageItem(AVItem):
     @AVItem.height.setter
     def height(self, value: int):
         if self.main_source.object_type == "SolidSource":
-            self._eval_on_object(f"height = {value}")
+            self._set_on_object("height", value)
         else:
             raise AttributeError(
                 "Attribute 'height' cannot be set, as the item is neither a comp, nor a solid"
@@ -1337,7 +1564,7 @@ class FootageItem(AVItem):
     @AVItem.width.setter
     def width(self, value: int):
         if self.main_source.object_type == "SolidSource":
-            self._eval_on_object(f"width = {value}")
+            self._set_on_object("width", value)
         else:
             raise AttributeError(
                 "Attribute 'width' cannot be set, as the item is neither a comp, nor a solid"
@@ -1347,41 +1574,36 @@ class FootageItem(AVItem):
 
     def replace(self, path: str):
         """Changes the source of this Footage Item to the specified file"""
-        file = File(**eval_script_returning_object(f'File("{path}")'))
-        extend_file_object = format_to_extend(file)
-        self._eval_on_object(f"replace({extend_file_object})")
+        self._eval_on_object(f"replace(new File({format_to_extend(path)}))")
 
     def replace_with_placeholder(
-            self,
-            name: str,
-            width: int,
-            height: int,
-            frame_rate: float,
-            duration: float,
-            duration_in_current_format=True,
+        self,
+        name: str,
+        width: int,
+        height: int,
+        frame_rate: float,
+        duration: float,
+        duration_in_current_format=True,
     ):
         """Changes the source of this FootageItem to the specified placeholder"""
         if duration_in_current_format:
             duration = current_format_to_time(duration, frame_rate)
-        self._eval_on_object(
-            f'replaceWithPlaceholder("{name}", {width}, {height}, {frame_rate}, {duration})'
+        self._call_on_object(
+            "replaceWithPlaceholder", name, width, height, frame_rate, duration
         )
 
     def replace_with_sequence(self, path: str, force_alphabetical: bool = False):
         """Changes the source of this Footage Item to the specified image sequence."""
-        file = File(**eval_script_returning_object(f'File("{path}")'))
-        extend_file_object = format_to_extend(file)
-        force_alphabetical = format_to_extend(force_alphabetical)
         self._eval_on_object(
-            f"replaceWithSequence({extend_file_object}, {force_alphabetical})"
+            f"replaceWithSequence(new File({format_to_extend(path)}), {format_to_extend(force_alphabetical)})"
         )
 
     def replace_with_solid(
-            self, color: list, name: str, width: int, height: int, pixel_aspect: float
+        self, color: list, name: str, width: int, height: int, pixel_aspect: float
     ):
         """Changes the source of this FootageItem to the specified solid"""
-        self._eval_on_object(
-            f'replaceWithSolid({color},"{name}", {width}, {height}, {pixel_aspect})'
+        self._call_on_object(
+            "replaceWithSolid", color, name, width, height, pixel_aspect
         )
 
 
@@ -1389,6 +1611,8 @@ class FootageItem(AVItem):
 
 
 class FootageSource(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1406,7 +1630,7 @@ class FootageSource(PydobeBaseObject):
     def alpha_mode(self, value: str or int):
         if type(value) == str:
             value = alpha_dictionary[value]
-        self._eval_on_object(f"alphaMode = {value}")
+        self._set_on_object("alphaMode", value)
 
     """A frame rate to use instead of the native frame rate value."""
 
@@ -1416,7 +1640,7 @@ class FootageSource(PydobeBaseObject):
 
     @conform_frame_rate.setter
     def conform_frame_rate(self, value: float):
-        self._eval_on_object(f'conformFrameRate = "{value}"')
+        self._set_on_object("conformFrameRate", value)
 
     """The effective frame rate as displayed and rendered in compositions by After Effects."""
 
@@ -1436,7 +1660,7 @@ class FootageSource(PydobeBaseObject):
     def field_separation_type(self, value: int or str):
         if type(value) == str:
             value = field_separation_dictionary[value]
-        self._eval_on_object(f"fieldSeparationType = {value}")
+        self._set_on_object("fieldSeparationType", value)
 
     """When true, the footage has an alpha component."""
 
@@ -1452,8 +1676,7 @@ class FootageSource(PydobeBaseObject):
 
     @high_quality_field_separation.setter
     def high_quality_field_separation(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"highQualityFieldSeparation = {extend_value}")
+        self._set_on_object("highQualityFieldSeparation", value)
 
     """When true, the footage has an alpha component."""
 
@@ -1463,8 +1686,7 @@ class FootageSource(PydobeBaseObject):
 
     @invert_alpha.setter
     def invert_alpha(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"invertAlpha = {extend_value}")
+        self._set_on_object("invertAlpha", value)
 
     """When true the footage is still; when false, it has a time-based component."""
 
@@ -1480,7 +1702,7 @@ class FootageSource(PydobeBaseObject):
 
     @loop.setter
     def loop(self, value: int):
-        self._eval_on_object(f"loop = {value}")
+        self._set_on_object("loop", value)
 
     """The native frame rate of the footage."""
 
@@ -1498,7 +1720,7 @@ class FootageSource(PydobeBaseObject):
     def premul_color(self, value: list or str):
         if type(value) == str:
             value = hex_to_rgb(value)
-        self._eval_on_object(f"premulColor = {value}")
+        self._set_on_object("premulColor", value)
 
     """How the pulldowns are to be removed when field separation is used"""
 
@@ -1512,7 +1734,7 @@ class FootageSource(PydobeBaseObject):
     def remove_pulldown(self, value: int or str):
         if type(value) == str:
             value = pulldown_dictionary[value]
-        self._eval_on_object(f"removePulldown = {value}")
+        self._set_on_object("removePulldown", value)
 
     # FUNCTIONS
 
@@ -1523,12 +1745,14 @@ class FootageSource(PydobeBaseObject):
     def guess_pulldown(self, advance_24p=False):
         """Sets fieldSeparationType and removePulldown to the best estimates for this footage source."""
         if advance_24p:
-            self._eval_on_object(f"guessPulldown(PulldownMethod.ADVANCE_24P)")
+            self._eval_on_object("guessPulldown(PulldownMethod.ADVANCE_24P)")
         else:
-            self._eval_on_object(f"guessPulldown(PulldownMethod.PULLDOWN_3_2)")
+            self._eval_on_object("guessPulldown(PulldownMethod.PULLDOWN_3_2)")
 
 
 class FileSource(FootageSource):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1555,6 +1779,8 @@ class FileSource(FootageSource):
 
 
 class SolidSource(FootageSource):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1570,10 +1796,12 @@ class SolidSource(FootageSource):
     def color(self, value: list or str):
         if type(value) == str:
             value = hex_to_rgb(value)
-        self._eval_on_object(f"color = {value}")
+        self._set_on_object("color", value)
 
 
 class PlaceholderSource(FootageSource):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1582,6 +1810,8 @@ class PlaceholderSource(FootageSource):
 
 
 class PropertyBase(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1608,8 +1838,7 @@ class PropertyBase(PydobeBaseObject):
 
     @enabled.setter
     def enabled(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"enabled = {extend_value}")
+        self._set_on_object("enabled", value)
 
     """When true, this property is an effect property group"""
 
@@ -1644,7 +1873,7 @@ class PropertyBase(PydobeBaseObject):
 
     @name.setter
     def name(self, value: str):
-        self._eval_on_object(f'name = "{value}"')
+        self._set_on_object("name", value)
 
     """The property group that is the parent of this property. Null if this is a layer"""
 
@@ -1661,16 +1890,32 @@ class PropertyBase(PydobeBaseObject):
 
     @selected.setter
     def selected(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"selected = {extend_value}")
+        self._set_on_object("selected", value)
+
+
+Keyframes = namedtuple(
+    "Keyframes",
+    [
+        "times",  # times of the keyframes in seconds
+        "values",  # values of the keyframes, numbers or arrays of numbers depending on the property
+    ],
+)
 
 
 class Property(PropertyBase):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
     # PROPERTIES
 
+    """The number of keyframes of the property"""
+
+    @property
+    def num_keys(self) -> int:
+        return self._eval_on_object("numKeys")
+
     """Returns the value of the current property"""
 
     @property
@@ -1682,12 +1927,21 @@ class Property(PropertyBase):
     def set_value(self, value):
         value_type = type(self.value)
         if type(value) == value_type:
-            self._eval_on_object(f'setValue ({value})')
+            self._call_on_object("setValue", value)
         else:
             raise ValueError(f"Unable to set '{self.name}', value must be of type '{value_type.__name__}'")
 
+    def keyframes(self, numpy: bool = False) -> Keyframes:
+        """Times and values of all the keyframes in one request, as lists or, with numpy=True, NumPy arrays"""
+        columns = call("keyframes", self.pydobe_id)
+        if numpy:
+            columns = columns_to_numpy(columns)
+        return Keyframes(columns["time"], columns["value"])
+
 
 class PropertyGroup(PropertyBase):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1700,6 +1954,8 @@ class PropertyGroup(PropertyBase):
 
 
 class Layer(PropertyGroup):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1720,8 +1976,7 @@ class Layer(PropertyGroup):
 
     @locked.setter
     def locked(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"locked = {extend_value}")
+        self._set_on_object("locked", value)
 
     """If the layer is shy, it will be hidden when hide shy layers is toggled"""
 
@@ -1731,8 +1986,7 @@ class Layer(PropertyGroup):
 
     @shy.setter
     def shy(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"shy = {extend_value}")
+        self._set_on_object("shy", value)
 
     """When true, the layer is soloed"""
 
@@ -1742,8 +1996,7 @@ class Layer(PropertyGroup):
 
     @solo.setter
     def solo(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"solo = {extend_value}")
+        self._set_on_object("solo", value)
 
     # FUNCTION
 
@@ -1753,6 +2006,8 @@ class Layer(PropertyGroup):
 
 
 class AVLayer(Layer):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -1825,8 +2080,7 @@ class AVLayer(Layer):
 
     @adjustment_layer.setter
     def adjustment_layer(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f'adjustmentLayer = {extend_value}')
+        self._set_on_object("adjustmentLayer", value)
 
     """True if the audio, is active
        Will return False if other layers are solo, or if time is not between layers in and out point"""
@@ -1843,8 +2097,7 @@ class AVLayer(Layer):
 
     @audio_enabled.setter
     def audio_enabled(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f'audioEnabled = {extend_value}')
+        self._set_on_object("audioEnabled", value)
 
     """The Blending Mode of the Layer"""
 
@@ -1858,7 +2111,7 @@ class AVLayer(Layer):
     def blending_mode(self, value: str or int):
         if type(value) == str:
             value = blending_modes_dictionary[value]
-        self._eval_on_object(f'blendingMode = {value}')
+        self._set_on_object("blendingMode", value)
 
     """True if it is legal to change the value of collapse transformation"""
 
@@ -1880,8 +2133,7 @@ class AVLayer(Layer):
 
     @collapse_transformation.setter
     def collapse_transformation(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f'collapseTransformation = {extend_value}')
+        self._set_on_object("collapseTransformation", value)
 
     """True if the layers effects are active"""
 
@@ -1891,8 +2143,7 @@ class AVLayer(Layer):
 
     @effects_active.setter
     def effects_active(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f'effectsActive = {extend_value}')
+        self._set_on_object("effectsActive", value)
 
     """True if this is an environment layer in a Ray-traced 3D composition"""
 
@@ -1902,8 +2153,7 @@ class AVLayer(Layer):
 
     @environment_layer.setter
     def environment_layer(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f'environmentLayer = {extend_value}')
+        self._set_on_object("environmentLayer", value)
 
     """True if frame blending is enabled for the layer."""
 
@@ -1923,7 +2173,7 @@ class AVLayer(Layer):
     def frame_blending_type(self, value: int or str):
         if type(value) == str:
             value = frame_blending_dictionary[value]
-        self._eval_on_object(f"frameBlendingType = {value}")
+        self._set_on_object("frameBlendingType", value)
 
     """True if the layer is a guide layer"""
 
@@ -1969,8 +2219,7 @@ class AVLayer(Layer):
 
     @motion_blur.setter
     def motion_blur(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"motionBlur = {extend_value}")
+        self._set_on_object("motionBlur", value)
 
     """True if preserve transparency is enabled for the layer"""
 
@@ -1980,8 +2229,7 @@ class AVLayer(Layer):
 
     @preserve_transparency.setter
     def preserve_transparency(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"preserveTransparency = {extend_value}")
+        self._set_on_object("preserveTransparency", value)
 
     """The source AVItem for this layer"""
 
@@ -1999,21 +2247,29 @@ class AVLayer(Layer):
 
 
 class CameraLayer(Layer):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
 
 class LightLayer(Layer):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
 
 class ShapeLayer(AVLayer):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
 
 class TextLayer(AVLayer):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -2022,91 +2278,387 @@ class TextLayer(AVLayer):
 
 
 class RenderQueue(PydobeBaseObject):
+    __slots__ = ()
+
+    def __init__(self, pydobe_id=None, object_type=None):
+        super().__init__(pydobe_id, object_type)
+
+    # PROPERTIES
+
+    """When true, Adobe Media Encoder is installed and items can be queued in it"""
+
+    @property
+    def can_queue_in_ame(self) -> bool:
+        return self._eval_on_object("canQueueInAME")
+
+    """The render queue items"""
+
+    @property
+    def items(self) -> RQItemCollection:
+        kwargs = self._eval_on_object("items")
+        return RQItemCollection(**kwargs) if kwargs else None
+
+    """The number of items in the render queue"""
+
+    @property
+    def num_items(self) -> int:
+        return self._eval_on_object("numItems")
+
+    """When true, a render is in progress"""
+
+    @property
+    def rendering(self) -> bool:
+        return self._eval_on_object("rendering")
+
+    # FUNCTIONS
+
+    def item(self, index: int) -> RenderQueueItem:
+        """Retrieves a render queue item at a specified index position"""
+        kwargs = self._call_on_object("item", index + 1)
+        return RenderQueueItem(**kwargs) if kwargs else None
+
+    def pause_rendering(self, pause: bool):
+        """Pauses or resumes the current rendering process"""
+        self._call_on_object("pauseRendering", pause)
+
+    def queue_in_ame(self, render_immediately: bool):
+        """Sends the queued items to Adobe Media Encoder"""
+        self._call_on_object("queueInAME", render_immediately)
+
+    def render(self):
+        """Renders all queued items, returning when the render is over, sent at once even within a transaction.
+        Progress is pushed to the functions subscribed with pydobe.core.subscribe()"""
+        raise_for_error(
+            eval_script(f"$._pydobe.watchRenderQueue();\n{self._reference()}.render();")
+        )
+
+    def show_window(self, show: bool):
+        """Shows or hides the Render Queue panel"""
+        self._call_on_object("showWindow", show)
+
+    def stop_rendering(self):
+        """Stops the rendering process"""
+        self._eval_on_object("stopRendering()")
+
+    # CUSTOM FUNCTIONS
+
+    def enqueue(
+        self,
+        comps: list[CompItem],
+        template: str = None,
+        output_pattern: str = None,
+    ) -> list[RenderQueueItem]:
+        """Add compositions to the render queue in a single call, applying an output module template
+        and setting the output paths. The output pattern can use {comp_name}, {comp_id} and {index}
+        """
+        if not comps:
+            return []
+        pydobe_ids = raise_for_error(
+            _ENQUEUE_SCRIPT(list(comps), template, output_pattern, self)
+        )
+        return [
+            RenderQueueItem(pydobe_id, "RenderQueueItem") for pydobe_id in pydobe_ids
+        ]
+
+
+_ENQUEUE_SCRIPT = CompiledScript(
+    ["comps", "template", "pattern", "queue"],
+    """var ids = [];
+for (var i = 0; i < comps.length; i++) {
+    var rqItem = queue.items.add(comps[i]);
+    var outputModule = rqItem.outputModule(1);
+    if (template !== null) {outputModule.applyTemplate(template)}
+    if (pattern !== null) {
+        var path = pattern.split("{comp_name}").join(comps[i].name);
+        path = path.split("{comp_id}").join(comps[i].id);
+        path = path.split("{index}").join(queue.numItems);
+        outputModule.file = new File(path);
+    }
+    var id = $._pydobe.generateId();
+    $._pydobe[id] = rqItem;
+    ids.push(id);
+}
+return '["' + ids.join('","') + '"]';""",
+)
+
+
+class RenderQueueItem(PydobeBaseObject):
+    __slots__ = ()
+
+    def __init__(self, pydobe_id=None, object_type=None):
+        super().__init__(pydobe_id, object_type)
+
+    # PROPERTIES
+
+    """The composition rendered by this item"""
+
+    @property
+    def comp(self) -> CompItem:
+        kwargs = self._eval_on_object("comp")
+        return CompItem(**kwargs) if kwargs else None
+
+    """The time in seconds the item took to render, None if it has not been rendered"""
+
+    @property
+    def elapsed_seconds(self) -> int:
+        return self._eval_on_object("elapsedSeconds")
+
+    """The number of output modules of the item"""
+
+    @property
+    def num_output_modules(self) -> int:
+        return self._eval_on_object("numOutputModules")
+
+    """The output modules of the item"""
+
+    @property
+    def output_modules(self) -> list[OutputModule]:
+        return [self.output_module(index) for index in range(self.num_output_modules)]
+
+    """When true, the item is rendered when the queue is rendered"""
+
+    @property
+    def render(self) -> bool:
+        return self._eval_on_object("render")
+
+    @render.setter
+    def render(self, value: bool):
+        self._set_on_object("render", value)
+
+    """The number of frames to skip when rendering this item"""
+
+    @property
+    def skip_frames(self) -> int:
+        return self._eval_on_object("skipFrames")
+
+    @skip_frames.setter
+    def skip_frames(self, value: int):
+        self._set_on_object("skipFrames", value)
+
+    """The time at which rendering of this item began"""
+
+    @property
+    def start_time(self):
+        return self._eval_on_object("startTime")
+
+    """The current render status of the item"""
+
+    @property
+    def status(self) -> str:
+        value = self._eval_on_object("status")
+        value_as_string = render_status_dictionary[value]
+        return value_as_string
+
+    """The names of all the render settings templates"""
+
+    @property
+    def templates(self) -> list[str]:
+        return self._eval_on_object("templates")
+
+    """The duration in seconds of the composition to be rendered"""
+
+    @property
+    def time_span_duration(self) -> float:
+        return self._eval_on_object("timeSpanDuration")
+
+    @time_span_duration.setter
+    def time_span_duration(self, value: float):
+        self._set_on_object("timeSpanDuration", value)
+
+    """The time in the composition, in seconds, at which rendering will begin"""
+
+    @property
+    def time_span_start(self) -> float:
+        return self._eval_on_object("timeSpanStart")
+
+    @time_span_start.setter
+    def time_span_start(self, value: float):
+        self._set_on_object("timeSpanStart", value)
+
+    # FUNCTIONS
+
+    def apply_template(self, template_name: str):
+        """Applies a render settings template to the item"""
+        self._call_on_object("applyTemplate", template_name)
+
+    def duplicate(self) -> RenderQueueItem:
+        """Creates a duplicate of this item and adds it to the render queue"""
+        kwargs = self._eval_on_object("duplicate()")
+        return RenderQueueItem(**kwargs) if kwargs else None
+
+    def output_module(self, index: int) -> OutputModule:
+        """Retrieves an output module at a specified index position"""
+        kwargs = self._call_on_object("outputModule", index + 1)
+        return OutputModule(**kwargs) if kwargs else None
+
+    def remove(self):
+        """Removes this item from the render queue"""
+        self._eval_on_object("remove()")
+
+    def save_as_template(self, name: str):
+        """Saves the item's current render settings as a new template"""
+        self._call_on_object("saveAsTemplate", name)
+
+
+class OutputModule(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
+    # PROPERTIES
+
+    """The path of the file the output module renders to"""
+
+    @property
+    def file(self) -> str:
+        return self._eval_on_object("file.fsName")
+
+    @file.setter
+    def file(self, path: str):
+        self._set_on_object("file", Code(f"new File({format_to_extend(path)})"))
+
+    """When true, writes all source footage XMP metadata to the output file"""
+
+    @property
+    def include_source_xmp(self) -> bool:
+        return self._eval_on_object("includeSourceXMP")
+
+    @include_source_xmp.setter
+    def include_source_xmp(self, value: bool):
+        self._set_on_object("includeSourceXMP", value)
+
+    """The name of the output module, as shown in the user interface"""
+
+    @property
+    def name(self) -> str:
+        return self._eval_on_object("name")
+
+    """The names of all the output module templates"""
+
+    @property
+    def templates(self) -> list[str]:
+        return self._eval_on_object("templates")
+
+    # FUNCTIONS
+
+    def apply_template(self, template_name: str):
+        """Applies an output module template"""
+        self._call_on_object("applyTemplate", template_name)
+
+    def remove(self):
+        """Removes this output module from the render queue item"""
+        self._eval_on_object("remove()")
+
+    def save_as_template(self, name: str):
+        """Saves the output module's current settings as a new template"""
+        self._call_on_object("saveAsTemplate", name)
+
 
 # COLLECTIONS
 
 
 class ItemCollection(PydobeBaseCollection):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type, "length")
 
     def __getitem__(self, index: int):
         index = index + 1
         kwargs = super(ItemCollection, self).__getitem__(index)
-        object_type = kwargs["object_type"]
-        item = create_python_object(object_type)(**kwargs)
-        return item
+        return self._member(kwargs)
+
+    def _member(self, kwargs: dict) -> Item:
+        return create_python_object(kwargs["object_type"])(**kwargs)
 
     # FUNCTIONS
 
     def add_comp(
-            self,
-            name: str,
-            width: int,
-            height: int,
-            aspect_ratio: float,
-            duration: float or str,
-            frame_rate: float,
-            duration_in_current_format=True,
+        self,
+        name: str,
+        width: int,
+        height: int,
+        aspect_ratio: float,
+        duration: float or str,
+        frame_rate: float,
+        duration_in_current_format=True,
     ) -> CompItem:
         """Add a new Composition to the project"""
         if duration_in_current_format:
             duration = current_format_to_time(duration, frame_rate)
-        kwargs = self._eval_on_object(
-            f'addComp("{name}", {width}, {height}, {aspect_ratio}, {duration}, {frame_rate})'
+        kwargs = self._call_on_object(
+            "addComp", name, width, height, aspect_ratio, duration, frame_rate
         )
         return CompItem(**kwargs) if kwargs else None
 
     def add_folder(self, name: str) -> FolderItem:
         """Add a new Folder to the project"""
-        kwargs = self._eval_on_object(f'addFolder("{name}")')
+        kwargs = self._call_on_object("addFolder", name)
         return FolderItem(**kwargs) if kwargs else None
 
 
+class RQItemCollection(PydobeBaseCollection):
+    __slots__ = ()
+
+    def __init__(self, pydobe_id=None, object_type=None):
+        super().__init__(pydobe_id, object_type, "length")
+
+    def __getitem__(self, index: int):
+        index = index + 1
+        kwargs = super(RQItemCollection, self).__getitem__(index)
+        return self._member(kwargs)
+
+    def _member(self, kwargs: dict) -> RenderQueueItem:
+        return RenderQueueItem(**kwargs)
+
+    # FUNCTIONS
+
+    def add(self, comp: CompItem) -> RenderQueueItem:
+        """Adds a composition to the render queue"""
+        kwargs = self._call_on_object("add", comp)
+        return RenderQueueItem(**kwargs) if kwargs else None
+
+
 class LayerCollection(PydobeBaseCollection):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type, "length")
 
     def __getitem__(self, index: int):
         index = index + 1
         kwargs = super(LayerCollection, self).__getitem__(index)
-        object_type = kwargs["object_type"]
-        layer = create_python_object(object_type)(**kwargs)
-        return layer
+        return self._member(kwargs)
 
-    def __iter__(self):
-        value = iter([self.__getitem__(i) for i in range(len(self))])
-        return value
+    def _member(self, kwargs: dict) -> Layer:
+        return create_python_object(kwargs["object_type"])(**kwargs)
 
     # FUNCTIONS
 
     def add(self, item: Item, duration: float = None) -> Layer:
         """Creates a new layer containing a specified Item"""
-        extend_item_object = format_to_extend(item)
         if duration:
-            kwargs = self._eval_on_object(f"add({extend_item_object}, {duration})")
+            kwargs = self._call_on_object("add", item, duration)
         else:
-            kwargs = self._eval_on_object(f"add({extend_item_object})")
+            kwargs = self._call_on_object("add", item)
         object_type = kwargs["object_type"]
         layer = create_python_object(object_type)(**kwargs)
         return layer
 
     def add_box_text(self, width: int, height: int) -> TextLayer:
         """Creates a new paragraph text layer"""
-        kwargs = self._eval_on_object(f"addBoxText([{width},{height}])")
+        kwargs = self._call_on_object("addBoxText", [width, height])
         return TextLayer(**kwargs) if kwargs else None
 
     def add_camera(self, name: str, center_point: list) -> CameraLayer:
         """Creates a new camera layer"""
-        kwargs = self._eval_on_object(f'addCamera("{name}", {center_point})')
+        kwargs = self._call_on_object("addCamera", name, center_point)
         return CameraLayer(**kwargs) if kwargs else None
 
     def add_light(self, name: str, center_point: list):
         """Creates a new light layer"""
-        kwargs = self._eval_on_object(f'addLight("{name}", {center_point})')
+        kwargs = self._call_on_object("addLight", name, center_point)
         return LightLayer(**kwargs) if kwargs else None
 
     def add_null(
@@ -2116,7 +2668,7 @@ class LayerCollection(PydobeBaseCollection):
         if duration_in_current_format:
             frame_rate = self[0].containing_comp.frame_rate
             duration = time_to_current_format(duration, frame_rate)
-        kwargs = self._eval_on_object(f"addNull({duration})")
+        kwargs = self._call_on_object("addNull", duration)
         return AVLayer(**kwargs) if kwargs else None
 
     def add_shape(self) -> ShapeLayer:
@@ -2125,30 +2677,30 @@ class LayerCollection(PydobeBaseCollection):
         return ShapeLayer(**kwargs) if kwargs else None
 
     def add_solid(
-            self,
-            color: list or str,
-            name: str,
-            width: int,
-            height: int,
-            pixel_aspect: float,
+        self,
+        color: list or str,
+        name: str,
+        width: int,
+        height: int,
+        pixel_aspect: float,
     ) -> LightLayer:
         """Creates a new Solid layer"""
         if type(color) == str:
             color = hex_to_rgb(color)
-        kwargs = self._eval_on_object(
-            f'addSolid({color}, "{name}", {width}, {height}, {pixel_aspect})'
+        kwargs = self._call_on_object(
+            "addSolid", color, name, width, height, pixel_aspect
         )
         return LightLayer(**kwargs) if kwargs else None
 
     def add_text(self, source_text: str = "") -> TextLayer:
         """Creates a new Text layer"""
-        kwargs = self._eval_on_object(f'addText("{source_text}")')
+        kwargs = self._call_on_object("addText", source_text)
         return TextLayer(**kwargs) if kwargs else None
 
     def by_name(self, name: str) -> Layer:
         """Returns the first (topmost) layer found in this collection with the specified name,
         or null if no layer with the given name is found."""
-        kwargs = self._eval_on_object(f'byName("{name}")')
+        kwargs = self._call_on_object("byName", name)
         object_type = kwargs["object_type"]
         layer = create_python_object(object_type)(**kwargs)
         return layer
@@ -2164,12 +2716,9 @@ class LayerCollection(PydobeBaseCollection):
             )
         indices = [index + 1 for index in indices]
         if not move_attributes:
-            extend_move_attributes = format_to_extend(move_attributes)
-            kwargs = self._eval_on_object(
-                f'precompose({indices}, "{name}", "{extend_move_attributes}")'
-            )
+            kwargs = self._call_on_object("precompose", indices, name, move_attributes)
         else:
-            kwargs = self._eval_on_object(f'precompose({indices}, "{name}")')
+            kwargs = self._call_on_object("precompose", indices, name)
         return CompItem(**kwargs) if kwargs else None
 
 
@@ -2177,6 +2726,8 @@ class LayerCollection(PydobeBaseCollection):
 
 
 class ImportOptions(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -2189,8 +2740,7 @@ class ImportOptions(PydobeBaseObject):
 
     @file.setter
     def file(self, value: File):
-        extend_object = format_to_extend(value)
-        self._eval_on_object(f"file = {extend_object}")
+        self._set_on_object("file", value)
 
     """Creates sequence from available files in alphabetical order with no gaps"""
 
@@ -2200,8 +2750,7 @@ class ImportOptions(PydobeBaseObject):
 
     @force_alphabetical.setter
     def force_alphabetical(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"forceAlphabetical = {extend_value}")
+        self._set_on_object("forceAlphabetical", value)
 
     """Import as sequence"""
 
@@ -2211,11 +2760,12 @@ class ImportOptions(PydobeBaseObject):
 
     @sequence.setter
     def sequence(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"sequence = {extend_value}")
+        self._set_on_object("sequence", value)
 
 
 class Viewer(PydobeBaseObject):
+    __slots__ = ()
+
     def __init__(self, pydobe_id=None, object_type=None):
         super().__init__(pydobe_id, object_type)
 
@@ -2235,8 +2785,7 @@ class Viewer(PydobeBaseObject):
 
     @maximised.setter
     def maximised(self, value: bool):
-        extend_value = format_to_extend(value)
-        self._eval_on_object(f"maximized = {extend_value}")
+        self._set_on_object("maximized", value)
 
     # FUNCTIONS
 
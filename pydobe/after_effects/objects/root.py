@@ -1,14 +1,17 @@
 from pydobe.after_effects.objects.ae_objects import Application
-from pydobe.core import eval_script_returning_object, is_port_open
+from pydobe.core import eval_script_returning_object
 
 
 class Root(object):
     def __init__(self):
+        """Root objects of the After Effects instance of the current transport, which objects reached
+        from it keep talking to: choose an instance with pydobe.core.use_transport()"""
         super(Root, self).__init__()
-        is_port_open()
 
     """ The application object """
 
     @property
     def app(self):
-        return Application(**eval_script_returning_object("app"))
+        app = Application(**eval_script_returning_object("app"))
+        app.address = "app"
+        return app
@@ -0,0 +1,232 @@
+"""Run independent jobs across several After Effects instances
+
+    from pydobe.after_effects.pool import Pool, render_project_job
+
+    with Pool(["127.0.0.1:2000", "127.0.0.1:2001", "render-node:2000"]) as pool:
+        futures = [pool.submit(render_project_job, path) for path in project_paths]
+        statuses = [future.result() for future in futures]
+
+A job is a function taking the Root of the instance it runs on as first argument. The job runs
+within pydobe.core.use_transport() of that instance, which is what makes pydobe objects talk to
+it: objects returned by a job talk to the current instance once used outside of it. Jobs go to the instance with the fewest
+jobs in flight (then the fastest one), and are retried on another instance when the one they
+ran on can not be reached or does not answer within the timeout, which is then left out for a
+cooldown period.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+
+from pydobe.core import HOST, PORT, HttpTransport, use_transport
+from pydobe.after_effects.objects.root import Root
+
+# errors meaning an instance can not be reached, ConnectionError is raised before connecting
+UNREACHABLE_ERRORS = (ConnectionError, requests.ConnectionError, requests.Timeout)
+
+
+class Endpoint(object):
+    """An After Effects instance of a pool, and the jobs it ran"""
+
+    def __init__(self, transport=None, max_in_flight: int = 1):
+        self.transport = transport or HttpTransport()
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.unavailable_until = 0.0
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.transport!r})"
+
+    @classmethod
+    def from_address(
+        cls, address, max_in_flight: int = 1, timeout: float or tuple = None
+    ) -> Endpoint:
+        """Endpoint from a "host:port" string, a port number, a transport or an Endpoint,
+        the timeout applying to the transports made from addresses"""
+        if isinstance(address, Endpoint):
+            return address
+        if isinstance(address, int):
+            return cls(HttpTransport(HOST, address, timeout=timeout), max_in_flight)
+        if isinstance(address, str):
+            host, _, port = address.rpartition(":")
+            transport = HttpTransport(host or HOST, int(port or PORT), timeout=timeout)
+            return cls(transport, max_in_flight)
+        return cls(address, max_in_flight)
+
+    @property
+    def average_time(self) -> float:
+        """Average duration in seconds of the jobs completed on this instance"""
+        return self.busy_time / self.completed if self.completed else 0.0
+
+    def available(self, now: float) -> bool:
+        return self.in_flight < self.max_in_flight and self.unavailable_until <= now
+
+    def stats(self) -> dict:
+        return {
+            "endpoint": repr(self.transport),
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "average_time": self.average_time,
+            "available": self.unavailable_until <= time.monotonic(),
+        }
+
+
+class Pool(object):
+    """Distributes jobs across After Effects instances, see the module documentation
+
+    Connection errors and timeouts (ConnectionError, requests.ConnectionError and requests.Timeout)
+    make a job retry on another instance up to retries times, any other error, such as an OSError
+    raised by the job itself, is raised by the job's future. Both are counted as failed jobs of the
+    instance, only connection errors and timeouts make it cool down.
+
+    timeout is the number of seconds a request to an instance given by its address may wait for it,
+    see HttpTransport. None waits forever, so an instance which hangs holds its jobs.
+    """
+
+    def __init__(
+        self,
+        endpoints: list,
+        max_in_flight: int = 1,
+        retries: int = 2,
+        cooldown: float = 30.0,
+        timeout: float or tuple = None,
+    ):
+        self.endpoints = [
+            Endpoint.from_address(address, max_in_flight, timeout)
+            for address in endpoints
+        ]
+        if not self.endpoints:
+            raise ValueError("A pool needs at least one endpoint")
+        self.retries = retries
+        self.cooldown = cooldown
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(endpoint.max_in_flight for endpoint in self.endpoints),
+            thread_name_prefix="pydobe-pool",
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def submit(self, job, *args, **kwargs) -> Future:
+        """Run job(root, *args, **kwargs) on the least busy instance"""
+        return self._executor.submit(self._run, job, args, kwargs)
+
+    def map(self, job, *iterables) -> list:
+        """Run the job for every set of arguments and return the results in order"""
+        futures = [self.submit(job, *args) for args in zip(*iterables)]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def stats(self) -> list[dict]:
+        with self._condition:
+            return [endpoint.stats() for endpoint in self.endpoints]
+
+    def _acquire(self, excluded: set) -> Endpoint:
+        """Wait for the least loaded available endpoint, preferring the ones the job has not failed on"""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = [
+                    endpoint for endpoint in self.endpoints if endpoint.available(now)
+                ]
+                preferred = [
+                    endpoint for endpoint in candidates if endpoint not in excluded
+                ]
+                candidates = preferred or candidates
+                if candidates:
+                    endpoint = min(
+                        candidates,
+                        key=lambda endpoint: (
+                            endpoint.in_flight / endpoint.max_in_flight,
+                            endpoint.average_time,
+                        ),
+                    )
+                    endpoint.in_flight += 1
+                    return endpoint
+                cooling = [
+                    endpoint.unavailable_until - now for endpoint in self.endpoints
+                ]
+                timeout = (
+                    min(delay for delay in cooling if delay > 0)
+                    if any(delay > 0 for delay in cooling)
+                    else None
+                )
+                self._condition.wait(timeout)
+
+    def _release(
+        self,
+        endpoint: Endpoint,
+        duration: float,
+        failed: bool,
+        unreachable: bool = False,
+    ):
+        with self._condition:
+            endpoint.in_flight -= 1
+            if failed:
+                endpoint.failed += 1
+                if unreachable:
+                    endpoint.unavailable_until = time.monotonic() + self.cooldown
+            else:
+                endpoint.completed += 1
+                endpoint.busy_time += duration
+            self._condition.notify_all()
+
+    def _run(self, job, args: tuple, kwargs: dict):
+        failed_on = set()
+        for attempt in range(self.retries + 1):
+            endpoint = self._acquire(failed_on)
+            start = time.perf_counter()
+            try:
+                with use_transport(endpoint.transport):
+                    result = job(Root(), *args, **kwargs)
+            except UNREACHABLE_ERRORS:
+                self._release(
+                    endpoint, time.perf_counter() - start, failed=True, unreachable=True
+                )
+                failed_on.add(endpoint)
+                if attempt == self.retries:
+                    raise
+            except BaseException:
+                self._release(endpoint, time.perf_counter() - start, failed=True)
+                raise
+            else:
+                self._release(endpoint, time.perf_counter() - start, failed=False)
+                return result
+
+
+# JOBS
+
+
+def render_project_job(
+    root: Root,
+    project_path: str,
+    comp_names: list[str] = None,
+    template: str = None,
+    output_pattern: str = None,
+) -> dict:
+    """Open a project and render its compositions (or the named ones), return their render status by name"""
+    project = root.app.open(project_path)
+    if comp_names:
+        comps = [project.item_by_name(name) for name in comp_names]
+    else:
+        comps = project.compositions
+    render_queue = project.render_queue
+    items = render_queue.enqueue(
+        comps, template=template, output_pattern=output_pattern
+    )
+    render_queue.render()
+    return {comp.name: item.status for comp, item in zip(comps, items)}
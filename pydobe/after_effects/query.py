@@ -0,0 +1,385 @@
+"""Run a loop over a collection inside After Effects, in a single request
+
+    from pydobe.after_effects.query import attr, each, is_a
+
+    result = (
+        each(project.items)
+        .where(is_a("FootageItem") & attr("name").startswith("plate_"))
+        .set("label", 3)
+        .set("parentFolder", plates_folder)
+        .run()
+    )
+    print(result.count, result.errors)
+
+    names = each(comp.layers).where(attr("enabled") == False).values("name")
+    solids = each(comp.layers).where(attr("source.mainSource").is_a("SolidSource")).objects()
+
+Attributes and methods use their ExtendScript names. Conditions and actions are compiled to
+ExtendScript once per shape of loop, the values they use being sent as arguments, so running the
+same loop with other values reuses the script the panel compiled (see core.CompiledScript).
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from pydobe.core import (
+    CompiledScript,
+    PydobeBaseObject,
+    _decode_value,
+    create_python_object,
+    raise_for_error,
+)
+
+_NAME = re.compile(r"^[A-Za-z_$][\w$]*(\.[A-Za-z_$][\w$]*)*$")
+_VALUE_TYPES = (PydobeBaseObject, bool, int, float, str, type(None))
+
+# helpers available to the compiled conditions, ExtendScript being ECMAScript 3
+_HELPERS = r"""var quote = $._pydobe.quote;
+var serialise = $._pydobe.serialise;
+function startsWith(text, prefix) {return String(text).indexOf(prefix) === 0}
+function endsWith(text, suffix) {
+    text = String(text);
+    return text.length >= suffix.length && text.substring(text.length - suffix.length) === suffix;
+}
+function contains(text, part) {return String(text).indexOf(part) !== -1}
+function isIn(value, array) {
+    for (var k = 0; k < array.length; k++) {if (array[k] === value) {return true}}
+    return false;
+}
+"""
+
+_LOOP = r"""var members = $._pydobe.membersOf(collection);
+var count = 0;
+var results = [];
+var errors = [];
+for (var i = 0; i < members.length; i++) {
+    var member = members[i];
+    try {
+        if (!(%(condition)s)) {continue}
+        count++;
+%(actions)s
+    } catch (e) {
+        errors.push("[" + serialise(member) + "," + quote(e.message) + "]");
+    }
+}
+return '{"count":' + count + ',"results":[' + results.join(",") + '],"errors":[' + errors.join(",") + ']}';"""
+
+# source: CompiledScript, so that loops of the same shape share the hash computation
+_scripts = {}
+
+LoopResult = namedtuple(
+    "LoopResult",
+    [
+        "count",  # members which matched the conditions
+        "results",  # objects or attribute values of the members, when asked for
+        "errors",  # (object, error message) of the members a condition or an action failed on
+    ],
+)
+
+
+def _check_name(name: str) -> str:
+    if not isinstance(name, str) or not _NAME.match(name):
+        raise ValueError(f"{name!r} is not an ExtendScript attribute name")
+    return name
+
+
+def _expression(value) -> Expression:
+    """An expression of a value, which is sent as an argument unless it already is an expression"""
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, (list, tuple)):
+        if not all(isinstance(item, _VALUE_TYPES) for item in value):
+            raise TypeError(f"Lists of {value!r} can not be sent to ExtendScript")
+        return Value(list(value))
+    if not isinstance(value, _VALUE_TYPES):
+        raise TypeError(
+            f"{type(value).__name__} values can not be sent to ExtendScript"
+        )
+    return Value(value)
+
+
+class Expression(ABC):
+    """Part of a condition or a value evaluated for every member, combined with Python operators
+
+    Conditions combine with & (and), | (or) and ~ (not), as Python's and, or and not can not be overloaded.
+    These bind tighter than comparisons: (attr("width") > 100) & (attr("height") > 100)
+    """
+
+    __hash__ = None
+
+    @abstractmethod
+    def compile(self, values: list) -> str:
+        """The ExtendScript code of the expression, appending the values it uses to the list"""
+
+    def _operation(self, operator: str, other, reverse: bool = False) -> Expression:
+        operands = (_expression(other), self) if reverse else (self, _expression(other))
+        return Operation(operator, *operands)
+
+    def __eq__(self, other):
+        return self._operation("===", other)
+
+    def __ne__(self, other):
+        return self._operation("!==", other)
+
+    def __lt__(self, other):
+        return self._operation("<", other)
+
+    def __le__(self, other):
+        return self._operation("<=", other)
+
+    def __gt__(self, other):
+        return self._operation(">", other)
+
+    def __ge__(self, other):
+        return self._operation(">=", other)
+
+    def __and__(self, other):
+        return self._operation("&&", other)
+
+    def __rand__(self, other):
+        return self._operation("&&", other, reverse=True)
+
+    def __or__(self, other):
+        return self._operation("||", other)
+
+    def __ror__(self, other):
+        return self._operation("||", other, reverse=True)
+
+    def __invert__(self):
+        return Call("!", self)
+
+    def __add__(self, other):
+        return self._operation("+", other)
+
+    def __radd__(self, other):
+        return self._operation("+", other, reverse=True)
+
+    def __sub__(self, other):
+        return self._operation("-", other)
+
+    def __rsub__(self, other):
+        return self._operation("-", other, reverse=True)
+
+    def __mul__(self, other):
+        return self._operation("*", other)
+
+    def __rmul__(self, other):
+        return self._operation("*", other, reverse=True)
+
+    def __mod__(self, other):
+        return self._operation("%", other)
+
+    def __truediv__(self, other):
+        return self._operation("/", other)
+
+    def __rtruediv__(self, other):
+        return self._operation("/", other, reverse=True)
+
+    def startswith(self, prefix: str) -> Expression:
+        return Call("startsWith", self, _expression(prefix))
+
+    def endswith(self, suffix: str) -> Expression:
+        return Call("endsWith", self, _expression(suffix))
+
+    def contains(self, text: str) -> Expression:
+        return Call("contains", self, _expression(text))
+
+    def isin(self, values: list) -> Expression:
+        return Call("isIn", self, _expression(values))
+
+    def is_a(self, class_name: str) -> Expression:
+        """True when the value is an instance of the ExtendScript class, e.g. "CompItem" """
+        return Operation("instanceof", self, Code(_check_name(class_name)))
+
+
+class Value(Expression):
+    """A value sent as an argument of the loop"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def compile(self, values: list) -> str:
+        values.append(self.value)
+        return f"values[{len(values) - 1}]"
+
+
+class Code(Expression):
+    """ExtendScript code used as it is, only built from checked names"""
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def compile(self, values: list) -> str:
+        return self.code
+
+
+class Attribute(Expression):
+    """An attribute of the member, or of one of its attributes with a dotted name such as "source.name" """
+
+    def __init__(self, name: str):
+        self.name = _check_name(name)
+
+    def compile(self, values: list) -> str:
+        return f"member.{self.name}"
+
+
+class Operation(Expression):
+    def __init__(self, operator: str, left: Expression, right: Expression):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def compile(self, values: list) -> str:
+        return f"({self.left.compile(values)} {self.operator} {self.right.compile(values)})"
+
+
+class Call(Expression):
+    """A helper function, or a unary operator, applied to expressions"""
+
+    def __init__(self, function: str, *arguments: Expression):
+        self.function = function
+        self.arguments = arguments
+
+    def compile(self, values: list) -> str:
+        return f"{self.function}({', '.join(argument.compile(values) for argument in self.arguments)})"
+
+
+def attr(name: str) -> Attribute:
+    """An attribute of every member, by its ExtendScript name"""
+    return Attribute(name)
+
+
+def is_a(class_name: str) -> Expression:
+    """True for the members which are instances of the ExtendScript class, e.g. "CompItem" """
+    return Code("member").is_a(class_name)
+
+
+class Loop(object):
+    """Conditions and actions run over the members of a collection, built with each()
+
+    Every method returns a new loop, so that a loop can be the start of several others.
+    """
+
+    def __init__(self, collection, conditions: tuple = (), actions: tuple = ()):
+        self.collection = collection
+        self.conditions = conditions
+        self.actions = actions
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.collection!r}, {len(self.conditions)} conditions, {len(self.actions)} actions)"
+
+    def where(self, condition: Expression) -> Loop:
+        """Only run over the members meeting the condition, conditions add up"""
+        return Loop(
+            self.collection, self.conditions + (_expression(condition),), self.actions
+        )
+
+    def set(self, name: str, value) -> Loop:
+        """Set an attribute of the members to a value, or to an expression evaluated for each of them"""
+        return Loop(
+            self.collection,
+            self.conditions,
+            self.actions + (("set", _check_name(name), _expression(value)),),
+        )
+
+    def call(self, method: str, *args) -> Loop:
+        """Call a method of the members, e.g. call("moveToBeginning")"""
+        arguments = tuple(_expression(arg) for arg in args)
+        return Loop(
+            self.collection,
+            self.conditions,
+            self.actions + (("call", _check_name(method), arguments),),
+        )
+
+    def run(self) -> LoopResult:
+        """Run the actions over the matching members, results are empty"""
+        return self._run("")
+
+    def count(self) -> int:
+        """The number of matching members, after running the actions if any"""
+        return self._run("").count
+
+    def objects(self) -> list:
+        """The matching members, after running the actions if any"""
+        return self._run("results.push(serialise(member));").results
+
+    def values(self, *names: str) -> list:
+        """Attributes of the matching members after running the actions, a tuple of them per member when
+        several are asked for, e.g. values("name", "index")"""
+        if not names:
+            raise ValueError("values() needs at least one attribute name")
+        parts = ' + "," + '.join(
+            f"serialise(member.{_check_name(name)})" for name in names
+        )
+        results = self._run(f'results.push("[" + {parts} + "]");').results
+        if len(names) == 1:
+            return [result[0] for result in results]
+        return [tuple(result) for result in results]
+
+    def compile(self, result: str = "") -> tuple[str, list]:
+        """The body of the loop's script and the values it is run with"""
+        values = []
+        conditions = [condition.compile(values) for condition in self.conditions]
+        lines = []
+        for action in self.actions:
+            if action[0] == "set":
+                lines.append(f"member.{action[1]} = {action[2].compile(values)};")
+            else:
+                lines.append(
+                    f"member.{action[1]}({', '.join(argument.compile(values) for argument in action[2])});"
+                )
+        if result:
+            lines.append(result)
+        actions = "\n".join(" " * 8 + line for line in lines)
+        body = _HELPERS + _LOOP % {
+            "condition": " && ".join(conditions) or "true",
+            "actions": actions,
+        }
+        return body, values
+
+    def _run(self, result: str) -> LoopResult:
+        body, values = self.compile(result)
+        script = _scripts.get(body)
+        if script is None:
+            script = _scripts.setdefault(
+                body,
+                # loops without actions only read
+                CompiledScript(["collection", "values"], body, bool(self.actions)),
+            )
+        collection = self.collection
+        if not isinstance(collection, PydobeBaseObject):
+            collection = list(collection)
+        decoded = raise_for_error(script(collection, values))
+        if result.startswith("results.push(serialise"):
+            results = [
+                self._member(_decode_value(member)) for member in decoded["results"]
+            ]
+        else:
+            results = [
+                [_decode_object(value) for value in row] for row in decoded["results"]
+            ]
+        errors = [
+            (self._member(_decode_value(member)), message)
+            for member, message in decoded["errors"]
+        ]
+        return LoopResult(decoded["count"], results, errors)
+
+    def _member(self, kwargs: dict):
+        """The Python object of a member, of the class the collection gives its members"""
+        member = getattr(self.collection, "_member", None)
+        return member(kwargs) if member is not None else _decode_object(kwargs)
+
+
+def _decode_object(value):
+    value = _decode_value(value)
+    if isinstance(value, dict) and "pydobe_id" in value:
+        return create_python_object(value["object_type"])(**value)
+    return value
+
+
+def each(collection) -> Loop:
+    """A loop over the members of a collection, such as project.items or comp.layers, or a list of objects"""
+    return Loop(collection)
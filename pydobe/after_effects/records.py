@@ -0,0 +1,244 @@
+"""Read-only records of After Effects objects, holding attribute values read in bulk
+
+    from pydobe.after_effects.records import snapshot
+
+    layers = snapshot(comp.layers, ["name", "locked", "shy"])
+    for layer in layers:
+        print(layer.name, layer.locked)
+    shy = [layer.live() for layer in layers if layer.shy]
+
+Record classes such as CompItemRecord and AVLayerRecord are generated from the classes of ae_objects, their
+properties decoding the values read the way the live objects decode what they read. Records keep the values
+in a tuple shared by nothing else and have no __dict__, so that results of 100k members stay small.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+
+from pydobe.core import (
+    PydobeBaseCollection,
+    PydobeBaseObject,
+    _decode_value,
+    create_python_object,
+    stream_call,
+)
+from pydobe.after_effects.objects import ae_objects
+
+_NAME = re.compile(r"^[A-Za-z_$][\w$]*$")
+
+
+class Record(object):
+    """Values of an object read in bulk, which stay as they were read
+
+    A record has the properties of its live class which read an ExtendScript attribute, reading one which
+    was not part of the snapshot raises AttributeError. live() gives the live object.
+
+    Records of objects with a stable address, such as items and layers, hold it rather than an id, so that
+    reading them registers nothing in the panel, see pydobe.core.locate().
+    """
+
+    __slots__ = ("pydobe_id", "address", "object_type", "_values", "_fields")
+    live_class = PydobeBaseObject
+    # property name: ExtendScript attribute, of the properties the records have
+    attributes = {}
+
+    def __init__(
+        self,
+        pydobe_id: str,
+        object_type: str,
+        values: tuple,
+        fields: dict,
+        address: str = None,
+    ):
+        self.pydobe_id = pydobe_id
+        self.address = address
+        self.object_type = object_type
+        self._values = values
+        self._fields = fields  # ExtendScript attribute: index of its value, shared by the records of a snapshot
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{name}={self._values[self._fields[attribute]]!r}"
+            for name, attribute in self.attributes.items()
+            if attribute in self._fields
+        )
+        return f"{type(self).__name__}({self.address or self.pydobe_id}, {values})"
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_fields"):
+            raise AttributeError(
+                f"{type(self).__name__} is read-only, set {name} on live()"
+            )
+        super().__setattr__(name, value)
+
+    def _eval_on_object(
+        self, extend_property: str = "", pydobe_id: str = None, index: int = None
+    ):
+        """The value read for the attribute, called by the property getters of the live class"""
+        position = self._fields.get(extend_property)
+        if position is None or pydobe_id or index:
+            raise AttributeError(
+                f"{extend_property!r} was not read for {type(self).__name__}, use live()"
+            )
+        return self._values[position]
+
+    def live(self) -> PydobeBaseObject:
+        """The live object the record was read from, reached through its stable address if it has one"""
+        if self.address is not None:
+            return self.live_class.at(self.address, self.object_type)
+        return self.live_class(self.pydobe_id, self.object_type)
+
+    def as_dict(self) -> dict:
+        """The values read, by property name"""
+        result = {}
+        for name in self.attributes:
+            try:
+                result[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return result
+
+
+class _Probed(Exception):
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+
+
+class _Probe(object):
+    def _eval_on_object(
+        self, extend_property: str = "", pydobe_id: str = None, index: int = None
+    ):
+        raise _Probed(extend_property)
+
+
+def _attribute_of(prop: property) -> str or None:
+    """The ExtendScript attribute a property getter starts by reading, None if it starts with anything else"""
+    try:
+        prop.fget(_Probe())
+    except _Probed as probed:
+        return probed.attribute if _NAME.match(probed.attribute) else None
+    except Exception:
+        return None
+    return None
+
+
+def _not_recorded(name: str):
+    def getter(record):
+        raise AttributeError(
+            f"{name!r} can not be read from a {type(record).__name__}, use live()"
+        )
+
+    return property(getter)
+
+
+_record_classes = {}  # live class: record class
+
+
+def record_class(live_class: type) -> type:
+    """The record class of a class of ae_objects, e.g. CompItemRecord for CompItem"""
+    record = _record_classes.get(live_class)
+    if record is not None:
+        return record
+    bases = tuple(
+        record_class(base)
+        for base in live_class.__bases__
+        if issubclass(base, PydobeBaseObject) and base is not PydobeBaseObject
+    ) or (Record,)
+    attributes = {}
+    for base in reversed(bases):
+        attributes.update(base.attributes)
+    namespace = {
+        "__slots__": (),
+        "__module__": __name__,
+        "__doc__": f"Values of a {live_class.__name__} read in bulk, see Record",
+        "live_class": live_class,
+    }
+    for name, value in vars(live_class).items():
+        if not isinstance(value, property):
+            continue
+        attribute = _attribute_of(value)
+        if attribute:
+            namespace[name] = property(value.fget, doc=value.__doc__)
+            attributes[name] = attribute
+        elif (
+            name in attributes
+        ):  # redefined by the live class in a way records can not follow
+            namespace[name] = _not_recorded(name)
+            del attributes[name]
+    namespace["attributes"] = attributes
+    record = _record_classes[live_class] = type(
+        f"{live_class.__name__}Record", bases, namespace
+    )
+    return record
+
+
+_by_object_type = {}  # object type: record class
+
+
+def _record_class_of(object_type: str) -> type:
+    record = _by_object_type.get(object_type)
+    if record is None:
+        live_class = create_python_object(object_type)
+        record = _by_object_type[object_type] = (
+            record_class(live_class) if live_class else Record
+        )
+    return record
+
+
+def _attribute_named(field: str) -> str:
+    attribute = _ATTRIBUTES.get(field)
+    if attribute is None:
+        raise ValueError(
+            f"No record has a {field!r} property read from an ExtendScript attribute"
+        )
+    return attribute
+
+
+def records(source, fields: list[str]):
+    """Records of the members of a collection (or of a list of objects) holding the given properties,
+    read in one request and yielded as the response arrives
+
+    Fields are the Python property names of the live objects, e.g. ["name", "parent_folder"].
+    """
+    positions = {}  # ExtendScript attribute: index of its value
+    for field in fields:
+        positions.setdefault(_attribute_named(field), len(positions))
+    if not isinstance(source, PydobeBaseObject):
+        source = list(source)
+    # every line starts with the class of the member and its stable address, which live() uses, members
+    # without one being registered
+    for row in stream_call("records", source, list(positions), True):
+        member = row[0]
+        # one string per type rather than per record
+        object_type = sys.intern(member["objectType"])
+        values = tuple([_decode_value(value) for value in row[1:]])
+        yield _record_class_of(object_type)(
+            member.get("pydobeId"),
+            object_type,
+            values,
+            positions,
+            member.get("address"),
+        )
+
+
+def snapshot(source, fields: list[str]) -> list:
+    """Records of the members of a collection (or of a list of objects) holding the given properties,
+    read in one request, see records()"""
+    return list(records(source, fields))
+
+
+# a record class for every class of ae_objects, e.g. CompItemRecord
+_ATTRIBUTES = {}  # property name: ExtendScript attribute, across all the record classes
+for _live_class in list(vars(ae_objects).values()):
+    if (
+        isinstance(_live_class, type)
+        and issubclass(_live_class, PydobeBaseObject)
+        and not issubclass(_live_class, PydobeBaseCollection)
+        and _live_class.__module__ == ae_objects.__name__
+    ):
+        _record = record_class(_live_class)
+        globals()[_record.__name__] = _record
+        for _name, _attribute in _record.attributes.items():
+            _ATTRIBUTES.setdefault(_name, _attribute)
@@ -1,23 +1,121 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import contextvars
+import hashlib
 import json
-import requests
+import mmap
+import os
 import socket
+import sys
+import threading
+import time
+import weakref
+from collections import namedtuple
 
 HOST = "127.0.0.1"
 PORT = 2000
 PANEL_URL = f"http://{HOST}:{PORT}"
+# ExtendScript evaluation time reported by the panel
+SERVER_TIME_HEADER = "X-Pydobe-Eval-Ms"
+RESULT_FILE_HEADER = "X-Pydobe-Result-File"  # path of the temporary file the panel wrote a large result to
+# results of at least this many characters are passed through a temporary file by a panel on this machine, 0 never
+RESULT_FILE_THRESHOLD = int(os.environ.get("PYDOBE_RESULT_FILE_THRESHOLD", 1024 * 1024))
+# characters per part of the streamed responses, and bytes read at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+RECORDING_VERSION = 1
+
+# running profilers, each of them records every request sent to the panel
+_profilers = []
+_recorders = []  # running recorders, each of them logs every request sent to the panel
+_transaction = contextvars.ContextVar("pydobe_transaction", default=None)
+_bulk_mode = contextvars.ContextVar("pydobe_bulk_mode", default=None)
+# transport: hashes of the scripts its panel has compiled
+_compiled_scripts = weakref.WeakKeyDictionary()
 
 
 class PydobeBaseObject(object):
-    """Base object for every mirror object from ExtendScript"""
+    """Base object for every mirror object from ExtendScript
+
+    Mirror objects only hold their id and type, in slots rather than a __dict__, as scans can keep hundreds
+    of thousands of them. Subclasses declare empty __slots__ to keep it that way.
+
+    Lazy objects, such as the members of an iterated collection, have no id of their own but an address:
+    ExtendScript code reaching them, which they are read and written through. They are registered by the
+    panel the first time their id is needed, see resolve().
+
+    Objects can also have a stable address, code reaching them from app such as "app.project.itemByID(12)",
+    see locate(). Their handle falls back on it once it is gone, e.g. after the panel was reloaded.
+    """
+
+    __slots__ = ("_pydobe_id", "object_type", "address")
 
     def __init__(self, pydobe_id: str, object_type: str):
-        self.pydobe_id = pydobe_id
-        self.object_type = object_type
+        self._pydobe_id = pydobe_id
+        # one string per type rather than one per object, as decoded from every response
+        self.object_type = (
+            sys.intern(object_type) if type(object_type) is str else object_type
+        )
+        self.address = None
+
+    @property
+    def pydobe_id(self) -> str:
+        """Id of the object in the panel, registered on first use for lazy objects"""
+        if self._pydobe_id is None and self.address is not None:
+            resolve([self])
+        return self._pydobe_id
+
+    @pydobe_id.setter
+    def pydobe_id(self, value: str):
+        self._pydobe_id = value
+
+    @property
+    def is_lazy(self) -> bool:
+        """True until a lazy object is registered by the panel"""
+        return self._pydobe_id is None and self.address is not None
+
+    @property
+    def stable_address(self) -> str:
+        """Code reaching the object from app without any handle, None if it has none, see locate()"""
+        address = self.address
+        if address is None or address.startswith("$._pydobe"):
+            return None
+        return address
+
+    @classmethod
+    def at(cls, address: str, object_type: str = None):
+        """The object reached by ExtendScript code, without any request, e.g.
+        CompItem.at("app.project.itemByID(12)")"""
+        obj = cls(None, object_type or cls.__name__)
+        obj.address = address
+        return obj
+
+    def _reference(self) -> str:
+        """ExtendScript code of the object: its address while it is lazy, otherwise its handle, which is
+        registered again from its stable address when it is gone"""
+        if self.is_lazy:
+            return self.address
+        handle = f'$._pydobe["{self._pydobe_id}"]'
+        address = self.stable_address
+        if address is None:
+            return handle
+        return f"({handle} || ({handle} = {address}))"
 
     def _eval_on_object(
         self, extend_property: str = "", pydobe_id: str = None, index: int = None
     ):
-        """Query property or execute function on ExtendScript object"""
+        """Query property or execute function on ExtendScript object, sent at once even within a transaction"""
+        # reading an attribute changes nothing, a function may, see Transaction
+        changes = "(" in extend_property
+        return eval_script_returning_object(
+            self._statement(extend_property, pydobe_id, index), changes=changes
+        )
+
+    def _statement(
+        self, extend_property: str = "", pydobe_id: str = None, index: int = None
+    ) -> str:
+        """ExtendScript statement applying the code to the object"""
         if extend_property:
             extend_property = f".{extend_property}"
         if index:
@@ -25,17 +123,41 @@ class PydobeBaseObject(object):
         else:
             index = ""
         if pydobe_id:
-            line = f"$._pydobe['{pydobe_id}']{index}{extend_property};"
-        else:
-            line = f"$._pydobe['{self.pydobe_id}']{index}{extend_property};"
-        result = eval_script_returning_object(line)
-        return result
+            return f"$._pydobe['{pydobe_id}']{index}{extend_property};"
+        if self.address is not None:
+            return f"{self._reference()}{index}{extend_property};"
+        return f"$._pydobe['{self._pydobe_id}']{index}{extend_property};"
+
+    def _set_on_object(self, name: str, value):
+        """Set an ExtendScript attribute of the object, the value is formatted with format_to_extend.
+        Within a transaction the assignment is buffered, see Transaction"""
+        statement = self._statement(f"{name} = {format_to_extend(value)}")
+        transaction = _transaction.get()
+        if transaction is not None:
+            transaction.add(statement)
+            return None
+        # the value set, not read back
+        return eval_script_returning_object(statement, members=False)
+
+    def _call_on_object(self, method: str, *args):
+        """Call an ExtendScript method of the object, the arguments are formatted with format_to_extend"""
+        return self._eval_on_object(
+            f"{method}({', '.join([format_to_extend(arg) for arg in args])})"
+        )
 
     def _execute_command(self, code: str):
+        """Run a statement which returns nothing, such as an app.executeCommand() menu command.
+        Within a transaction the statement is buffered, see Transaction"""
+        transaction = _transaction.get()
+        if transaction is not None:
+            transaction.add(code)
+            return
         eval_script(code)
 
 
 class PydobeBaseCollection(PydobeBaseObject):
+    __slots__ = ("len_property",)
+
     def __init__(self, pydobe_id: str, object_type: str, len_property: str):
         """Base Object for collections"""
 
@@ -57,90 +179,971 @@ class PydobeBaseCollection(PydobeBaseObject):
         return int(self._eval_on_object(self.len_property))
 
     def __iter__(self):
-        """Builtin method for iterating through items"""
+        """Builtin method for iterating through items, fetched in a single request
+
+        Members are lazy: the panel keeps one array of them, which they are reached through by index,
+        and only registers those whose id is needed, see resolve()."""
 
-        value = iter([self.__getitem__(i) for i in range(len(self))])
+        result = call("lazyMembers", self.pydobe_id)
+        array = f'$._pydobe["{result["pydobeId"]}"]'
+        members = []
+        for index, object_type in enumerate(result["types"]):
+            member = self._member(dict(pydobe_id=None, object_type=object_type))
+            member.address = f"{array}[{index}]"
+            members.append(member)
+        return iter(members)
+
+    def _member(self, value):
+        """The python object of a member, as returned by the panel"""
         return value
 
 
-def is_port_open():
+def is_port_open(host: str = HOST, port: int = PORT):
     a_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    location = (HOST, PORT)
+    location = (host, port)
     result_of_check = a_socket.connect_ex(location)
-    message = f"Connection to port {PORT} could not be established. Please ensure After Effects is running."
+    a_socket.close()
+    message = f"Connection to port {port} could not be established. Please ensure After Effects is running."
     if result_of_check != 0:
         raise ConnectionError(message)
 
 
-def eval_script_returning_object(line: str):
+def eval_script_returning_object(line: str, members: bool = True, changes: bool = True):
     """Eval the line as ExtendScript code.
-    If the code returns an object, it will be stored with an id for pydobe to handle"""
-    # Create ExtendScript to send
-    script = f"var tmp = {line}"
-    script += """\nif(typeof tmp === 'object' && tmp !== null){
-            var newPydobeId = $._pydobe.generateId();
-            $._pydobe[newPydobeId] = tmp;
-            tmp = ExtendJSON.stringify({"isObject": true, "objectType": tmp.reflect.name, "pydobeId": newPydobeId}, internal_variables_replacer, 0, 1);
-        }
-        tmp"""
-    # Get the resulting data
-    result = eval_script(script)
+    If the code returns an object, it will be stored with an id for pydobe to handle. Arrays holding
+    objects are returned as lists of them, unless members is False"""
+    # registration is done by the library loaded in the panel (pydobeAEScript.jsx)
+    result = eval_script(
+        f"$._pydobe.register({line.strip().rstrip(';')})", changes=changes
+    )
     # Extract pydobe ID if object is returned
     if isinstance(result, dict) and result.get("isObject"):
-        if result["objectType"] == "Array" and "=" not in line:
-            data_list = convert_to_list(line)
-            return data_list
-        else:
-            kwargs = dict(
-                pydobe_id=result["pydobeId"], object_type=result["objectType"]
-            )
-        return kwargs
-    return result
+        if members and result["objectType"] == "Array":
+            # an array holding objects, arrays of plain values are serialised directly
+            return call("members", result["pydobeId"])
+    return _decode_value(result)
+
+
+# functions of the panel library which change nothing in the project, see Transaction
+LIBRARY_READS = frozenset(
+    [
+        "addresses",
+        "columns",
+        "find",
+        "getMany",
+        "keyframes",
+        "lazyMembers",
+        "members",
+        "records",
+        "registerAll",
+    ]
+)
 
 
-def eval_script(code: str):
-    """Send ExtendScript code to adobe software, retrieve and decode the response"""
+def call(function: str, *args):
+    """Call a function of the pydobe library loaded in the panel, see pydobeAEScript.jsx.
+    Arguments are formatted with format_to_extend, returned objects are given as kwargs
+    """
+    arguments = ", ".join(format_to_extend(arg) for arg in args)
+    result = eval_script(
+        f"$._pydobe.{function}({arguments})", changes=function not in LIBRARY_READS
+    )
+    if isinstance(result, list):
+        return [_decode_value(value) for value in result]
+    return _decode_value(result)
+
 
-    # send code to adobe software (adding try statement to prevent error popup message locking UI)
-    response = requests.post(
-        PANEL_URL,
-        json={
-            "to_eval": "try{\n"
-            + code
-            + "\n}catch(e){e.error=true;ExtendJSON.stringify(e)}"
-        },
+def stream_call(function: str, *args):
+    """Call a function of the panel library returning one JSON value per line, yielding the decoded
+    values as the lines arrive, so that the whole result is never held at once"""
+    arguments = ", ".join(format_to_extend(arg) for arg in args)
+    return eval_script_lines(
+        f"$._pydobe.{function}({arguments})", changes=function not in LIBRARY_READS
     )
 
-    # handle response
-    data = response.text
+
+def resolve(objects) -> list:
+    """Register the lazy objects among the given ones in one request, rather than one request each the
+    first time their id is needed, and return the objects"""
+    objects = list(objects)
+    pending = [obj for obj in objects if obj.is_lazy]
+    if pending:
+        kwargs = raise_for_error(
+            call("registerAll", [Code(obj.address) for obj in pending])
+        )
+        for obj, value in zip(pending, kwargs):
+            if not isinstance(value, dict):
+                raise LookupError(
+                    f"{obj.address} is not an object, it may have been removed"
+                )
+            obj.pydobe_id = value["pydobe_id"]
+    return objects
+
+
+def locate(objects) -> list:
+    """Give the objects their stable address in one request, and return the objects
+
+    A stable address is code reaching an object from app without any handle: items and layers by id,
+    properties by the match names of their groups, such as
+    'app.project.layerByID(7).property("ADBE Transform Group").property("ADBE Position")'.
+    Located objects keep working when their handle is gone, e.g. after the panel was reloaded, and lazy
+    ones are never registered by get_many() and set_many(). Objects without one, such as output modules,
+    are left as they are."""
+    objects = list(objects)
+    pending = [obj for obj in objects if obj.stable_address is None]
+    if pending:
+        addresses = raise_for_error(call("addresses", pending))
+        for obj, address in zip(pending, addresses):
+            if address is not None:
+                obj.address = address
+    return objects
+
+
+def get_many(objects: list, name: str) -> list:
+    """The value of an ExtendScript attribute of several objects in one request, e.g. get_many(items, "name")"""
+    if not objects:
+        return []
+    return call("getMany", list(objects), name)
+
+
+def set_many(objects: list, name: str, values: list):
+    """Set an ExtendScript attribute of several objects to one value each in one request"""
+    if len(objects) != len(values):
+        raise ValueError(f"{len(objects)} objects for {len(values)} values")
+    if objects:
+        raise_for_error(call("setMany", list(objects), name, list(values)))
+
+
+def get_columns(source, names: list[str], numpy: bool = False) -> dict:
+    """Attributes of the members of a collection (or of a list of objects) in one request, as {name: [values]}
+
+    Names are ExtendScript attribute names, dotted names such as "source.name" reach into attributes.
+    With numpy=True, columns of numbers, or of arrays of numbers of the same length, are NumPy arrays.
+    """
+    if not isinstance(source, PydobeBaseObject):
+        source = list(source)
+    columns = call("columns", source, list(names))
+    return columns_to_numpy(columns) if numpy else columns
+
+
+def iter_records(source, names: list[str]):
+    """Attributes of the members of a collection (or of a list of objects) as a tuple per member, yielded
+    as the response arrives, for exports too large to be held twice
+
+    Names are ExtendScript attribute names as in get_columns(), objects are given as kwargs.
+    """
+    if not isinstance(source, PydobeBaseObject):
+        source = list(source)
+    for values in stream_call("records", source, list(names)):
+        yield tuple([_decode_value(value) for value in values])
+
+
+def columns_to_numpy(columns: dict) -> dict:
+    """NumPy arrays of the columns of numbers returned by get_columns(), other columns are left as lists"""
+    import numpy
+
+    result = {}
+    for name, column in columns.items():
+        try:
+            array = numpy.asarray(column)
+        except ValueError:  # arrays of different lengths
+            array = None
+        result[name] = (
+            array if array is not None and array.dtype.kind in "biuf" else column
+        )
+    return result
+
+
+class CompiledScript(object):
+    """The body of an ExtendScript function, compiled by the panel on first use and then run by the
+    hash of its source, so that requests only carry the hash and the arguments. Scripts are defined
+    again when the panel no longer has them, e.g. after a restart or when evicted from its cache.
+    Scripts which only read are made with changes=False, see Transaction.
+    """
+
+    def __init__(self, params: list[str], body: str, changes: bool = True):
+        self.params = list(params)
+        self.body = body
+        self.changes = changes
+        source = ",".join(self.params) + "\n" + body
+        self.hash = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.hash}, {', '.join(self.params)})"
+
+    def __call__(self, *args):
+        """Run the script with the arguments, formatted with format_to_extend, and return the decoded result"""
+        if len(args) != len(self.params):
+            raise TypeError(
+                f"{self!r} takes {len(self.params)} arguments, {len(args)} given"
+            )
+        transport = get_transport()
+        compiled = _compiled_scripts.setdefault(transport, set())
+        run = f'$._pydobe.run("{self.hash}", {format_to_extend(list(args))})'
+        result = eval_script(
+            run if self.hash in compiled else self._define() + run, self.changes
+        )
+        if isinstance(result, dict) and result.get("pydobeCacheMiss"):
+            result = eval_script(self._define() + run, self.changes)
+        compiled.add(self.hash)
+        return result
+
+    def _define(self) -> str:
+        return f'$._pydobe.define("{self.hash}", {format_to_extend(self.params)}, {format_to_extend(self.body)});\n'
+
+
+def _decode_value(value):
+    """kwargs of the registered objects and lists of the serialised arrays in a decoded result"""
+    if isinstance(value, dict):
+        if value.get("isObject"):
+            return dict(pydobe_id=value["pydobeId"], object_type=value["objectType"])
+        if "pydobeArray" in value:
+            return value["pydobeArray"]
+        if "pydobeColumns" in value:
+            return {
+                name: _decode_column(column)
+                for name, column in value["pydobeColumns"].items()
+            }
+    return value
+
+
+def _decode_column(column: list) -> list:
+    # columns of plain values are returned as json decoded them, which matters for large columns
+    if any(isinstance(value, dict) for value in column):
+        return [_decode_value(value) for value in column]
+    return column
+
+
+def _script(code: str, transaction, changes: bool) -> str:
+    # statements buffered by a transaction are sent ahead of the code
+    if transaction is not None:
+        code = transaction.take(code, changes)
+    # adding try statement to prevent error popup message locking UI
+    return "try{\n" + code + "\n}catch(e){e.error=true;ExtendJSON.stringify(e)}"
+
+
+def eval_script(code: str, changes: bool = True):
+    """Send ExtendScript code to adobe software, retrieve and decode the response.
+    Within a transaction, changes tells whether the code may change the project"""
+
+    # send code to adobe software
+    transaction = _transaction.get()
+    data = send_request({"to_eval": _script(code, transaction, changes)})
 
     # Check if the data is an object. If it is - decode it. If not - return data as text
     try:
         decoded_data = json.loads(data)
     except json.decoder.JSONDecodeError:
-        return data
+        decoded_data = data
+    if transaction is not None:
+        transaction.received(decoded_data)
     return decoded_data
 
 
-def format_to_extend(obj):
-    """Format the argument to ExtendScript"""
-    if isinstance(obj, PydobeBaseObject):
-        return f'$._pydobe["{obj.pydobe_id}"]'
-    elif isinstance(obj, bool):
-        return str(obj).lower()
-    elif isinstance(obj, list):
-        return f"[{', '.join([format_to_extend(item) for item in obj])}]"
+def eval_script_lines(code: str, changes: bool = True):
+    """Send ExtendScript code returning one JSON value per line, yielding the decoded values as the
+    response arrives. Errors thrown by the script are raised as ExtendScriptError."""
+    transaction = _transaction.get()
+    received = transaction is None
+    for line in stream_request({"to_eval": _script(code, transaction, changes)}):
+        if not line:
+            continue
+        try:
+            value = json.loads(line)
+        except json.decoder.JSONDecodeError:
+            raise_for_error(line)
+            raise
+        if not received:
+            # the statements buffered ran before the first line
+            received = True
+            transaction.received(value)
+        if isinstance(value, dict):
+            raise_for_error(value)
+        yield value
+    if not received:
+        transaction.received(None)
+
+
+class ExtendScriptError(RuntimeError):
+    """An error thrown by ExtendScript while evaluating a script"""
+
+    def __init__(self, error: dict):
+        self.error = error
+        message = f"{error.get('name', 'Error')}: {error.get('message', '')}"
+        if error.get("line"):
+            message += f" (line {error['line']})"
+        super().__init__(message)
+
+
+def raise_for_error(result):
+    """Raise an ExtendScriptError if the decoded result of eval_script is an error, return it otherwise"""
+    if isinstance(result, dict) and result.get("error") is True:
+        raise ExtendScriptError(result)
+    if result == "EvalScript error.":
+        raise ExtendScriptError(
+            {"name": "Error", "message": "the script could not be evaluated"}
+        )
+    return result
+
+
+class TransactionError(ExtendScriptError):
+    """A statement of a transaction failed, the transaction was undone in After Effects"""
+
+
+class Transaction(object):
+    """Buffers the writes made within it, sending them ahead of the next request which needs a result,
+    or all together when the transaction ends.
+
+    The writes buffered are attribute assignments, made by every property setter (_set_on_object), and
+    commands, statements returning nothing (_execute_command). Reads and method calls are sent at once,
+    as they return a result, carrying the writes buffered before them in the same request so that they
+    run in order; they are part of the undo step all the same.
+
+    The begin statements are sent with the first request, the commit statements with the last one.
+    If a buffered statement fails, the rollback statements run and TransactionError is raised; if the
+    code within the transaction raises, the rollback statements are sent and buffered statements dropped.
+    The rollback statements only run once a change may have been applied: a buffered statement which
+    completed, or code which may change the project (see eval_script) that did not fail. Otherwise the
+    commit statements run instead, as undoing would undo the step before the transaction.
+    Transactions started within a transaction are part of it.
+    """
+
+    def __init__(self, begin: str = "", commit: str = "", rollback: str = ""):
+        self.begin = begin
+        self.commit = commit
+        self.rollback = rollback
+        self.statements = []
+        self.started = False
+        self.rolled_back = False
+        self.applied = False  # True once a change may have been applied
+        self.requests = 0
+        self._sent = (False, False)  # (statements, changes) of the request being sent
+        self._token = None
+
+    def __enter__(self):
+        outer = _transaction.get()
+        if outer is not None:
+            return outer
+        self._token = _transaction.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is None:
+            return
+        _transaction.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.flush(self.commit)
+        elif self.started and not self.rolled_back:
+            self.statements = []
+            self.rolled_back = True
+            eval_script(self.rollback if self.applied else self.commit)
+
+    def add(self, statement: str):
+        self.statements.append(statement)
+
+    def take(self, code: str, changes: bool = True) -> str:
+        """The code preceded by the begin and buffered statements, the buffer is emptied"""
+        parts = []
+        if not self.started:
+            self.started = True
+            parts.append(self.begin)
+        self._sent = (bool(self.statements), changes)
+        if self.statements:
+            if self.applied:
+                statements = "\n".join(self.statements)
+                rollback = self.rollback
+            else:
+                # nothing is applied until the first statement completes
+                statements = "\n".join(
+                    [self.statements[0], "pydobeApplied = true;"] + self.statements[1:]
+                )
+                rollback = (
+                    f"if(pydobeApplied){{\n{self.rollback}\n}}else{{\n{self.commit}\n}}"
+                )
+                parts.append("var pydobeApplied = false;")
+            parts.append(
+                "try{\n"
+                + statements
+                + "\n}catch(e){\n"
+                + rollback
+                + "\ne.pydobeTransaction=true;throw e}"
+            )
+            self.statements = []
+        self.requests += 1
+        parts.append(code)
+        return "\n".join(parts)
+
+    def received(self, result):
+        """Raise TransactionError if the buffered statements sent failed, otherwise note whether the
+        request applied a change"""
+        statements, changes = self._sent
+        self._sent = (False, False)
+        if isinstance(result, dict) and result.get("pydobeTransaction"):
+            self.rolled_back = True
+            raise TransactionError(result)
+        failed = isinstance(result, dict) and result.get("error") is True
+        if statements or (changes and not failed):
+            self.applied = True
+
+    def flush(self, code: str = ""):
+        """Send the buffered statements, followed by the code"""
+        if not self.statements and not self.started:
+            return
+        token = _transaction.set(self)
+        try:
+            raise_for_error(eval_script(code))
+        finally:
+            _transaction.reset(token)
+
+
+class BulkMode(object):
+    """Runs the enter statements when entered and the exit statements when left, even on failure,
+    to put the application in a state suited to heavy jobs. Requests sent within it are flagged as
+    bulk mode requests in profilers. Bulk modes entered within a bulk mode are part of it.
+    """
+
+    def __init__(self, enter: str = "", exit: str = ""):
+        self.enter = enter
+        self.exit = exit
+        self._token = None
+
+    def __enter__(self):
+        outer = _bulk_mode.get()
+        if outer is not None:
+            return outer
+        raise_for_error(eval_script(self.enter))
+        self._token = _bulk_mode.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is None:
+            return
+        _bulk_mode.reset(self._token)
+        self._token = None
+        result = eval_script(self.exit)
+        if exc_type is None:
+            raise_for_error(result)
+
+
+def in_bulk_mode() -> bool:
+    """True within a bulk mode, where functions which would open a dialog raise instead"""
+    return _bulk_mode.get() is not None
+
+
+def send_request(payload: dict) -> str:
+    """Send the payload to the panel through the current transport and return the raw response"""
+    start = time.perf_counter()
+    data, server_time = get_transport().send(payload)
+    client_time = time.perf_counter() - start
+    if _recorders:
+        for recorder in list(_recorders):
+            recorder.write(payload, data, client_time, server_time)
+    if _profilers:
+        _profile_request(
+            start,
+            client_time,
+            server_time,
+            len(payload.get("to_eval", "")) or len(json.dumps(payload)),
+            len(data),
+        )
+    return data
+
+
+def stream_request(payload: dict):
+    """Send the payload like send_request(), yielding the lines of the response as they arrive.
+    Transports which can not stream responses send them whole, and they are split into lines.
+    """
+    start = time.perf_counter()
+    transport = get_transport()
+    if hasattr(transport, "stream"):
+        lines, server_time = transport.stream(payload)
+    else:
+        data, server_time = transport.send(payload)
+        # not splitlines(), JSON texts may hold unescaped line separators
+        lines = data.split("\n")
+    received = []  # kept for the recorders only
+    size = 0
+    for line in lines:
+        size += len(line) + 1
+        if _recorders:
+            received.append(line)
+        yield line
+    # the client time includes the time the caller spent on the lines, which arrive as it reads them
+    client_time = time.perf_counter() - start
+    if _recorders:
+        data = "\n".join(received)
+        for recorder in list(_recorders):
+            recorder.write(payload, data, client_time, server_time)
+    if _profilers:
+        _profile_request(
+            start,
+            client_time,
+            server_time,
+            len(payload.get("to_eval", "")),
+            max(size - 1, 0),
+        )
+
+
+# TRANSPORTS
+
+
+class HttpTransport(object):
+    """Sends requests to a pydobe panel over HTTP, checking the connection on the first request
+
+    A panel running on this machine writes results of at least result_file_threshold characters
+    to a temporary file, which is read without going through the HTTP response. None or 0 disables it.
+
+    timeout is the number of seconds to wait for the panel to connect or send data, or a (connect, read)
+    tuple, after which requests.Timeout is raised. None waits forever, as a render can take hours.
+    """
+
+    def __init__(
+        self,
+        host: str = None,
+        port: int = None,
+        result_file_threshold: int = RESULT_FILE_THRESHOLD,
+        timeout: float or tuple = None,
+    ):
+        self.host = host or HOST
+        self.port = port or PORT
+        self.timeout = timeout
+        self.url = f"http://{self.host}:{self.port}"
+        self._session = None
+        local = self.host in ("127.0.0.1", "localhost", "::1")
+        self.result_file_threshold = result_file_threshold if local else None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.url})"
+
+    @property
+    def session(self):
+        """The requests session, reusing the connection to the panel between requests"""
+        if self._session is None:
+            import requests
+
+            is_port_open(self.host, self.port)
+            self._session = requests.Session()
+        return self._session
+
+    def send(self, payload: dict) -> tuple:
+        """Return the response text and the evaluation time reported by the panel in seconds"""
+        if self.result_file_threshold:
+            payload = dict(payload, result_file_threshold=self.result_file_threshold)
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        server_time = response.headers.get(SERVER_TIME_HEADER)
+        result_file = response.headers.get(RESULT_FILE_HEADER)
+        text = read_result_file(result_file) if result_file else response.text
+        return text, float(server_time) / 1000 if server_time else None
+
+    def stream(self, payload: dict) -> tuple:
+        """Return an iterator over the lines of the response as they arrive, and the evaluation time"""
+        response = self.session.post(
+            self.url, json=dict(payload, stream=True), stream=True, timeout=self.timeout
+        )
+        server_time = response.headers.get(SERVER_TIME_HEADER)
+
+        def lines():
+            with response:
+                for line in response.iter_lines(chunk_size=STREAM_CHUNK_SIZE):
+                    yield line.decode("utf-8")
+
+        return lines(), float(server_time) / 1000 if server_time else None
+
+    def stats(self) -> dict:
+        return self.session.get(f"{self.url}/stats", timeout=self.timeout).json()
+
+    def configure(self, verbose: bool = None) -> dict:
+        params = {}
+        if verbose is not None:
+            params["verbose"] = int(verbose)
+        return self.session.get(
+            f"{self.url}/config", params=params, timeout=self.timeout
+        ).json()
+
+    def events(self) -> EventStream:
+        """Open the stream of events pushed by the panel, on a connection of its own"""
+        import http.client
+
+        is_port_open(self.host, self.port)
+        connection = http.client.HTTPConnection(self.host, self.port)
+        connection.request("GET", "/events", headers={"Accept": "text/event-stream"})
+        stream_socket = connection.sock
+        response = connection.getresponse()
+        lines = (
+            line.decode("utf-8").rstrip("\r\n") for line in iter(response.readline, b"")
+        )
+
+        def close():
+            # shutting the socket down wakes up the thread blocked reading it
+            with contextlib.suppress(OSError):
+                stream_socket.shutdown(socket.SHUT_RDWR)
+            response.close()
+            connection.close()
+
+        return EventStream(read_server_sent_events(lines), close)
+
+
+def read_result_file(path: str) -> str:
+    """Text of a result the panel wrote to a temporary file, which is deleted once read
+
+    The file is memory mapped and decoded straight from the mapping, so the result is only held once.
+    """
+    try:
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            return str(mapped, "utf-8")
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+class ReplayTransport(object):
+    """Serves responses from a log written by record() instead of talking to After Effects
+
+    In strict mode requests must come in the recorded order and match the recording exactly,
+    otherwise responses are looked up by request and served in the order they were recorded.
+    With realtime, each response is delayed by the time the request originally took.
+    """
+
+    def __init__(self, path: str, strict: bool = True, realtime: bool = False):
+        self.path = path
+        self.strict = strict
+        self.realtime = realtime
+        self.entries = read_recording(path)
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._by_request = {}
+        for entry in self.entries:
+            self._by_request.setdefault(_request_key(entry[0]), []).append(entry)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path})"
 
+    @property
+    def remaining(self) -> int:
+        """Number of recorded requests not replayed yet"""
+        return len(self.entries) - self.requests_served
 
-def convert_to_list(line):
-    data_list = []
-    count_line = f"{line[:-1]}.length;"
-    count = eval_script_returning_object(count_line)
-    for index in range(count):
-        value_line = f"{line[:-1]}[{index}];"
-        value = eval_script_returning_object(value_line)
-        data_list.append(value)
-    return data_list
+    def send(self, payload: dict) -> tuple:
+        with self._lock:
+            if self.strict:
+                if self.requests_served >= len(self.entries):
+                    raise ReplayError(
+                        f"Request {self.requests_served + 1} was not recorded in {self.path}"
+                    )
+                entry = self.entries[self.requests_served]
+                if entry[0] != payload:
+                    raise ReplayError(
+                        f"Request {self.requests_served + 1} does not match {self.path}\n"
+                        f"recorded: {entry[0]}\nreceived: {payload}"
+                    )
+            else:
+                responses = self._by_request.get(_request_key(payload))
+                if not responses:
+                    raise ReplayError(
+                        f"Request was not recorded in {self.path}: {payload}"
+                    )
+                entry = responses.pop(0) if len(responses) > 1 else responses[0]
+            self.requests_served += 1
+        _, data, client_time, server_time = entry
+        if self.realtime:
+            time.sleep(client_time)
+        return data, server_time
+
+
+class ReplayError(LookupError):
+    """A request could not be served from a recording"""
+
+
+_transport = None  # transport used by default, created on first use
+_bound_transport = contextvars.ContextVar("pydobe_transport", default=None)
+
+
+def get_transport():
+    """The transport requests are sent through"""
+    global _transport
+    transport = _bound_transport.get()
+    if transport is not None:
+        return transport
+    if _transport is None:
+        _transport = HttpTransport()
+    return _transport
+
+
+def set_transport(transport):
+    """Change the transport used by default, None to go back to the After Effects panel"""
+    global _transport
+    _transport = transport
+
+
+@contextlib.contextmanager
+def use_transport(transport):
+    """Send the requests made within the context (in the current thread) through the given transport"""
+    token = _bound_transport.set(transport)
+    try:
+        yield transport
+    finally:
+        _bound_transport.reset(token)
+
+
+def panel_stats() -> dict:
+    """Rolling counters kept by the panel: requests, errors, requests per second, latency percentiles
+    (latency_ms), bytes in and out and the number of objects kept alive for pydobe (handles).
+    Raises TypeError if the current transport keeps none"""
+    transport = get_transport()
+    if not hasattr(transport, "stats"):
+        raise TypeError(f"{transport!r} does not keep statistics")
+    return transport.stats()
+
+
+def set_panel_verbose(verbose: bool):
+    """Print every script and result in the panel console, off by default as it slows down large requests.
+    Raises TypeError if the current transport can not be configured"""
+    transport = get_transport()
+    if not hasattr(transport, "configure"):
+        raise TypeError(f"{transport!r} can not be configured")
+    transport.configure(verbose=verbose)
+
+
+# EVENTS
+
+
+class EventStream(object):
+    """Iterates over the events pushed by the panel until it is closed"""
+
+    def __init__(self, events, close=None):
+        self._events = events
+        self._close = close
+        self.closed = False
+
+    def __iter__(self):
+        try:
+            for event in self._events:
+                if self.closed:
+                    return
+                yield event
+        except Exception:
+            if not self.closed:  # reading a closed connection fails
+                raise
+
+    def close(self):
+        self.closed = True
+        if self._close:
+            self._close()
+
+
+def read_server_sent_events(lines):
+    """Decode server-sent events, each data line being JSON, to dictionaries with a "type" key"""
+    event_type = "message"
+    data = []
+    for line in lines:
+        if not line:
+            if data:
+                event = json.loads("\n".join(data))
+                event["type"] = event_type
+                yield event
+            event_type = "message"
+            data = []
+        elif line.startswith(":"):
+            continue
+        elif line.startswith("event:"):
+            event_type = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:") :].strip())
+
+
+class Subscription(object):
+    """Calls a function with the events pushed by the panel, from a background thread, until closed.
+    Raises TypeError if the transport does not push events"""
+
+    def __init__(self, callback, types: tuple = None, transport=None):
+        transport = transport or get_transport()
+        if not hasattr(transport, "events"):
+            raise TypeError(f"{transport!r} does not push events")
+        self.callback = callback
+        self.types = types
+        self.stream = transport.events()
+        self._thread = threading.Thread(
+            target=self._run, name="pydobe-events", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self):
+        for event in self.stream:
+            if self.types is None or event["type"] in self.types:
+                self.callback(event)
+
+    def close(self):
+        self.stream.close()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=1)
+
+
+def subscribe(callback, types: tuple = ("render",)) -> Subscription:
+    """Call the function with every event of the given types pushed by the panel, instead of polling it.
+
+    Render queue items report "render" events while the queue renders, dictionaries with:
+    event (started, done, failed, stopped or status), index, comp, status, elapsed (seconds),
+    done and total (the progress of the render, in items rendered out of items to render)
+    """
+    return Subscription(callback, types)
+
+
+async def events(types: tuple = ("render",)):
+    """Asynchronous iterator over the events pushed by the panel, see subscribe()"""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    subscription = subscribe(
+        lambda event: loop.call_soon_threadsafe(queue.put_nowait, event), types
+    )
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        subscription.close()
+
+
+# RECORDING
+
+
+class Recorder(object):
+    """Writes every request and its response to a log file, one JSON array per line.
+    Paths ending in .gz are compressed."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        self._file = _open_recording(self.path, "w")
+        self._file.write(json.dumps({"pydobe_recording": RECORDING_VERSION}) + "\n")
+        _recorders.append(self)
+
+    def stop(self):
+        if self in _recorders:
+            _recorders.remove(self)
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def write(self, payload: dict, data: str, client_time: float, server_time: float):
+        line = json.dumps([payload, data, round(client_time, 6), server_time])
+        with self._lock:
+            if self._file:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+
+def record(path: str) -> Recorder:
+    """Record the requests sent to the panel, use it as a context manager"""
+    return Recorder(path)
+
+
+def read_recording(path: str) -> list:
+    """Read the [payload, response, client time, server time] entries of a recording"""
+    with _open_recording(path, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("pydobe_recording") != RECORDING_VERSION:
+            raise ValueError(f"{path} is not a pydobe recording")
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _open_recording(path: str, mode: str):
+    if path.endswith(".gz"):
+        import gzip
+
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _request_key(payload: dict) -> str:
+    return json.dumps(payload, sort_keys=True)
+
+
+_json_encode = json.JSONEncoder(
+    separators=(",", ":")
+).encode  # NaN and Infinity are valid ExtendScript too
+
+
+def _format_array(obj) -> str:
+    try:
+        # arrays of plain values are encoded by the C encoder of json, which matters for large arrays
+        return _json_encode(obj)
+    except TypeError:
+        return f"[{','.join([format_to_extend(item) for item in obj])}]"
+
+
+def _format_object(obj: dict) -> str:
+    try:
+        return _json_encode(obj)
+    except TypeError:
+        return f"{{{','.join([f'{_json_encode(str(key))}:{format_to_extend(value)}' for key, value in obj.items()])}}}"
+
+
+_FORMATTERS = {
+    type(None): lambda obj: "null",
+    bool: lambda obj: "true" if obj else "false",
+    int: int.__repr__,
+    float: _json_encode,
+    str: _json_encode,
+    list: _format_array,
+    tuple: _format_array,
+    dict: _format_object,
+}
+
+
+class Code(object):
+    """ExtendScript code which format_to_extend() leaves as it is, e.g. the address of an object"""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.code!r})"
+
+
+def format_to_extend(obj) -> str:
+    """Format a Python value as an ExtendScript literal. Handles pydobe objects, None, booleans, numbers,
+    strings (escaped, so any text is safe to send), paths, lists, tuples, dicts and arrays with a tolist()
+    method such as NumPy arrays"""
+    formatter = _FORMATTERS.get(type(obj))
+    if formatter is not None:
+        return formatter(obj)
+    if isinstance(obj, PydobeBaseObject):
+        return obj._reference()
+    if isinstance(obj, Code):
+        return obj.code
+    if isinstance(obj, (int, float, str)):  # subclasses such as enums
+        return _json_encode(obj)
+    if isinstance(obj, os.PathLike):
+        return _json_encode(os.fspath(obj))
+    if isinstance(obj, (list, tuple)):
+        return _format_array(obj)
+    if isinstance(obj, dict):
+        return _format_object(obj)
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars, without importing NumPy
+        return format_to_extend(obj.tolist())
+    raise TypeError(f"{type(obj).__name__} values can not be formatted to ExtendScript")
 
 
 def create_python_object(object_type):
@@ -156,3 +1159,318 @@ def get_all_subclasses(cls):
         all_subclasses.append(subclass)
         all_subclasses.extend(get_all_subclasses(subclass))
     return all_subclasses
+
+
+# PROFILING
+
+ProfiledRequest = namedtuple(
+    "ProfiledRequest",
+    [
+        "start",  # time.perf_counter() when the request was sent
+        "client_duration",  # seconds spent waiting for the panel
+        "server_duration",  # seconds spent evaluating the script, None if the panel does not report it
+        "script_size",  # characters sent
+        "response_size",  # characters received
+        "call_site",  # pydobe property or method that sent the request, e.g. "CompItem.width"
+        "entry_point",  # outermost pydobe call from user code, e.g. "Project.item_by_name"
+        "location",  # "file:line" of the user code that triggered the request
+        "bulk_mode",  # True if the request was sent in bulk mode
+    ],
+)
+
+
+class Profiler(object):
+    """Records every request sent to the panel and attributes it to the code that caused it
+
+    Use it as a context manager, or set the PYDOBE_PROFILE environment variable to profile the
+    whole process (to a path ending in .json or .csv to export the results, anything else to print them)
+    """
+
+    def __init__(self, n_plus_one_threshold: int = 10):
+        self.requests = []
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.started = None
+        self.stopped = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.stopped = None
+        _profilers.append(self)
+
+    def stop(self):
+        if self in _profilers:
+            _profilers.remove(self)
+            self.stopped = time.perf_counter()
+
+    def add(self, request: ProfiledRequest):
+        with self._lock:
+            self.requests.append(request)
+
+    # REPORTS
+
+    @property
+    def wall_time(self) -> float:
+        """Seconds elapsed while profiling"""
+        if self.started is None:
+            return 0.0
+        return (self.stopped or time.perf_counter()) - self.started
+
+    def summary(self) -> dict:
+        """Totals for all of the recorded requests"""
+        requests = list(self.requests)
+        client_time = sum(request.client_duration for request in requests)
+        return {
+            "requests": len(requests),
+            "wall_time": self.wall_time,
+            "client_time": client_time,
+            "server_time": _sum_server_time(requests),
+            "python_time": max(self.wall_time - client_time, 0.0),
+            "script_bytes": sum(request.script_size for request in requests),
+            "response_bytes": sum(request.response_size for request in requests),
+        }
+
+    def top_call_sites(self, limit: int = 10, key: str = "call_site") -> list[dict]:
+        """The call sites that spent the most time waiting on the panel.
+        Group by 'entry_point' or 'location' instead with the key argument"""
+        groups = {}
+        for request in list(self.requests):
+            groups.setdefault(getattr(request, key), []).append(request)
+        sites = [
+            {
+                key: name,
+                "requests": len(requests),
+                "client_time": sum(request.client_duration for request in requests),
+                "server_time": _sum_server_time(requests),
+                "script_bytes": sum(request.script_size for request in requests),
+                "response_bytes": sum(request.response_size for request in requests),
+            }
+            for name, requests in groups.items()
+        ]
+        sites.sort(key=lambda site: site["client_time"], reverse=True)
+        return sites[:limit]
+
+    def n_plus_one(self, threshold: int = None) -> list[dict]:
+        """Call sites sending the same kind of request over and over from a single line of user code,
+        typically a property read inside a loop which could be fetched in bulk instead
+        """
+        threshold = threshold or self.n_plus_one_threshold
+        counts = {}
+        for request in list(self.requests):
+            pattern = (request.location, request.entry_point, request.call_site)
+            count, client_time = counts.get(pattern, (0, 0.0))
+            counts[pattern] = (count + 1, client_time + request.client_duration)
+        patterns = [
+            {
+                "location": location,
+                "entry_point": entry_point,
+                "call_site": call_site,
+                "requests": count,
+                "client_time": client_time,
+            }
+            for (location, entry_point, call_site), (
+                count,
+                client_time,
+            ) in counts.items()
+            if count >= threshold
+        ]
+        patterns.sort(key=lambda pattern: pattern["requests"], reverse=True)
+        return patterns
+
+    def bulk_mode(self) -> dict:
+        """Requests sent in bulk mode and an estimate of the time bulk mode saved, from the average time
+        the same call sites took outside bulk mode (None without requests from those call sites to compare)
+        """
+        durations = {}
+        for request in list(self.requests):
+            if not request.bulk_mode:
+                durations.setdefault(request.call_site, []).append(
+                    request.client_duration
+                )
+        bulk_requests = [
+            request for request in list(self.requests) if request.bulk_mode
+        ]
+        compared = [
+            request for request in bulk_requests if request.call_site in durations
+        ]
+        time_saved = None
+        if compared:
+            time_saved = sum(
+                sum(durations[request.call_site]) / len(durations[request.call_site])
+                - request.client_duration
+                for request in compared
+            )
+        return {
+            "requests": len(bulk_requests),
+            "client_time": sum(request.client_duration for request in bulk_requests),
+            "compared_requests": len(compared),
+            "time_saved": time_saved,
+        }
+
+    def report(self, limit: int = 10) -> dict:
+        return {
+            "summary": self.summary(),
+            "top_call_sites": self.top_call_sites(limit),
+            "top_entry_points": self.top_call_sites(limit, key="entry_point"),
+            "n_plus_one": self.n_plus_one(),
+            "bulk_mode": self.bulk_mode(),
+        }
+
+    def format_report(self, limit: int = 10) -> str:
+        """The report as readable text"""
+        report = self.report(limit)
+        summary = report["summary"]
+        lines = [
+            f"pydobe: {summary['requests']} requests in {summary['wall_time']:.3f}s "
+            f"({summary['client_time']:.3f}s waiting on the panel, "
+            f"{summary['script_bytes']} bytes sent, {summary['response_bytes']} bytes received)",
+            "Top call sites:",
+        ]
+        for site in report["top_call_sites"]:
+            lines.append(
+                f"  {site['call_site']}: {site['requests']} requests, {site['client_time']:.3f}s"
+            )
+        bulk_mode = report["bulk_mode"]
+        if bulk_mode["requests"]:
+            line = f"Bulk mode: {bulk_mode['requests']} requests, {bulk_mode['client_time']:.3f}s"
+            if bulk_mode["time_saved"] is not None:
+                line += f", about {bulk_mode['time_saved']:.3f}s saved over {bulk_mode['compared_requests']} comparable requests"
+            lines.append(line)
+        if report["n_plus_one"]:
+            lines.append("Repeated requests (N+1):")
+            for pattern in report["n_plus_one"]:
+                lines.append(
+                    f"  {pattern['location']} {pattern['call_site']} "
+                    f"(via {pattern['entry_point']}): {pattern['requests']} requests"
+                )
+        return "\n".join(lines)
+
+    # EXPORT
+
+    def to_json(self, path: str, limit: int = 10):
+        """Export the report and every recorded request to a JSON file"""
+        data = self.report(limit)
+        data["requests"] = [
+            dict(request._asdict(), start=request.start - self.started)
+            for request in self.requests
+        ]
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def to_csv(self, path: str):
+        """Export every recorded request to a CSV file, one row per request"""
+        import csv
+
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(ProfiledRequest._fields)
+            for request in self.requests:
+                writer.writerow(request._replace(start=request.start - self.started))
+
+    def export(self, path: str):
+        """Export to JSON or CSV depending on the extension of the path"""
+        if path.lower().endswith(".csv"):
+            self.to_csv(path)
+        else:
+            self.to_json(path)
+
+
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+_CORE_FILE = os.path.abspath(__file__)
+
+
+def _sum_server_time(requests):
+    durations = [request.server_duration for request in requests]
+    if not durations or None in durations:
+        return None
+    return sum(durations)
+
+
+def _find_call_site(frame) -> tuple:
+    """Walk up the stack to find the pydobe call site, the pydobe entry point and the user code location"""
+    call_site = None
+    entry_point = None
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.abspath(code.co_filename)
+        if not filename.startswith(_PACKAGE_DIRECTORY):
+            return call_site, entry_point, f"{code.co_filename}:{frame.f_lineno}"
+        name = code.co_name
+        is_private = name.startswith("_") and not name.startswith("__")
+        if not is_private:
+            if code.co_argcount and code.co_varnames[0] == "self":
+                site = f"{type(frame.f_locals['self']).__name__}.{name}"
+            elif filename != _CORE_FILE:
+                module = os.path.splitext(os.path.basename(filename))[0]
+                site = f"{module}.{name}"
+            else:
+                site = None
+            if site:
+                call_site = call_site or site
+                entry_point = site
+        frame = frame.f_back
+    return call_site, entry_point, None
+
+
+def _profile_request(
+    start: float,
+    client_duration: float,
+    server_duration: float,
+    script_size: int,
+    response_size: int,
+):
+    call_site, entry_point, location = _find_call_site(sys._getframe(2))
+    request = ProfiledRequest(
+        start,
+        client_duration,
+        server_duration,
+        script_size,
+        response_size,
+        call_site,
+        entry_point,
+        location,
+        _bulk_mode.get() is not None,
+    )
+    for profiler in list(_profilers):
+        profiler.add(request)
+
+
+def _record_from_environment():
+    """Record or replay the whole process with the PYDOBE_RECORD and PYDOBE_REPLAY environment variables"""
+    replay = os.environ.get("PYDOBE_REPLAY")
+    if replay:
+        set_transport(ReplayTransport(replay))
+    path = os.environ.get("PYDOBE_RECORD")
+    if path:
+        recorder = record(path)
+        recorder.start()
+        atexit.register(recorder.stop)
+
+
+def _profile_from_environment():
+    """Profile the whole process when the PYDOBE_PROFILE environment variable is set"""
+    target = os.environ.get("PYDOBE_PROFILE")
+    if not target:
+        return
+    profiler = Profiler()
+    profiler.start()
+
+    def write_report():
+        profiler.stop()
+        if target.lower().endswith((".json", ".csv")):
+            profiler.export(target)
+        else:
+            print(profiler.format_report(), file=sys.stderr)
+
+    atexit.register(write_report)
+
+
+_profile_from_environment()
+_record_from_environment()
@@ -0,0 +1,344 @@
+"""Find files and image sequences on disk, ready to be imported
+
+    from pydobe.scanner import scan
+
+    sequences = scan(["//storage/shots/sh010/plates", "//storage/shots/sh020/plates"])
+    for sequence in sequences:
+        print(sequence, sequence.missing)
+    result = project.import_files(sequences)
+    print(sequences.errors)  # directories which could not be listed
+
+Directories are listed in parallel with os.scandir, which matters on network storage where every
+listing is a round trip. Listings are cached by directory modification time, so scanning the same
+tree again only lists the directories which changed. Links to directories are not followed, so
+that links looping back can not make a scan run forever, and directories given several times
+are listed once.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# still image formats After Effects imports as sequences, numbered files of other formats are imported one by one
+SEQUENCE_EXTENSIONS = {
+    ".bmp",
+    ".cin",
+    ".dpx",
+    ".exr",
+    ".gif",
+    ".hdr",
+    ".iff",
+    ".jpeg",
+    ".jpg",
+    ".pic",
+    ".png",
+    ".psd",
+    ".rla",
+    ".rpf",
+    ".sgi",
+    ".tga",
+    ".tif",
+    ".tiff",
+}
+
+_listings = {}  # directory: (modification time, file names, subdirectories)
+_listings_lock = threading.Lock()
+
+
+class FileSequence(object):
+    """Numbered files sharing a prefix and an extension, or a single file
+
+    A single file has no frames, unless it is the only frame of a sequence. FileSequence objects
+    can be passed to Project.import_files(), which imports sequences as sequences.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str,
+        extension: str,
+        padding: int = 0,
+        frames: list[int] = None,
+    ):
+        self.directory = directory
+        self.prefix = prefix
+        self.extension = extension
+        self.padding = padding
+        self.frames = sorted(frames or [])
+
+    def __repr__(self):
+        if not self.frames:
+            return f"{type(self).__name__}({self.path!r})"
+        ranges = ", ".join(
+            str(start) if start == end else f"{start}-{end}"
+            for start, end in self.ranges
+        )
+        return f"{type(self).__name__}({os.path.join(self.directory, self.name)!r}, {ranges})"
+
+    def __len__(self):
+        return len(self.frames) or 1
+
+    def __fspath__(self):
+        return self.path
+
+    def __eq__(self, other):
+        return isinstance(other, FileSequence) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return (
+            self.directory,
+            self.prefix,
+            self.extension,
+            self.padding,
+            tuple(self.frames),
+        )
+
+    @property
+    def is_sequence(self) -> bool:
+        """True for more than one frame"""
+        return len(self.frames) > 1
+
+    @property
+    def name(self) -> str:
+        """File name with the frame number replaced by #, one per digit of padding"""
+        if not self.frames:
+            return f"{self.prefix}{self.extension}"
+        return f"{self.prefix}{'#' * self.padding}{self.extension}"
+
+    @property
+    def path(self) -> str:
+        """Path of the first frame, or of the file"""
+        if not self.frames:
+            return os.path.join(self.directory, f"{self.prefix}{self.extension}")
+        return self.frame_path(self.frames[0])
+
+    @property
+    def paths(self) -> list[str]:
+        """Paths of all the frames"""
+        if not self.frames:
+            return [self.path]
+        return [self.frame_path(frame) for frame in self.frames]
+
+    @property
+    def first(self) -> int:
+        return self.frames[0] if self.frames else None
+
+    @property
+    def last(self) -> int:
+        return self.frames[-1] if self.frames else None
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        """Consecutive frames as (first, last) tuples"""
+        ranges = []
+        for frame in self.frames:
+            if ranges and frame == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], frame)
+            else:
+                ranges.append((frame, frame))
+        return ranges
+
+    @property
+    def missing(self) -> list[int]:
+        """Frames missing between the first and the last one"""
+        present = set(self.frames)
+        return (
+            [
+                frame
+                for frame in range(self.first, self.last + 1)
+                if frame not in present
+            ]
+            if self.frames
+            else []
+        )
+
+    def frame_path(self, frame: int) -> str:
+        return os.path.join(
+            self.directory,
+            f"{self.prefix}{str(frame).zfill(self.padding)}{self.extension}",
+        )
+
+
+class ScanResult(list):
+    """Sequences and single files found by scan(), sorted by path, with the directories which could not be listed"""
+
+    def __init__(self, sequences=(), errors: dict = None):
+        super().__init__(sequences)
+        self.errors = errors or {}  # error message by directory
+
+
+def split_frame(file_name: str) -> tuple or None:
+    """Split a numbered file name into prefix, frame digits and extension, None if it is not numbered"""
+    stem, extension = os.path.splitext(file_name)
+    digits = len(stem) - len(stem.rstrip("0123456789"))
+    if not digits:
+        return None
+    return stem[:-digits], stem[-digits:], extension
+
+
+def group_sequences(
+    directory: str, file_names: list[str], min_frames: int = 2
+) -> list[FileSequence]:
+    """Group the files of a directory into sequences, files which are not part of one are returned on their own"""
+    groups = {}
+    singles = []
+    for file_name in file_names:
+        parts = split_frame(file_name)
+        if parts is None or parts[2].lower() not in SEQUENCE_EXTENSIONS:
+            singles.append(file_name)
+            continue
+        prefix, digits, extension = parts
+        # padded frames keep their number of digits, unpadded ones (1, 10, 100) are one sequence
+        padding = len(digits) if digits.startswith("0") else 0
+        groups.setdefault((prefix, extension), {}).setdefault(padding, []).append(
+            digits
+        )
+
+    result = []
+    for (prefix, extension), paddings in groups.items():
+        unpadded = paddings.pop(0, [])
+        for padding, digits_list in paddings.items():
+            # 1000 follows 0999, numbers as long as the padding belong to the padded sequence
+            digits_list += [digits for digits in unpadded if len(digits) >= padding]
+            unpadded = [digits for digits in unpadded if len(digits) < padding]
+            _add_group(
+                result,
+                singles,
+                directory,
+                prefix,
+                extension,
+                padding,
+                digits_list,
+                min_frames,
+            )
+        if unpadded:
+            padding = min(len(digits) for digits in unpadded)
+            _add_group(
+                result,
+                singles,
+                directory,
+                prefix,
+                extension,
+                padding,
+                unpadded,
+                min_frames,
+            )
+    result.extend(
+        FileSequence(directory, *os.path.splitext(file_name)) for file_name in singles
+    )
+    return sorted(result, key=lambda sequence: sequence.path)
+
+
+def _add_group(
+    result, singles, directory, prefix, extension, padding, digits_list, min_frames
+):
+    if len(digits_list) < min_frames:
+        singles.extend(f"{prefix}{digits}{extension}" for digits in digits_list)
+    else:
+        result.append(
+            FileSequence(
+                directory,
+                prefix,
+                extension,
+                padding,
+                [int(digits) for digits in digits_list],
+            )
+        )
+
+
+def list_directory(directory: str) -> tuple[list[str], list[str]]:
+    """File names and subdirectory paths of a directory, cached until its modification time changes"""
+    modification_time = os.stat(directory).st_mtime_ns
+    with _listings_lock:
+        cached = _listings.get(directory)
+    if cached and cached[0] == modification_time:
+        return cached[1], cached[2]
+    files = []
+    subdirectories = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.is_file():
+                files.append(entry.name)
+    with _listings_lock:
+        _listings[directory] = (modification_time, files, subdirectories)
+    return files, subdirectories
+
+
+def clear_cache():
+    """Forget the cached directory listings"""
+    with _listings_lock:
+        _listings.clear()
+
+
+def scan(
+    directories: list[str],
+    recursive: bool = True,
+    extensions: list[str] = None,
+    min_frames: int = 2,
+    workers: int = 16,
+) -> ScanResult:
+    """Sequences and single files found in the directories, sorted by path
+
+    Extensions such as [".exr", ".mov"] limit the files returned. Numbered files fewer than
+    min_frames are returned as single files. Hidden files and directories are skipped. Directories
+    which can not be listed are reported in the errors of the result rather than raised.
+    """
+    if isinstance(directories, (str, os.PathLike)):
+        directories = [directories]
+    extensions = {extension.lower() for extension in extensions} if extensions else None
+    result = ScanResult()
+    # real paths of the directories listed, given directories may overlap
+    visited = set()
+
+    def submit(directory):
+        real_path = os.path.realpath(directory)
+        if real_path in visited:
+            return []
+        visited.add(real_path)
+        return [executor.submit(_scan_directory, directory, extensions, min_frames)]
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="pydobe-scanner"
+    ) as executor:
+        pending = set()
+        for directory in directories:
+            pending.update(submit(os.path.abspath(os.fspath(directory))))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, sequences, subdirectories, error = future.result()
+                if error is not None:
+                    result.errors[directory] = error
+                    continue
+                result.extend(sequences)
+                if recursive:
+                    for subdirectory in subdirectories:
+                        pending.update(submit(subdirectory))
+    result.sort(key=lambda sequence: sequence.path)
+    return result
+
+
+def _scan_directory(directory, extensions, min_frames):
+    try:
+        files, subdirectories = list_directory(directory)
+    except OSError as error:
+        return directory, [], [], str(error)
+    if extensions is not None:
+        files = [
+            name for name in files if os.path.splitext(name)[1].lower() in extensions
+        ]
+    return (
+        directory,
+        group_sequences(directory, files, min_frames),
+        subdirectories,
+        None,
+    )